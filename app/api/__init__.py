@@ -1,13 +1,26 @@
 from fastapi import APIRouter
-from app.api.v1 import difficulties, user, quiz, categories, questions, answers
+from app.api.v1 import (
+    difficulties,
+    user,
+    quiz,
+    categories,
+    questions,
+    answers,
+    metrics,
+    cards,
+    rooms,
+)
 
 api_router = APIRouter()
 
 api_router.include_router(user.router, prefix="/users", tags=["users"])
 api_router.include_router(quiz.router, prefix="/quiz", tags=["quiz"])
+api_router.include_router(rooms.router, prefix="/quiz/rooms", tags=["quiz"])
 api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
 api_router.include_router(questions.router, prefix="/questions", tags=["questions"])
 api_router.include_router(
     difficulties.router, prefix="/difficilties", tags=["difficilties"]
 )
 api_router.include_router(answers.router, prefix="/answers", tags=["answers"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(cards.router, prefix="/cards", tags=["cards"])
@@ -1,10 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from sqlalchemy.ext.asyncio import AsyncSession
+from jose import JWTError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database import get_db
-from app.core.config import settings
+from app.database import get_db, get_session_factory
+from app.core.security import decode_access_token
 from app.repositories import RepositoryFactory
 from app.services.quiz_service import QuizService
 from app.services.user_service import UserService
@@ -13,11 +13,19 @@ from app.services.answer_service import AnswerService
 from app.services.question_service import QuestionService
 from app.services.user_response_service import UserResponseService
 from app.services.difficulty_service import DifficultyService
+from app.services.card_service import CardService
+from app.services.calibration_service import CalibrationService
+from app.services.provisioning_service import ProvisioningService
+from app.services.token_service import TokenService
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
-def get_repository_factory(db: AsyncSession = Depends(get_db)) -> RepositoryFactory:
+def get_repository_factory(
+    db: AsyncSession = Depends(get_db, scope="function"),
+) -> RepositoryFactory:
+    # Commit before the response is sent, so commit failures are reported.
     return RepositoryFactory(db)
 
 
@@ -63,10 +71,31 @@ def get_quiz_service(
     return QuizService(repo_factory)
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    user_service: UserService = Depends(get_user_service),
-):
+def get_card_service(
+    repo_factory: RepositoryFactory = Depends(get_repository_factory),
+) -> CardService:
+    return CardService(repo_factory)
+
+
+def get_calibration_service(
+    repo_factory: RepositoryFactory = Depends(get_repository_factory),
+) -> CalibrationService:
+    return CalibrationService(repo_factory)
+
+
+def get_provisioning_service(
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> ProvisioningService:
+    return ProvisioningService(session_factory)
+
+
+def get_token_service(
+    repo_factory: RepositoryFactory = Depends(get_repository_factory),
+) -> TokenService:
+    return TokenService(repo_factory)
+
+
+async def _resolve_user(token: str, user_service: UserService):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -74,22 +103,51 @@ async def get_current_user(
     )
 
     try:
-        token = credentials.credentials
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_access_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
 
-    user = await user_service.get_user_by_username(username)
+    user = await user_service.get_principal(username)
     if user is None:
         raise credentials_exception
     return user
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_service: UserService = Depends(get_user_service),
+):
+    return await _resolve_user(credentials.credentials, user_service)
+
+
+async def get_optional_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(optional_security),
+    user_service: UserService = Depends(get_user_service),
+):
+    """The authenticated user, or None for anonymous requests."""
+    if credentials is None:
+        return None
+    user = await _resolve_user(credentials.credentials, user_service)
+    return user if user.is_active else None
+
+
+async def authenticate_token(
+    token: str, session_factory: async_sessionmaker[AsyncSession]
+):
+    """Resolve an active user from a token in a session of its own.
+
+    For long-lived connections that must not hold a request session.
+    """
+    async with session_factory() as session:
+        user = await _resolve_user(token, UserService(RepositoryFactory(session)))
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return user
+
+
 async def get_current_active_user(current_user=Depends(get_current_user)):
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
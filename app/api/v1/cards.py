@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.api.dependencies import get_card_service, get_current_active_user
+from app.models.user import User
+from app.schemas.cards import (
+    CardImportResult,
+    CardResponse,
+    CardReview,
+    CardReviewResult,
+)
+from app.services.card_service import CardService
+from app.shared.exceptions.questions import QuestionNotFoundError
+
+router = APIRouter()
+
+
+@router.get("/due", response_model=list[CardResponse])
+async def get_due_cards(
+    limit: int = Query(default=10, ge=1, le=100),
+    service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user),
+):
+    """Get the cards that are due for review, most overdue first."""
+    return await service.get_due_cards(current_user.id, limit)
+
+
+@router.post("/review", response_model=CardReviewResult)
+async def review_card(
+    card_review: CardReview,
+    service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user),
+):
+    """Answer a card and schedule its next review.
+
+    Questions that are not cards yet become cards on their first review.
+    """
+    result = await service.review(current_user.id, card_review)
+    if result is None:
+        raise QuestionNotFoundError(card_review.question_id)
+    return result
+
+
+@router.post("/import", response_model=CardImportResult)
+async def import_cards(
+    service: CardService = Depends(get_card_service),
+    current_user: User = Depends(get_current_active_user),
+):
+    """Create cards for the questions answered in quizzes."""
+    return {"imported": await service.import_history(current_user.id)}
@@ -0,0 +1,48 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_current_admin_user
+from app.core.password_hasher import password_hasher
+from app.core.rate_limit import login_throttle
+from app.core.security import revoked_tokens, verified_tokens
+from app.indexes.answer_keys import answer_key_index
+from app.indexes.leaderboard import leaderboard
+from app.indexes.questions import question_index
+from app.indexes.seen_questions import seen_questions
+from app.repositories.user_repository import principals
+from app.repositories.user_response_repository import response_buffer
+from app.services.quiz_rooms import quiz_rooms
+from app.services.quiz_service import quiz_sessions, seeded_quizzes
+from app.services.quiz_stream import quiz_streams
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_metrics(
+    current_user=Depends(get_current_admin_user),
+) -> dict[str, Any]:
+    """Report size, memory use and hit rates of the in-process caches.
+
+    The response buffer reports its batch sizes and flush latency; the
+    password hasher its queue depth, rejections and bcrypt latency.
+
+    Requires admin privileges.
+    """
+    return {
+        "question_index": question_index.stats(),
+        "answer_key_index": answer_key_index.stats(),
+        "leaderboard": leaderboard.stats(),
+        "verified_tokens": verified_tokens.stats(),
+        "revoked_tokens": revoked_tokens.stats(),
+        "principals": principals.stats(),
+        "quiz_sessions": quiz_sessions.stats(),
+        "seeded_quizzes": seeded_quizzes.stats(),
+        "seen_questions": seen_questions.stats(),
+        "quiz_streams": quiz_streams.stats(),
+        "quiz_rooms": quiz_rooms.stats(),
+        "response_buffer": response_buffer.stats(),
+        "password_hasher": password_hasher.stats(),
+        "login_throttle": login_throttle.stats(),
+    }
@@ -4,14 +4,17 @@ from pydantic import ValidationError
 from app.schemas.questions import (
     QuestionCreate,
     QuestionResponse,
+    QuestionStatsResponse,
     QuestionUpdate,
     QuestionsListResponse,
 )
 from app.api.dependencies import (
     get_current_active_user,
+    get_calibration_service,
     get_current_admin_user,
     get_question_service,
 )
+from app.services.calibration_service import CalibrationService
 from app.services.question_service import QuestionService
 from app.models.user import User
 from app.middleware.logger import logger
@@ -84,12 +87,10 @@ async def read_questions(
         le=1000,
         description="Maximum number of questions to return",
     ),
-    category: int | None = Query(
-        default=None, description="Filter by question category"
-    ),
-    difficulty: DifficultyLevel | None = Query(
-        default=None, description="Filter by question difficulty"
-    ),
+    category: int
+    | None = Query(default=None, description="Filter by question category"),
+    difficulty: DifficultyLevel
+    | None = Query(default=None, description="Filter by question difficulty"),
     service: QuestionService = Depends(get_question_service),
     # current_user: User = Depends(get_current_active_user),
 ):
@@ -157,6 +158,37 @@ async def read_question(
         )
 
 
+@router.get(
+    "/{question_id}/stats",
+    response_model=QuestionStatsResponse,
+    responses={
+        200: {"description": "Question statistics retrieved successfully"},
+        401: {"description": "Unauthorized"},
+        403: {"description": "Forbidden - Admin access required"},
+        404: {"description": "Question not calibrated yet"},
+    },
+)
+async def read_question_stats(
+    question_id: int = Path(..., ge=1, description="Question ID"),
+    service: CalibrationService = Depends(get_calibration_service),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Measured difficulty of a question from the last calibration run.
+
+    `p_value` is the share of correct answers, `discrimination` the
+    point-biserial correlation with the players' other answers and
+    `irt_difficulty` a Rasch difficulty in logits. The last two are null
+    until enough players have answered.
+
+    Requires admin privileges.
+    """
+    stats = await service.get_question_stats(question_id)
+    if stats is None:
+        raise QuestionNotFoundError(question_id)
+    return stats
+
+
 @router.put(
     "/{question_id}",
     response_model=QuestionResponse,
@@ -1,14 +1,32 @@
-from fastapi import APIRouter, Depends
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    WebSocket,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.api.dependencies import get_quiz_service
+from app.database import get_session_factory
+from app.models.quiz import DifficultyLevel
 from app.schemas.quiz import (
     QuizRequest,
     QuizSubmit,
     QuizResponse,
 )
-from app.api.dependencies import get_current_active_user, get_current_admin_user
+from app.api.dependencies import (
+    authenticate_token,
+    get_current_active_user,
+    get_current_admin_user,
+    get_optional_current_user,
+)
 from app.models.user import User
 from app.services.quiz_service import QuizService
+from app.services.quiz_stream import QuizStream, quiz_streams
 
 router = APIRouter()
 
@@ -16,12 +34,33 @@ router = APIRouter()
 @router.post("/generate")
 async def generate_quiz(
     quiz_request: QuizRequest,
+    response: Response,
     service: QuizService = Depends(get_quiz_service),
     # TODO: tmp comment this line
     # current_user: User = Depends(get_current_active_user),
+    current_user: User | None = Depends(get_optional_current_user),
+    if_none_match: str | None = Header(default=None),
 ):
-    questions = await service.generate_quiz(quiz_request)
-    return questions
+    """Generate a quiz.
+
+    The quiz session ID is returned in the `X-Quiz-Session-Id` header and
+    should be sent back as `session_id` on submit. Authenticated players can
+    ask for questions they have not answered yet with `exclude_seen`.
+
+    Seeded quizzes carry an `ETag`; a matching `If-None-Match` gets a 304
+    with a fresh session ID.
+    """
+    quiz = await service.generate_quiz(
+        quiz_request, user_id=current_user.id if current_user else None
+    )
+    response.headers["X-Quiz-Session-Id"] = quiz.session_id
+    if quiz.etag:
+        response.headers["ETag"] = quiz.etag
+        if if_none_match == quiz.etag:
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=response.headers
+            )
+    return quiz.questions
 
 
 @router.post("/submit", response_model=QuizResponse)
@@ -32,3 +71,42 @@ async def submit_quiz(
 ):
     result = await service.submit_quiz(current_user.id, quiz_submit)
     return result
+
+
+@router.websocket("/ws")
+async def stream_quiz(
+    websocket: WebSocket,
+    token: str = Query(...),
+    category_id: int | None = None,
+    difficulty: DifficultyLevel | None = None,
+    num_questions: int = Query(default=10, ge=1, le=100),
+    exclude_seen: bool = False,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+):
+    """Play a quiz one question at a time.
+
+    The server sends `question` messages, and each answer (`{"answer_id":
+    ...}`) is graded right away with a `result` message. A `summary` is sent
+    once all questions are answered. Browsers cannot set headers on a
+    WebSocket, so the bearer token is passed as the `token` query parameter.
+    """
+    try:
+        user = await authenticate_token(token, session_factory)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    if not quiz_streams.try_acquire():
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+    try:
+        await websocket.accept()
+        quiz_request = QuizRequest(
+            category_id=category_id,
+            difficulty=difficulty,
+            num_questions=num_questions,
+            exclude_seen=exclude_seen,
+        )
+        await QuizStream(websocket, session_factory, user.id, quiz_request).run()
+    finally:
+        quiz_streams.release()
@@ -0,0 +1,85 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.dependencies import (
+    authenticate_token,
+    get_current_active_user,
+    get_quiz_service,
+)
+from app.database import get_session_factory
+from app.models.user import User
+from app.schemas.quiz import QuizRequest
+from app.services.quiz_rooms import quiz_rooms, serve_player
+from app.services.quiz_service import QuizService
+from app.shared.exceptions.rooms import RoomNotFoundError, RoomNotHostError
+
+router = APIRouter()
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_room(
+    quiz_request: QuizRequest,
+    service: QuizService = Depends(get_quiz_service),
+    current_user: User = Depends(get_current_active_user),
+) -> dict[str, Any]:
+    """Open a live room; the quiz is generated once for all its players."""
+    quiz = await service.generate_quiz(quiz_request)
+    room = quiz_rooms.create(current_user.id, quiz)
+    return room.snapshot()
+
+
+@router.get("/{code}")
+async def get_room(code: str) -> dict[str, Any]:
+    """The room's state and current standings."""
+    room = quiz_rooms.get(code)
+    if room is None:
+        raise RoomNotFoundError(code)
+    return room.snapshot()
+
+
+@router.post("/{code}/start")
+async def start_room(
+    code: str,
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+    current_user: User = Depends(get_current_active_user),
+) -> dict[str, Any]:
+    """Start sending questions to the connected players. Host only."""
+    room = quiz_rooms.get(code)
+    if room is None:
+        raise RoomNotFoundError(code)
+    if room.host_id != current_user.id:
+        raise RoomNotHostError(code)
+    room.start(session_factory)
+    return room.snapshot()
+
+
+@router.websocket("/{code}/ws")
+async def join_room(
+    websocket: WebSocket,
+    code: str,
+    token: str = Query(...),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+):
+    """Play in a room.
+
+    Players receive `question`, `reveal` and `finished` broadcasts and answer
+    with `{"answer_id": ...}` while a question is open.
+    """
+    try:
+        user = await authenticate_token(token, session_factory)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    room = quiz_rooms.get(code)
+    if room is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    try:
+        await serve_player(websocket, room, user.id, user.username)
+    except HTTPException as err:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason=err.detail)
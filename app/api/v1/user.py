@@ -1,16 +1,39 @@
 from datetime import timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordRequestForm
-
-from app.schemas.user import UserCreate, UserResponse, Token, UserUpdate
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, OAuth2PasswordRequestForm
+from jose import JWTError
+
+from app.models.quiz import DifficultyLevel, LeaderboardPeriod
+from app.schemas.user import (
+    UserCreate,
+    UserResponse,
+    Token,
+    UserStatusUpdate,
+    UserUpdate,
+)
 from app.core.security import create_access_token, verify_password
-from app.api.dependencies import get_current_active_user, get_current_admin_user
 from app.core.config import settings
 from app.api.dependencies import (
     get_current_active_user,
+    get_current_admin_user,
+    get_provisioning_service,
+    get_token_service,
+    get_user_response_service,
     get_user_service,
+    security,
+)
+from app.core.pagination import InvalidCursorError
+from app.core.rate_limit import login_throttle
+from app.schemas.user_responses import ResponseHistoryPage
+from app.services.provisioning_service import (
+    ProvisioningService,
+    RowFormat,
+    parse_rows,
+    read_lines,
 )
+from app.services.token_service import TokenService
+from app.services.user_response_service import UserResponseService
 from app.services.user_service import UserService
 
 router = APIRouter()
@@ -30,9 +53,20 @@ async def register(
 
 @router.post("/login", response_model=Token)
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     service: UserService = Depends(get_user_service),
 ):
+    retry_after = login_throttle.acquire(
+        form_data.username, request.client.host if request.client else None
+    )
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(retry_after)},
+        )
+
     user = await service.authenticate_user(
         username=form_data.username, password=form_data.password
     )
@@ -52,6 +86,50 @@ async def login(
     return {"access_token": access_token, "token_type": "bearer"}
 
 
+@router.post("/bulk")
+async def provision_users(
+    request: Request,
+    service: ProvisioningService = Depends(get_provisioning_service),
+    current_user=Depends(get_current_admin_user),
+):
+    """Create users from a `text/csv` or `application/x-ndjson` body.
+
+    CSV needs a `username,email,password` header; NDJSON one object per
+    line with those keys. Rows are handled independently: the response
+    reports the new `id` or an `error` for every `line`.
+
+    Requires admin privileges.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    row_formats: dict[str, RowFormat] = {
+        "text/csv": "csv",
+        "application/x-ndjson": "ndjson",
+    }
+    if content_type not in row_formats:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson",
+        )
+    rows = parse_rows(read_lines(request.stream()), row_formats[content_type])
+    return await service.provision(rows, settings.PROVISIONING_BATCH_SIZE)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    service: TokenService = Depends(get_token_service),
+):
+    """Revoke the bearer token of this request until it expires."""
+    try:
+        await service.revoke(credentials.credentials)
+    except JWTError:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 @router.put("/me", response_model=UserResponse)
 async def update_user_me(
     user_in: UserUpdate,
@@ -64,14 +142,78 @@ async def update_user_me(
     return user
 
 
+@router.put("/{user_id}/status", response_model=UserResponse)
+async def set_user_status(
+    user_id: int,
+    status_in: UserStatusUpdate,
+    service: UserService = Depends(get_user_service),
+    current_user=Depends(get_current_admin_user),
+):
+    """Activate or deactivate a user.
+
+    Takes effect at the user's next request to this worker.
+
+    Requires admin privileges.
+    """
+    user = await service.set_user_active(user_id, status_in.is_active)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
+
 @router.get("/leaderboard")
 async def get_leaderboard(
-    limit: int = 10, service: UserService = Depends(get_user_service)
+    limit: int = 10,
+    period: LeaderboardPeriod | None = None,
+    category_id: int | None = None,
+    difficulty: DifficultyLevel | None = None,
+    service: UserService = Depends(get_user_service),
 ):
-    leaderboard = await service.get_leaderboard(limit)
+    """All-time leaderboard, or a narrower one.
+
+    `period` ranks by score in the current UTC day, week or month.
+    `category_id` and/or `difficulty` rank by correct answers within them.
+    """
+    try:
+        leaderboard = await service.get_leaderboard(
+            limit, period, category_id, difficulty
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return leaderboard
 
 
+@router.get("/leaderboard/me")
+async def get_my_leaderboard_position(
+    radius: int = Query(default=5, ge=0, le=50),
+    service: UserService = Depends(get_user_service),
+    current_user=Depends(get_current_active_user),
+):
+    """The current user's rank and percentile with `radius` players either side.
+
+    Ties on `total_score` are ordered by user ID. `rank` is null until the
+    user has played a game.
+    """
+    return await service.get_leaderboard_position(current_user.id, radius)
+
+
+@router.get("/responses", response_model=ResponseHistoryPage)
+async def get_response_history(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+    service: UserResponseService = Depends(get_user_response_service),
+    current_user=Depends(get_current_active_user),
+):
+    """The current user's answers, newest first.
+
+    Pass `next_cursor` from a page as `cursor` to get the next one.
+    """
+    try:
+        return await service.get_history(current_user.id, limit, cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/stats")
 async def get_user_stats(
     service: UserService = Depends(get_user_service),
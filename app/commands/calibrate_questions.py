@@ -0,0 +1,52 @@
+"""Measure question difficulty from every recorded response.
+
+Writes p-values, discrimination and optionally Rasch difficulties to
+`question_stats`, served at GET /questions/{id}/stats. Run from the project
+root:
+
+    python -m app.commands.calibrate_questions [--irt] [--workers N]
+"""
+
+import argparse
+import asyncio
+
+from app.core.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.repositories import RepositoryFactory
+from app.services.calibration_service import CalibrationService
+
+
+async def calibrate(args: argparse.Namespace) -> None:
+    async with AsyncSessionLocal() as session:
+        saved = await CalibrationService(RepositoryFactory(session)).calibrate(
+            chunk_size=args.chunk_size,
+            min_responses=args.min_responses,
+            irt=args.irt,
+            workers=args.workers,
+        )
+    await engine.dispose()
+    print(f"Calibrated {saved} questions")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--irt", action="store_true", help="Also estimate Rasch difficulties."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Reduce chunks in this many processes (default: in process).",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=settings.CALIBRATION_CHUNK_SIZE
+    )
+    parser.add_argument(
+        "--min-responses", type=int, default=settings.CALIBRATION_MIN_RESPONSES
+    )
+    asyncio.run(calibrate(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Create users in bulk from a CSV or NDJSON file.
+
+CSV files need a `username,email,password` header; NDJSON files hold one
+object per line with those keys. Prints every row that failed. Run from
+the project root:
+
+    python -m app.commands.provision_users users.csv [--workers N]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.core.config import settings
+from app.database import AsyncSessionLocal, engine
+from app.services.provisioning_service import ProvisioningService, parse_rows
+
+
+async def file_lines(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        for line in file:
+            yield line.rstrip(b"\r\n")
+
+
+async def provision(args: argparse.Namespace) -> None:
+    row_format = args.format or (
+        "ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv"
+    )
+    result = await ProvisioningService(AsyncSessionLocal).provision(
+        parse_rows(file_lines(args.path), row_format),
+        batch_size=args.batch_size,
+        workers=args.workers,
+    )
+    await engine.dispose()
+    for entry in result["rows"]:
+        if "error" in entry:
+            print(f"line {entry['line']}: {entry['error']}")
+    print(f"Created {result['created']} users, {result['failed']} rows failed")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=["csv", "ndjson"],
+        help="Default: from the file extension (.ndjson/.jsonl, else CSV).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.PROVISIONING_WORKERS,
+        help="Hash passwords in this many processes (default: one per CPU).",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.PROVISIONING_BATCH_SIZE
+    )
+    asyncio.run(provision(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
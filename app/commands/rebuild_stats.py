@@ -0,0 +1,38 @@
+"""Recompute the per-user category and difficulty scores from raw responses.
+
+Used to backfill `category_scores` for responses written before it existed,
+or to repair it. Run from the project root:
+
+    python -m app.commands.rebuild_stats [--user-id ID ...]
+"""
+
+import argparse
+import asyncio
+import time
+
+from app.database import AsyncSessionLocal, engine
+from app.repositories import RepositoryFactory
+
+
+async def rebuild(user_ids: list[int] | None) -> None:
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as session:
+        rows = await RepositoryFactory(session).category_scores.rebuild(user_ids)
+    await engine.dispose()
+    print(f"Wrote {rows} score rows in {time.perf_counter() - started:.2f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--user-id",
+        dest="user_ids",
+        type=int,
+        action="append",
+        help="Only rebuild this user; may be repeated (default: every user).",
+    )
+    asyncio.run(rebuild(parser.parse_args().user_ids))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+CONTAINER_BITS = 16
+ARRAY_LIMIT = 4096
+BITMAP_BYTES = (1 << CONTAINER_BITS) // 8
+
+
+class CompactBitmap:
+    """A compressed set of non-negative integers.
+
+    Values are split by their high bits into containers of 65536 values.
+    Sparse containers are sorted `array("H")`s of the low bits; once one holds
+    more than `ARRAY_LIMIT` values it turns into a fixed 8 KiB bitmap. Lookups
+    and inserts are O(log 4096) at worst and do not depend on how many values
+    the set holds.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._containers: dict[int, array | bytearray] = {}
+        self._count = 0
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int) or value < 0:
+            return False
+        container = self._containers.get(value >> CONTAINER_BITS)
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(container, bytearray):
+            return bool(container[low >> 3] & (1 << (low & 7)))
+        position = bisect_left(container, low)
+        return position < len(container) and container[position] == low
+
+    def __iter__(self) -> Iterator[int]:
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            base = high << CONTAINER_BITS
+            if isinstance(container, bytearray):
+                for byte_number, byte in enumerate(container):
+                    if byte:
+                        for bit in range(8):
+                            if byte & (1 << bit):
+                                yield base + byte_number * 8 + bit
+            else:
+                for low in container:
+                    yield base + low
+
+    def add(self, value: int) -> None:
+        high, low = value >> CONTAINER_BITS, value & 0xFFFF
+        container = self._containers.get(high)
+        if container is None:
+            self._containers[high] = array("H", [low])
+            self._count += 1
+            return
+
+        if isinstance(container, bytearray):
+            byte, bit = low >> 3, 1 << (low & 7)
+            if not container[byte] & bit:
+                container[byte] |= bit
+                self._count += 1
+            return
+
+        position = bisect_left(container, low)
+        if position < len(container) and container[position] == low:
+            return
+        container.insert(position, low)
+        self._count += 1
+        if len(container) > ARRAY_LIMIT:
+            bitmap = bytearray(BITMAP_BYTES)
+            for item in container:
+                bitmap[item >> 3] |= 1 << (item & 7)
+            self._containers[high] = bitmap
+
+    def update(self, values: Iterable[int]) -> None:
+        for value in values:
+            self.add(value)
+
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._containers) + sum(
+            sys.getsizeof(container) for container in self._containers.values()
+        )
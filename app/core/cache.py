@@ -0,0 +1,121 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-process cache with per-entry TTL and LRU eviction.
+
+    Entries expire `ttl_seconds` after they were stored. Once `maxsize` is
+    reached, storing a new entry evicts the least recently used one.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self._lookup(key, touch=False) is not _MISSING
+
+    def _lookup(self, key: K, touch: bool) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return _MISSING
+        if touch:
+            self._data.move_to_end(key)
+        return value
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        value = self._lookup(key, touch=True)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def peek(self, key: K, default: V | None = None) -> V | None:
+        """Return a live entry without counting a lookup or refreshing its LRU slot."""
+        value = self._lookup(key, touch=False)
+        return default if value is _MISSING else value
+
+    def set(self, key: K, value: V) -> None:
+        if self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        self._evict()
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        value = self._lookup(key, touch=False)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        del self._data[key]
+        return value
+
+    def values(self) -> list[V]:
+        """Return the entries that have not expired yet."""
+        now = time.monotonic()
+        return [value for expires_at, value in self._data.values() if expires_at > now]
+
+    def discard(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[V], bool]) -> int:
+        """Drop every entry whose value matches and return how many were removed."""
+        keys = [key for key, (_, value) in self._data.items() if predicate(value)]
+        for key in keys:
+            del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry and return how many were removed."""
+        now = time.monotonic()
+        expired = [
+            key for key, (expires_at, _) in self._data.items() if expires_at <= now
+        ]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._data:
+            key, (expires_at, _) = next(iter(self._data.items()))
+            if len(self._data) <= self.maxsize and expires_at > now:
+                break
+            del self._data[key]
+            if expires_at > now:
+                self.evictions += 1
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
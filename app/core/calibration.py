@@ -0,0 +1,153 @@
+"""Question statistics from streamed responses, computed with NumPy.
+
+Responses arrive as chunks of three aligned arrays: user IDs, question IDs
+and correctness. Two passes over the chunks keep nothing but per-user and
+per-question sums, so memory depends on the highest IDs, not on the number
+of responses:
+
+1. `count_chunk` counts answers and correct answers per user and question.
+2. `moment_chunk` scores each response against the user's ability on the
+   rest of their answers and sums the moments needed for the point-biserial
+   correlation and, optionally, a Rasch difficulty estimate.
+
+Every per-chunk result is a tuple of `np.bincount` arrays that add up, so
+chunks can be reduced in any order and in other processes.
+"""
+
+import numpy as np
+
+# Abilities are taken as the logit of the share of other answers that were
+# correct, shrunk this far towards 50% so perfect records stay finite.
+LOGIT_SMOOTHING = 0.5
+
+# PROX scales item logits by sqrt(1 + variance / 2.89) for the ability
+# spread of the people who answered; 2.89 = 1.7 ** 2.
+PROX_SCALE = 2.89
+
+Sums = tuple[np.ndarray, ...]
+
+
+def count_chunk(users: np.ndarray, questions: np.ndarray, correct: np.ndarray) -> Sums:
+    """First-pass sums: answers and correct answers per user, then per question."""
+    return (
+        np.bincount(users),
+        np.bincount(users[correct]),
+        np.bincount(questions),
+        np.bincount(questions[correct]),
+    )
+
+
+def moment_chunk(
+    users: np.ndarray,
+    questions: np.ndarray,
+    correct: np.ndarray,
+    user_answers: np.ndarray,
+    user_correct: np.ndarray,
+    irt: bool = False,
+) -> Sums:
+    """Second-pass sums per question over responses from users with other answers.
+
+    Returns (responses, correct, ability, ability², ability when correct),
+    plus (theta, theta²) with `irt`. Ability is the user's share of correct
+    answers among their other responses, so a question is never correlated
+    with itself; theta is the smoothed logit of that share.
+    """
+    rest_answers = user_answers[users] - 1
+    usable = rest_answers > 0
+    users, questions, correct = users[usable], questions[usable], correct[usable]
+    rest_answers = rest_answers[usable]
+    rest_correct = user_correct[users] - correct
+
+    ability = rest_correct / rest_answers
+    size = int(questions.max()) + 1 if len(questions) else 0
+    sums = [
+        np.bincount(questions, minlength=size),
+        np.bincount(questions[correct], minlength=size),
+        np.bincount(questions, weights=ability, minlength=size),
+        np.bincount(questions, weights=ability * ability, minlength=size),
+        np.bincount(questions[correct], weights=ability[correct], minlength=size),
+    ]
+    if irt:
+        theta = np.log(
+            (rest_correct + LOGIT_SMOOTHING)
+            / (rest_answers - rest_correct + LOGIT_SMOOTHING)
+        )
+        sums += [
+            np.bincount(questions, weights=theta, minlength=size),
+            np.bincount(questions, weights=theta * theta, minlength=size),
+        ]
+    return tuple(sums)
+
+
+def add_sums(total: Sums | None, part: Sums) -> Sums:
+    """Element-wise sum of two results, padding the shorter arrays with zeros."""
+    if total is None:
+        return part
+    merged = []
+    for left, right in zip(total, part):
+        if len(left) < len(right):
+            left, right = right, left
+        left = left.copy()
+        left[: len(right)] += right
+        merged.append(left)
+    return tuple(merged)
+
+
+def padded(values: np.ndarray, size: int) -> np.ndarray:
+    return np.pad(values, (0, max(size - len(values), 0)))[:size]
+
+
+def user_totals(counts: Sums) -> tuple[np.ndarray, np.ndarray]:
+    """Per-user answers and correct answers of the first pass, of equal length."""
+    answers, correct = counts[0], counts[1]
+    return answers, padded(correct, len(answers))
+
+
+def question_statistics(
+    counts: Sums, moments: Sums, min_responses: int = 1
+) -> dict[str, np.ndarray]:
+    """Per-question arrays indexed by question ID.
+
+    `p_value` is the share of correct answers. `discrimination` is the
+    point-biserial correlation between answering correctly and ability, and
+    `irt_difficulty` the PROX estimate of Rasch difficulty in logits (only
+    if `moments` were computed with `irt`). Both are NaN for questions with
+    fewer than `min_responses` usable responses or no variance.
+    """
+    _, _, answers, correct = counts
+    size = len(answers)
+    answers, correct = answers.astype(np.float64), padded(correct, size)
+    moments = tuple(padded(values, size).astype(np.float64) for values in moments)
+    used, used_correct, ability, ability_sq, ability_correct = moments[:5]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p_value = correct / answers
+        share = used_correct / used
+        mean = ability / used
+        variance = ability_sq / used - mean * mean
+        covariance = ability_correct / used - share * mean
+        discrimination = covariance / np.sqrt(variance * share * (1 - share))
+        enough = (used >= min_responses) & (variance > 0) & (share > 0) & (share < 1)
+        discrimination = np.where(enough, discrimination, np.nan)
+
+        statistics = {
+            "responses": answers.astype(np.int64),
+            "correct": correct.astype(np.int64),
+            "p_value": p_value,
+            "discrimination": discrimination,
+        }
+        if len(moments) > 5:
+            theta, theta_sq = moments[5:]
+            theta_mean = theta / used
+            theta_variance = np.maximum(theta_sq / used - theta_mean**2, 0)
+            item_logit = np.log(
+                (used - used_correct + LOGIT_SMOOTHING)
+                / (used_correct + LOGIT_SMOOTHING)
+            )
+            difficulty = (
+                theta_mean + np.sqrt(1 + theta_variance / PROX_SCALE) * item_logit
+            )
+            statistics["irt_difficulty"] = np.where(
+                used >= min_responses, difficulty, np.nan
+            )
+    return statistics
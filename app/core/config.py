@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 
@@ -18,6 +20,114 @@ class Settings(BaseSettings):
 
     TEST_DATABASE_URL: str | None
 
+    # Login attempts per client IP and per username: a sustained rate per
+    # minute plus a burst. Throttled attempts get a 429 before any bcrypt.
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_ATTEMPTS_PER_MINUTE_PER_IP: int = 30
+    LOGIN_BURST_PER_IP: int = 60
+    LOGIN_ATTEMPTS_PER_MINUTE_PER_USERNAME: int = 5
+    LOGIN_BURST_PER_USERNAME: int = 10
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = 100_000
+
+    # bcrypt runs in this many worker processes (0 = inline on the event
+    # loop); past PASSWORD_HASH_MAX_PENDING queued checks, requests get a 503.
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    # Bearer tokens whose signature was checked, by digest. Logged out tokens
+    # are denied until they expire; when persisted, the denylist survives
+    # restarts and reaches other workers within the sync interval.
+    VERIFIED_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    TOKEN_REVOCATION_PERSIST: bool = True
+    TOKEN_REVOCATION_SYNC_SECONDS: int = 30
+
+    # Bulk provisioning: users validated, checked and inserted per batch.
+    # Uploads over HTTP hash through the shared password hasher; the
+    # provision_users command uses its own pool of this many processes
+    # (0 = one per CPU).
+    PROVISIONING_BATCH_SIZE: int = 1_000
+    PROVISIONING_WORKERS: int = 0
+
+    # Whether request sessions are one transaction that repositories only
+    # flush, committed once at the end of the request.
+    DB_UNIT_OF_WORK: bool = True
+
+    # Users resolved from bearer tokens. Entries are dropped on changes made
+    # through this worker; the TTL bounds staleness from other workers.
+    PRINCIPAL_CACHE_ENABLED: bool = True
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+
+    # Seconds before the in-process question ID index is reloaded (0 = never).
+    QUESTION_INDEX_TTL_SECONDS: int = 300
+
+    # In-process question_id -> (correct answer, explanation, answer IDs) map
+    # used for grading; 0 entries means no limit. Reloaded after the TTL so
+    # edits made through other workers are picked up (0 = never).
+    ANSWER_KEY_INDEX_ENABLED: bool = True
+    ANSWER_KEY_INDEX_MAX_ENTRIES: int = 0
+    ANSWER_KEY_INDEX_TTL_SECONDS: int = 300
+
+    # Seconds before the in-process leaderboard is reloaded (0 = never).
+    LEADERBOARD_TTL_SECONDS: int = 60
+
+    # Daily / weekly / monthly leaderboard buckets: how many past periods are
+    # kept, and how often older ones are dropped.
+    SCORE_BUCKET_RETENTION_DAYS: int = 31
+    SCORE_BUCKET_RETENTION_WEEKS: int = 12
+    SCORE_BUCKET_RETENTION_MONTHS: int = 24
+    SCORE_BUCKET_PURGE_INTERVAL_SECONDS: int = 3600
+
+    # Question calibration job: responses per streamed chunk, and the usable
+    # responses a question needs before discrimination and IRT are reported.
+    CALIBRATION_CHUNK_SIZE: int = 1_000_000
+    CALIBRATION_MIN_RESPONSES: int = 30
+
+    # How answers are written to user_responses: "direct" in the request's
+    # transaction, or through a group-commit buffer that either waits for the
+    # batch to commit ("buffered") or returns at once ("async").
+    RESPONSE_WRITE_MODE: Literal["direct", "buffered", "async"] = "direct"
+    RESPONSE_WRITE_MAX_BATCH: int = 1_000
+    RESPONSE_WRITE_INTERVAL_SECONDS: float = 0.005
+    RESPONSE_WRITE_MAX_PENDING: int = 10_000
+
+    # Monthly user_responses partitions: how many future months to create,
+    # how many past months to keep (0 = all), whether older ones are detached
+    # or dropped after their rollup, and how often this runs.
+    USER_RESPONSES_PARTITIONS_AHEAD: int = 3
+    USER_RESPONSES_RETENTION_MONTHS: int = 24
+    USER_RESPONSES_RETENTION_ACTION: Literal["detach", "drop"] = "detach"
+    USER_RESPONSES_MAINTENANCE_INTERVAL_SECONDS: int = 3600
+
+    # Per-user bitmaps of answered questions used to avoid repeats.
+    SEEN_QUESTIONS_MAX_USERS: int = 10_000
+    SEEN_QUESTIONS_TTL_SECONDS: int = 3600
+
+    # In-process store of generated quizzes' answer keys.
+    QUIZ_SESSION_MAX_ENTRIES: int = 10_000
+    QUIZ_SESSION_TTL_SECONDS: int = 3600
+
+    # Rendered quizzes for seeded requests ("quiz of the day", shared links).
+    SEEDED_QUIZ_CACHE_MAX_ENTRIES: int = 1_000
+    SEEDED_QUIZ_CACHE_TTL_SECONDS: int = 86_400
+
+    # Streamed quizzes over /quiz/ws: open connections per worker, seconds to
+    # wait for an answer, and when buffered responses are written.
+    QUIZ_WS_MAX_CONNECTIONS: int = 5_000
+    QUIZ_WS_ANSWER_TIMEOUT_SECONDS: int = 120
+    QUIZ_WS_FLUSH_BATCH_SIZE: int = 50
+    QUIZ_WS_FLUSH_INTERVAL_SECONDS: int = 30
+
+    # Live multiplayer rooms: open rooms per worker, players per room, seconds
+    # per question, and how many messages a player may fall behind before
+    # being dropped.
+    QUIZ_ROOM_MAX_ROOMS: int = 1_000
+    QUIZ_ROOM_TTL_SECONDS: int = 3600
+    QUIZ_ROOM_MAX_PLAYERS: int = 1_000
+    QUIZ_ROOM_QUESTION_SECONDS: int = 20
+    QUIZ_ROOM_QUEUE_SIZE: int = 32
+    QUIZ_ROOM_STANDINGS_SIZE: int = 10
+
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=True,
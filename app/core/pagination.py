@@ -0,0 +1,28 @@
+"""Opaque continuation tokens for keyset pagination."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+Position = tuple[datetime, int]
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(position: Position) -> str:
+    """Token for the rows after `(created_at, id)`."""
+    created_at, row_id = position
+    payload = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Position:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as err:
+        raise InvalidCursorError("Invalid cursor.") from err
@@ -0,0 +1,87 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised instead of queueing when the hashing pool is saturated."""
+
+
+class PasswordHasher:
+    """Runs bcrypt in worker processes so it never blocks the event loop.
+
+    At most `max_pending` hashes and verifications are running or queued at
+    once; beyond that callers get `PasswordHasherBusy` right away rather
+    than waiting behind a login storm. With no `workers` the work runs
+    inline, as it did before.
+    """
+
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._pool: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self.hashes = 0
+        self.verifications = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self.max_busy_seconds = 0.0
+
+    async def hash(self, password: str) -> str:
+        self.hashes += 1
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        self.verifications += 1
+        return await self._run(verify_password, password, hashed_password)
+
+    async def _run(self, operation: Callable[..., T], *args: Any) -> T:
+        if self.workers <= 0:
+            return operation(*args)
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHasherBusy("Too many password checks in progress")
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, operation, *args)
+        finally:
+            self._pending -= 1
+            elapsed = time.perf_counter() - started
+            self.busy_seconds += elapsed
+            self.max_busy_seconds = max(self.max_busy_seconds, elapsed)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the next call starts new ones."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        calls = (self.hashes + self.verifications - self.rejected) or 1
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "hashes": self.hashes,
+            "verifications": self.verifications,
+            "rejected": self.rejected,
+            "avg_ms": round(self.busy_seconds * 1000 / calls, 2),
+            "max_ms": round(self.max_busy_seconds * 1000, 2),
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
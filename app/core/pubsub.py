@@ -0,0 +1,88 @@
+import asyncio
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_CLOSED = object()
+
+
+class Subscription(Generic[T]):
+    """A subscriber's bounded queue of messages, consumed with `async for`."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # Bounded by `push`, so closing can always append the end marker.
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False
+        self.dropped = False
+
+    def __aiter__(self) -> "Subscription[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        message = await self._queue.get()
+        if message is _CLOSED:
+            raise StopAsyncIteration
+        return message
+
+    def push(self, message: T) -> bool:
+        """Queue a message without waiting; a full queue drops the subscriber."""
+        if self.closed:
+            return False
+        if self._queue.qsize() >= self.maxsize:
+            self.close(drop=True)
+            return False
+        self._queue.put_nowait(message)
+        return True
+
+    def close(self, drop: bool = False) -> None:
+        """End the subscription after the queued messages, or at once with `drop`."""
+        if self.closed:
+            return
+        self.closed = True
+        self.dropped = drop
+        if drop:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+        self._queue.put_nowait(_CLOSED)
+
+
+class Broadcaster(Generic[T]):
+    """In-process fan-out of messages to subscribers with bounded queues.
+
+    Publishing never waits: a subscriber whose queue is full is dropped
+    instead of slowing down everyone else.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue_size = queue_size
+        self._subscribers: set[Subscription[T]] = set()
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscription[T]:
+        subscription: Subscription[T] = Subscription(self.queue_size)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription[T]) -> None:
+        self._subscribers.discard(subscription)
+        subscription.close()
+
+    def publish(self, message: T) -> int:
+        """Queue `message` for every subscriber and return how many got it."""
+        delivered = 0
+        for subscription in list(self._subscribers):
+            if subscription.push(message):
+                delivered += 1
+            else:
+                self._subscribers.discard(subscription)
+                self.dropped += 1
+        return delivered
+
+    def close(self) -> None:
+        for subscription in self._subscribers:
+            subscription.close()
+        self._subscribers.clear()
@@ -0,0 +1,157 @@
+from array import array
+from bisect import bisect_left, insort
+from typing import Iterable, Iterator
+
+DEFAULT_LOAD = 1_000
+
+
+class RankedIntSet:
+    """A sorted set of 64-bit ints with O(log n) rank and select.
+
+    Values live in sorted `array("q")` blocks of up to `2 * load` items, so
+    an insert or delete moves at most a few KiB of memory. A Fenwick tree
+    over the block sizes turns "how many values are smaller" and "the k-th
+    value" into O(log n) lookups.
+    """
+
+    def __init__(self, values: Iterable[int] = (), load: int = DEFAULT_LOAD) -> None:
+        self.load = load
+        ordered = sorted(set(values))
+        self._blocks = [
+            array("q", ordered[start : start + load])
+            for start in range(0, len(ordered), load)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(ordered)
+        self._rebuild_tree()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, value: int) -> bool:
+        number = bisect_left(self._maxes, value)
+        if number == len(self._maxes):
+            return False
+        block = self._blocks[number]
+        return block[bisect_left(block, value)] == value
+
+    def add(self, value: int) -> None:
+        if not self._blocks:
+            self._blocks.append(array("q", [value]))
+            self._maxes.append(value)
+            self._len = 1
+            self._rebuild_tree()
+            return
+
+        number = bisect_left(self._maxes, value)
+        if number == len(self._maxes):
+            number -= 1
+            self._blocks[number].append(value)
+            self._maxes[number] = value
+        else:
+            block = self._blocks[number]
+            position = bisect_left(block, value)
+            if block[position] == value:
+                return
+            block.insert(position, value)
+        self._len += 1
+
+        block = self._blocks[number]
+        if len(block) > 2 * self.load:
+            half = len(block) // 2
+            self._blocks[number : number + 1] = [block[:half], block[half:]]
+            self._maxes[number : number + 1] = [block[half - 1], block[-1]]
+            self._rebuild_tree()
+        else:
+            self._tree_add(number, 1)
+
+    def discard(self, value: int) -> None:
+        number = bisect_left(self._maxes, value)
+        if number == len(self._maxes):
+            return
+        block = self._blocks[number]
+        position = bisect_left(block, value)
+        if block[position] != value:
+            return
+        del block[position]
+        self._len -= 1
+
+        if not block:
+            del self._blocks[number]
+            del self._maxes[number]
+            self._rebuild_tree()
+        else:
+            self._maxes[number] = block[-1]
+            self._tree_add(number, -1)
+
+    def rank(self, value: int) -> int:
+        """Number of values smaller than `value`."""
+        number = bisect_left(self._maxes, value)
+        if number == len(self._maxes):
+            return self._len
+        return self._prefix(number) + bisect_left(self._blocks[number], value)
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RankedIntSet index out of range")
+        number, offset = self._locate(index)
+        return self._blocks[number][offset]
+
+    def slice(self, start: int, stop: int) -> list[int]:
+        """Values at positions `start` to `stop - 1`, in order."""
+        start, stop = max(start, 0), min(stop, self._len)
+        if start >= stop:
+            return []
+        number, offset = self._locate(start)
+        values: list[int] = []
+        while len(values) < stop - start:
+            block = self._blocks[number]
+            values.extend(block[offset : offset + stop - start - len(values)])
+            number, offset = number + 1, 0
+        return values
+
+    def memory_bytes(self) -> int:
+        return sum(
+            block.buffer_info()[1] * block.itemsize for block in self._blocks
+        ) + 8 * (len(self._maxes) + len(self._tree))
+
+    def _rebuild_tree(self) -> None:
+        tree = [0] * (len(self._blocks) + 1)
+        for number, block in enumerate(self._blocks, start=1):
+            tree[number] += len(block)
+            parent = number + (number & -number)
+            if parent < len(tree):
+                tree[parent] += tree[number]
+        self._tree = tree
+
+    def _tree_add(self, number: int, delta: int) -> None:
+        number += 1
+        while number < len(self._tree):
+            self._tree[number] += delta
+            number += number & -number
+
+    def _prefix(self, number: int) -> int:
+        """Number of values in the blocks before block `number`."""
+        total = 0
+        while number > 0:
+            total += self._tree[number]
+            number -= number & -number
+        return total
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Block number and offset of the value at position `index`."""
+        number = 0
+        step = 1 << (len(self._tree) - 1).bit_length()
+        while step:
+            following = number + step
+            if following < len(self._tree) and self._tree[following] <= index:
+                number = following
+                index -= self._tree[following]
+            step >>= 1
+        return number, index
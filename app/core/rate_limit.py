@@ -0,0 +1,122 @@
+import math
+import time
+from typing import Any
+
+from app.core.config import settings
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets: `rate` tokens a second, up to `burst` saved.
+
+    Each key costs one `(tokens, updated_at)` tuple, kept in least recently
+    used order. A key whose bucket has refilled is forgotten, since a full
+    bucket behaves like a new one; idle keys are swept from the old end at
+    most every `sweep_seconds`, and past `max_keys` the least recently used
+    keys are dropped.
+    """
+
+    def __init__(
+        self, rate: float, burst: int, max_keys: int, sweep_seconds: float = 60.0
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self.sweep_seconds = sweep_seconds
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._swept_at = time.monotonic()
+        self.allowed = 0
+        self.throttled = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _refilled(self, tokens: float, updated_at: float, now: float) -> float:
+        return min(self.burst, tokens + (now - updated_at) * self.rate)
+
+    def acquire(self, key: str, now: float | None = None) -> float:
+        """Take a token for `key`: 0 if one was available, else the seconds
+        until one will be."""
+        now = time.monotonic() if now is None else now
+        if now - self._swept_at >= self.sweep_seconds:
+            self.sweep(now)
+
+        entry = self._buckets.pop(key, None)
+        tokens = self.burst if entry is None else self._refilled(*entry, now)
+        if tokens >= 1:
+            tokens -= 1
+            wait = 0.0
+            self.allowed += 1
+        else:
+            wait = (1 - tokens) / self.rate
+            self.throttled += 1
+        self._buckets[key] = (tokens, now)
+
+        while len(self._buckets) > self.max_keys:
+            del self._buckets[next(iter(self._buckets))]
+            self.evictions += 1
+        return wait
+
+    def sweep(self, now: float | None = None) -> int:
+        """Forget the keys whose buckets are full again; return how many."""
+        now = time.monotonic() if now is None else now
+        self._swept_at = now
+        removed = 0
+        for key, (tokens, updated_at) in list(self._buckets.items()):
+            if self._refilled(tokens, updated_at, now) < self.burst:
+                break
+            del self._buckets[key]
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "keys": len(self._buckets),
+            "max_keys": self.max_keys,
+            "rate_per_minute": self.rate * 60,
+            "burst": self.burst,
+            "allowed": self.allowed,
+            "throttled": self.throttled,
+            "evictions": self.evictions,
+        }
+
+
+class LoginThrottle:
+    """Limits login attempts per client IP and per username."""
+
+    def __init__(self, by_ip: TokenBucketLimiter, by_username: TokenBucketLimiter):
+        self.by_ip = by_ip
+        self.by_username = by_username
+
+    def acquire(self, username: str, client_ip: str | None) -> int:
+        """0 if the attempt may go ahead, else the whole seconds to wait."""
+        if not settings.LOGIN_RATE_LIMIT_ENABLED:
+            return 0
+        wait = self.by_ip.acquire(client_ip or "unknown")
+        if not wait:
+            wait = self.by_username.acquire(username)
+        return math.ceil(wait)
+
+    def clear(self) -> None:
+        self.by_ip.clear()
+        self.by_username.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"by_ip": self.by_ip.stats(), "by_username": self.by_username.stats()}
+
+
+login_throttle = LoginThrottle(
+    by_ip=TokenBucketLimiter(
+        rate=settings.LOGIN_ATTEMPTS_PER_MINUTE_PER_IP / 60,
+        burst=settings.LOGIN_BURST_PER_IP,
+        max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS,
+    ),
+    by_username=TokenBucketLimiter(
+        rate=settings.LOGIN_ATTEMPTS_PER_MINUTE_PER_USERNAME / 60,
+        burst=settings.LOGIN_BURST_PER_USERNAME,
+        max_keys=settings.LOGIN_RATE_LIMIT_MAX_KEYS,
+    ),
+)
@@ -0,0 +1,73 @@
+import time
+from typing import Any
+
+
+class RevocationList:
+    """Revoked token digests, kept until the tokens would have expired.
+
+    Expiries are tracked in a timing wheel of `resolution_seconds` wide
+    buckets keyed by tick. Every call first advances the wheel and drops
+    the buckets it passed, so entries age out without scanning and both
+    revoking and checking stay O(1). An entry may outlive its token by up
+    to one resolution, which is harmless since the token is expired.
+    """
+
+    def __init__(self, resolution_seconds: float = 1.0) -> None:
+        self.resolution_seconds = resolution_seconds
+        self._expires_at: dict[str, float] = {}
+        self._buckets: dict[int, set[str]] = {}
+        self._tick = self._tick_of(time.time())
+        self.revocations = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._expires_at)
+
+    def __contains__(self, digest: str) -> bool:
+        return self.contains(digest)
+
+    def _tick_of(self, timestamp: float) -> int:
+        return int(timestamp // self.resolution_seconds)
+
+    def _advance(self, now: float) -> None:
+        tick = self._tick_of(now)
+        if tick <= self._tick:
+            return
+        if tick - self._tick > len(self._buckets):
+            passed = [bucket for bucket in self._buckets if bucket < tick]
+        else:
+            passed = [
+                bucket for bucket in range(self._tick, tick) if bucket in self._buckets
+            ]
+        for bucket in passed:
+            for digest in self._buckets.pop(bucket):
+                del self._expires_at[digest]
+                self.expirations += 1
+        self._tick = tick
+
+    def add(self, digest: str, expires_at: float, now: float | None = None) -> None:
+        """Deny `digest` until `expires_at`, a Unix timestamp."""
+        now = time.time() if now is None else now
+        self._advance(now)
+        if expires_at <= now or digest in self._expires_at:
+            return
+        self._expires_at[digest] = expires_at
+        self._buckets.setdefault(self._tick_of(expires_at), set()).add(digest)
+        self.revocations += 1
+
+    def contains(self, digest: str, now: float | None = None) -> bool:
+        self._advance(time.time() if now is None else now)
+        return digest in self._expires_at
+
+    def clear(self) -> None:
+        self._expires_at.clear()
+        self._buckets.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._expires_at),
+            "buckets": len(self._buckets),
+            "resolution_seconds": self.resolution_seconds,
+            "revocations": self.revocations,
+            "expirations": self.expirations,
+        }
@@ -1,13 +1,27 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError, JWTError
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.revocation import RevocationList
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Claims of tokens whose signature was already checked: digest -> claims.
+verified_tokens: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=settings.VERIFIED_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+)
+
+# Digests of logged out tokens, until they expire.
+revoked_tokens = RevocationList()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
@@ -31,3 +45,27 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
+
+
+def token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """The claims of a valid, unexpired and unrevoked token.
+
+    The signature of a token is checked on its first use only; later uses
+    are a digest lookup in `verified_tokens` plus an `exp` check. Raises
+    `JWTError` for any token that must be refused.
+    """
+    digest = token_digest(token)
+    if digest in revoked_tokens:
+        raise JWTError("Token has been revoked.")
+    claims = verified_tokens.get(digest)
+    if claims is None:
+        claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        verified_tokens.set(digest, claims)
+    elif claims.get("exp", float("inf")) < time.time():
+        verified_tokens.discard(digest)
+        raise ExpiredSignatureError("Signature has expired.")
+    return claims
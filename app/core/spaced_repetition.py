@@ -0,0 +1,51 @@
+"""SM-2 spaced repetition scheduling."""
+
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta
+
+MIN_EASE_FACTOR = 1.3
+DEFAULT_EASE_FACTOR = 2.5
+
+# Review quality on the SM-2 0-5 scale; below PASSING_QUALITY is a lapse.
+PASSING_QUALITY = 3
+CORRECT_QUALITY = 4
+INCORRECT_QUALITY = 1
+
+
+@dataclass(frozen=True)
+class CardState:
+    repetitions: int = 0
+    interval_days: int = 0
+    ease_factor: float = DEFAULT_EASE_FACTOR
+    lapses: int = 0
+
+
+def review_quality(is_correct: bool, quality: int | None = None) -> int:
+    """Quality of a review: the player's own rating, capped by correctness."""
+    if quality is None:
+        return CORRECT_QUALITY if is_correct else INCORRECT_QUALITY
+    if not is_correct:
+        return min(quality, PASSING_QUALITY - 1)
+    return max(quality, PASSING_QUALITY)
+
+
+def schedule(
+    state: CardState, quality: int, now: datetime
+) -> tuple[CardState, datetime]:
+    """Apply one review of `quality` and return the new state and due time."""
+    if quality < PASSING_QUALITY:
+        state = replace(state, repetitions=0, interval_days=1, lapses=state.lapses + 1)
+    else:
+        repetitions = state.repetitions + 1
+        if repetitions == 1:
+            interval_days = 1
+        elif repetitions == 2:
+            interval_days = 6
+        else:
+            interval_days = round(state.interval_days * state.ease_factor)
+        state = replace(state, repetitions=repetitions, interval_days=interval_days)
+
+    penalty = 5 - quality
+    ease_factor = state.ease_factor + 0.1 - penalty * (0.08 + penalty * 0.02)
+    state = replace(state, ease_factor=max(MIN_EASE_FACTOR, round(ease_factor, 4)))
+    return state, now + timedelta(days=state.interval_days)
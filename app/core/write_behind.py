@@ -0,0 +1,164 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+from app.middleware.logger import logger
+
+T = TypeVar("T")
+
+Entry = tuple[list[T], asyncio.Future | None]
+
+# Queued by `stop` after everything else; the writer exits when it gets it.
+_STOP: Any = ([], None)
+
+
+class WriteBehindBuffer(Generic[T]):
+    """Gathers rows from concurrent callers and writes them in batches.
+
+    A single background task takes whatever is queued, waits up to
+    `interval_seconds` for more until `max_batch` rows are gathered, and
+    hands the batch to `flush` at once: one INSERT and one COMMIT for many
+    requests. Callers either wait for their rows' flush or return at once;
+    at most `max_pending` submissions are queued before `put` waits. A batch
+    that fails is retried one submission at a time, so a bad row only fails
+    the submission it came from, which is written whole or not at all.
+    """
+
+    def __init__(
+        self, max_batch: int, interval_seconds: float, max_pending: int
+    ) -> None:
+        self.max_batch = max_batch
+        self.interval_seconds = interval_seconds
+        self._queue: asyncio.Queue[Entry[T]] = asyncio.Queue(maxsize=max_pending)
+        self._flush: Callable[[list[T]], Awaitable[None]] | None = None
+        self._task: asyncio.Task | None = None
+        self.flushes = 0
+        self.rows = 0
+        self.failed_rows = 0
+        self.max_batch_rows = 0
+        self.flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, flush: Callable[[list[T]], Awaitable[None]]) -> None:
+        if self.running:
+            return
+        self._flush = flush
+        # A fresh queue, bound to the running event loop.
+        self._queue = asyncio.Queue(maxsize=self._queue.maxsize)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write everything already queued, then stop the background task.
+
+        Rows put after this starts are the caller's to write.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+        await self._queue.put(_STOP)
+        await task
+        # Callers that saw the buffer running just before it stopped.
+        while not self._queue.empty():
+            await self._write([self._queue.get_nowait()])
+
+    async def put(self, rows: list[T], wait: bool = True) -> None:
+        """Queue rows; with `wait`, return once they are committed.
+
+        A failed flush is raised to waiting callers and only logged for the
+        others.
+        """
+        if not rows:
+            return
+        future = asyncio.get_running_loop().create_future() if wait else None
+        await self._queue.put((rows, future))
+        if future is not None:
+            await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entries = [await self._queue.get()]
+            count = len(entries[0][0])
+            deadline = loop.time() + self.interval_seconds
+            while count < self.max_batch and entries[-1] is not _STOP:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        async with asyncio.timeout(timeout):
+                            entry = await self._queue.get()
+                    except TimeoutError:
+                        break
+                else:
+                    entry = self._queue.get_nowait()
+                entries.append(entry)
+                count += len(entry[0])
+            stopping = entries[-1] is _STOP
+            await self._write(entries)
+
+    async def _write(self, entries: list[Entry[T]]) -> None:
+        rows = [row for batch, _ in entries for row in batch]
+        if not rows:
+            return
+        started = time.perf_counter()
+        try:
+            await self._flush(rows)
+        except Exception as err:
+            if len(entries) == 1:
+                self._fail(entries[0], err)
+                return
+            logger.warning(
+                f"Failed to write a batch of {len(rows)} rows, "
+                f"retrying them one submission at a time: {err}"
+            )
+            for entry in entries:
+                await self._write_entry(entry)
+        else:
+            elapsed = time.perf_counter() - started
+            self.flushes += 1
+            self.rows += len(rows)
+            self.max_batch_rows = max(self.max_batch_rows, len(rows))
+            self.flush_seconds += elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+            for _, future in entries:
+                if future is not None and not future.done():
+                    future.set_result(None)
+
+    async def _write_entry(self, entry: Entry[T]) -> None:
+        """Write one submission on its own: all of its rows or none of them."""
+        rows, future = entry
+        try:
+            await self._flush(rows)
+        except Exception as err:
+            self._fail(entry, err)
+        else:
+            self.rows += len(rows)
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    def _fail(self, entry: Entry[T], err: Exception) -> None:
+        rows, future = entry
+        self.failed_rows += len(rows)
+        logger.error(f"Failed to write {len(rows)} rows: {err}")
+        if future is not None and not future.done():
+            future.set_exception(err)
+
+    def stats(self) -> dict[str, Any]:
+        flushes = self.flushes or 1
+        return {
+            "running": self.running,
+            "pending": self._queue.qsize(),
+            "flushes": self.flushes,
+            "rows": self.rows,
+            "failed_rows": self.failed_rows,
+            "avg_batch_rows": round(self.rows / flushes, 1),
+            "max_batch_rows": self.max_batch_rows,
+            "avg_flush_ms": round(self.flush_seconds * 1000 / flushes, 2),
+            "max_flush_ms": round(self.max_flush_seconds * 1000, 2),
+        }
@@ -1,4 +1,5 @@
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
@@ -13,17 +14,77 @@ AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# A connection of its own for the response buffer's single writer task.
+# Requests in "buffered" mode wait for its flush while holding connections
+# of the main pool, so it must never queue behind them.
+writer_engine = create_async_engine(
+    settings.DATABASE_URL, echo=False, future=True, pool_size=1, max_overflow=0
+)
+
+WriterSessionLocal = async_sessionmaker(
+    writer_engine, class_=AsyncSession, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency function that yields db sessions."""
-    async with AsyncSessionLocal() as session:
+# `Session.info` keys: whether repositories only flush, and what to run once
+# the unit of work commits.
+UNIT_OF_WORK = "unit_of_work"
+AFTER_COMMIT = "after_commit"
+
+
+async def save(session: AsyncSession) -> None:
+    """Flush pending changes, and commit them unless in a unit of work.
+
+    Server-side defaults come back with the flush's RETURNING, so saved
+    objects need no refresh.
+    """
+    await session.flush()
+    if not session.info.get(UNIT_OF_WORK):
+        await session.commit()
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run `callback` once the session's changes are committed.
+
+    That is right away outside a unit of work, where `save` commits. Used
+    for in-process caches, which must not see uncommitted rows.
+    """
+    if session.info.get(UNIT_OF_WORK):
+        session.info.setdefault(AFTER_COMMIT, []).append(callback)
+    else:
+        callback()
+
+
+@asynccontextmanager
+async def unit_of_work(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[AsyncSession]:
+    """A session committed once at the end, or rolled back on error.
+
+    Repositories only flush in it (unless DB_UNIT_OF_WORK is off), so a
+    request is one transaction. Use `session.begin_nested()` for a
+    savepoint around a step that may fail without failing the request.
+    """
+    async with session_factory() as session:
+        session.info[UNIT_OF_WORK] = settings.DB_UNIT_OF_WORK
         try:
             yield session
             await session.commit()
         except Exception:
             await session.rollback()
             raise
-        finally:
-            await session.close()
+        for callback in session.info.pop(AFTER_COMMIT, []):
+            callback()
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency function that yields db sessions."""
+    async with unit_of_work(AsyncSessionLocal) as session:
+        yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for handlers that open their own short-lived sessions."""
+    return AsyncSessionLocal
@@ -0,0 +1,139 @@
+"""In-process map of question IDs to their answers and explanation."""
+
+import sys
+import time
+from typing import Any, Iterable
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.indexes.base import LazyIndex
+from app.middleware.logger import logger
+from app.models.answers import Answer
+from app.models.questions import Question
+
+# (correct_answer_id, explanation, IDs of all the question's answers)
+AnswerKeyEntry = tuple[int | None, str | None, tuple[int, ...]]
+
+LOAD_BATCH_SIZE = 10_000
+
+
+def answer_key_query() -> Select:
+    """One row per question: its ID, correct answer ID, explanation and answer IDs."""
+    return (
+        select(
+            Question.id,
+            func.max(Answer.id).filter(Answer.is_correct == True),
+            Question.explanation,
+            func.array_agg(Answer.id).filter(Answer.id.is_not(None)),
+        )
+        .outerjoin(Answer, Answer.question_id == Question.id)
+        .group_by(Question.id)
+    )
+
+
+class AnswerKeyIndex(LazyIndex):
+    """`question_id -> (correct_answer_id, explanation, answer_ids)` as a dict.
+
+    Holds at most `max_entries` questions (0 = no limit). Questions that are
+    not indexed are looked up in the database by the caller and can be added
+    back with `update`. Writes to questions and answers invalidate the
+    affected entries.
+    """
+
+    def __init__(
+        self, enabled: bool = True, max_entries: int = 0, ttl_seconds: int = 0
+    ) -> None:
+        super().__init__(ttl_seconds)
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self._keys: dict[int, AnswerKeyEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def _full(self) -> bool:
+        return bool(self.max_entries) and len(self._keys) >= self.max_entries
+
+    async def ensure_loaded(self, db_session: AsyncSession) -> None:
+        if self.enabled:
+            await super().ensure_loaded(db_session)
+
+    async def _load(self, db_session: AsyncSession) -> None:
+        started = time.perf_counter()
+        query = answer_key_query().order_by(Question.id)
+        if self.max_entries:
+            query = query.limit(self.max_entries)
+
+        keys = {}
+        result = await db_session.stream(query)
+        async for partition in result.partitions(LOAD_BATCH_SIZE):
+            for question_id, answer_id, explanation, answer_ids in partition:
+                keys[question_id] = (answer_id, explanation, tuple(answer_ids or ()))
+
+        self._keys = keys
+        self._mark_loaded()
+        logger.info(
+            f"Answer key index loaded: {len(keys)} questions, "
+            f"~{self.memory_bytes() / 1024 / 1024:.1f} MiB, "
+            f"took {time.perf_counter() - started:.3f}s"
+        )
+
+    def _reset(self) -> None:
+        self._keys = {}
+
+    def lookup(
+        self, question_ids: Iterable[int]
+    ) -> tuple[dict[int, AnswerKeyEntry], list[int]]:
+        """Split `question_ids` into indexed entries and IDs to look up elsewhere."""
+        found = {}
+        missing = []
+        for question_id in question_ids:
+            entry = self._keys.get(question_id)
+            if entry is None:
+                missing.append(question_id)
+            else:
+                found[question_id] = entry
+        return found, missing
+
+    def update(self, entries: dict[int, AnswerKeyEntry]) -> None:
+        """Add entries read from the database, up to `max_entries`."""
+        if not self.enabled or not self.loaded:
+            return
+        for question_id, entry in entries.items():
+            if question_id not in self._keys and self._full:
+                break
+            self._keys[question_id] = entry
+
+    def discard(self, *question_ids: int | None) -> None:
+        for question_id in question_ids:
+            self._keys.pop(question_id, None)
+
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the index, entries included."""
+        size = sys.getsizeof(self._keys)
+        for question_id, entry in self._keys.items():
+            answer_id, explanation, answer_ids = entry
+            size += sys.getsizeof(question_id) + sys.getsizeof(entry)
+            size += sys.getsizeof(answer_id) + sys.getsizeof(explanation)
+            size += sys.getsizeof(answer_ids)
+            size += sum(sys.getsizeof(answer_id) for answer_id in answer_ids)
+        return size
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "loaded": self.loaded,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+answer_key_index = AnswerKeyIndex(
+    enabled=settings.ANSWER_KEY_INDEX_ENABLED,
+    max_entries=settings.ANSWER_KEY_INDEX_MAX_ENTRIES,
+    ttl_seconds=settings.ANSWER_KEY_INDEX_TTL_SECONDS,
+)
@@ -0,0 +1,65 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class LazyIndex(ABC):
+    """An in-process index loaded from the database on first use.
+
+    With a non-zero `ttl_seconds` the index is reloaded once it gets older
+    than that, which bounds how long changes made by other workers stay
+    invisible to this one.
+    """
+
+    def __init__(self, ttl_seconds: int = 0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _is_fresh(self) -> bool:
+        if self._loaded_at is None:
+            return False
+        if not self.ttl_seconds:
+            return True
+        return time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    def _mark_loaded(self) -> None:
+        self._loaded_at = time.monotonic()
+
+    async def ensure_loaded(self, db_session: AsyncSession) -> None:
+        """Load the index on first use and refresh it once it is stale.
+
+        While a refresh is running other callers keep using the stale data
+        instead of waiting for the reload.
+        """
+        if self._is_fresh() or (self.loaded and self._lock.locked()):
+            return
+
+        async with self._lock:
+            if self._is_fresh():
+                return
+            await self._load(db_session)
+
+    def invalidate(self) -> None:
+        """Drop the index; it is reloaded on next use."""
+        self._loaded_at = None
+        self._reset()
+
+    @abstractmethod
+    async def _load(self, db_session: AsyncSession) -> None:
+        pass
+
+    @abstractmethod
+    def _reset(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        pass
@@ -0,0 +1,164 @@
+"""In-process all-time leaderboard of users ranked by total score."""
+
+import sys
+import time
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.ranking import RankedIntSet
+from app.indexes.base import LazyIndex
+from app.middleware.logger import logger
+from app.models.user import User
+
+LOAD_BATCH_SIZE = 10_000
+
+USER_ID_BITS = 32
+USER_ID_MASK = (1 << USER_ID_BITS) - 1
+
+LeaderboardRow = tuple[int, str, int, int]
+
+
+def rank_key(user_id: int, total_score: int) -> int:
+    """Sort key putting higher scores first and, on ties, lower user IDs."""
+    return (-total_score << USER_ID_BITS) + user_id
+
+
+class Leaderboard(LazyIndex):
+    """Players with at least one game, ordered by `total_score`.
+
+    Each player is one int in a `RankedIntSet`, so top-N, rank and window
+    reads take O(log n) without touching the database. Score writes update
+    it in place; with a TTL it is also reloaded to pick up other workers'
+    writes.
+    """
+
+    def __init__(self, ttl_seconds: int = 0) -> None:
+        super().__init__(ttl_seconds)
+        self._ranking = RankedIntSet()
+        self._users: dict[int, tuple[str, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    async def _load(self, db_session: AsyncSession) -> None:
+        started = time.perf_counter()
+        rows = []
+        result = await db_session.stream(
+            select(User.id, User.username, User.total_score, User.games_played).where(
+                User.games_played > 0
+            )
+        )
+        async for partition in result.partitions(LOAD_BATCH_SIZE):
+            rows.extend(partition)
+
+        self.rebuild(rows)
+        logger.info(
+            f"Leaderboard loaded: {len(self)} players, "
+            f"took {time.perf_counter() - started:.3f}s"
+        )
+
+    def rebuild(self, rows: Iterable[LeaderboardRow]) -> None:
+        """Replace the contents with `(id, username, total_score, games_played)`."""
+        self._users = {
+            user_id: (username, total_score or 0, games_played or 0)
+            for user_id, username, total_score, games_played in rows
+            if games_played
+        }
+        self._ranking = RankedIntSet(
+            rank_key(user_id, total_score)
+            for user_id, (_, total_score, _) in self._users.items()
+        )
+        self._mark_loaded()
+
+    def _reset(self) -> None:
+        self._ranking = RankedIntSet()
+        self._users = {}
+
+    def update(
+        self, user_id: int, username: str, total_score: int, games_played: int
+    ) -> None:
+        """Record a user's current totals."""
+        if not self.loaded:
+            return
+        self.discard(user_id)
+        if games_played:
+            self._users[user_id] = (username, total_score, games_played)
+            self._ranking.add(rank_key(user_id, total_score))
+
+    def discard(self, user_id: int) -> None:
+        entry = self._users.pop(user_id, None)
+        if entry is not None:
+            self._ranking.discard(rank_key(user_id, entry[1]))
+
+    def top(self, n: int) -> list[dict[str, Any]]:
+        return self.window(0, n)
+
+    def rank(self, user_id: int) -> int | None:
+        """1-based position of the user, or None if they have not played."""
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        return self._ranking.rank(rank_key(user_id, entry[1])) + 1
+
+    def around(self, user_id: int, radius: int) -> dict[str, Any]:
+        """The user's rank, percentile and up to `radius` players either side.
+
+        `percentile` is the share of players ranked below the user, counting
+        half of the user's own slot. Users who have not played get no rank.
+        """
+        rank = self.rank(user_id)
+        if rank is None:
+            return {
+                "rank": None,
+                "percentile": None,
+                "players": len(self),
+                "above": [],
+                "me": None,
+                "below": [],
+            }
+        entries = self.window(max(rank - 1 - radius, 0), rank + radius)
+        position = min(rank - 1, radius)
+        return {
+            "rank": rank,
+            "percentile": round((len(self) - rank + 0.5) / len(self) * 100, 2),
+            "players": len(self),
+            "above": entries[:position],
+            "me": entries[position],
+            "below": entries[position + 1 :],
+        }
+
+    def window(self, start: int, stop: int) -> list[dict[str, Any]]:
+        """Entries at 0-based positions `start` to `stop - 1`."""
+        entries = []
+        for position, key in enumerate(self._ranking.slice(start, stop), start + 1):
+            user_id = key & USER_ID_MASK
+            username, total_score, games_played = self._users[user_id]
+            entries.append(
+                {
+                    "rank": position,
+                    "username": username,
+                    "total_score": total_score,
+                    "games_played": games_played,
+                    "avg_score": round(total_score / games_played, 2),
+                }
+            )
+        return entries
+
+    def memory_bytes(self) -> int:
+        size = self._ranking.memory_bytes() + sys.getsizeof(self._users)
+        for entry in self._users.values():
+            size += sys.getsizeof(entry) + sys.getsizeof(entry[0])
+        return size
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "players": len(self),
+            "memory_bytes": self.memory_bytes(),
+        }
+
+
+leaderboard = Leaderboard(ttl_seconds=settings.LEADERBOARD_TTL_SECONDS)
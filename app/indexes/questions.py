@@ -0,0 +1,261 @@
+"""In-process index of question IDs grouped by (category_id, difficulty)."""
+
+import hashlib
+import random
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+from typing import Any, Container, Iterable
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.indexes.base import LazyIndex
+from app.middleware.logger import logger
+from app.models.answers import Answer
+from app.models.categories import Category
+from app.models.questions import Question
+from app.models.quiz import DifficultyLevel
+
+PoolKey = tuple[int | None, DifficultyLevel]
+
+# Persisted markers of the content rendered into quizzes; see `content_query`.
+ContentStamp = tuple[Any, ...]
+
+LOAD_BATCH_SIZE = 10_000
+
+# Random draws per requested question before falling back to a pool scan.
+EXCLUSION_OVERSAMPLING = 4
+
+
+def pool_sort_key(key: PoolKey) -> tuple[bool, int, str]:
+    category_id, difficulty = key
+    return category_id is None, category_id or 0, difficulty.value
+
+
+def content_query() -> Select:
+    """When questions, answers and categories last changed, and how many answers.
+
+    Every edit sets `updated_at`, and inserts and deletes move the pools or
+    the answer count, so any change to rendered quizzes changes this row.
+    """
+
+    def last_change(model: Any) -> Any:
+        return (
+            select(func.max(func.coalesce(model.updated_at, model.created_at)))
+            .select_from(model)
+            .scalar_subquery()
+        )
+
+    return select(
+        last_change(Question),
+        last_change(Answer),
+        last_change(Category),
+        select(func.count(Answer.id)).scalar_subquery(),
+    )
+
+
+class QuestionIndex(LazyIndex):
+    """Sorted arrays of question IDs, one per (category_id, difficulty) pool.
+
+    Sampling picks positions across the matching pools instead of loading
+    the pools themselves, so its cost depends on the number of questions
+    requested, not on the size of the question bank.
+
+    `version` changes whenever the indexed questions, or content rendered
+    into quizzes, may have changed; it keys caches of generated quizzes.
+    It is a digest of the pools and of the persisted `content_query` stamp,
+    so workers holding the same bank agree on it and reloading an
+    unchanged bank keeps it. It is computed when read after a change.
+    """
+
+    def __init__(self, ttl_seconds: int = 0) -> None:
+        super().__init__(ttl_seconds)
+        self._pools: dict[PoolKey, array] = {}
+        self._content: ContentStamp | None = None
+        self._version: str | None = None
+
+    def __len__(self) -> int:
+        return sum(len(pool) for pool in self._pools.values())
+
+    async def _load(self, db_session: AsyncSession) -> None:
+        started = time.perf_counter()
+        rows = []
+        result = await db_session.stream(
+            select(Question.id, Question.category_id, Question.difficulty).order_by(
+                Question.id
+            )
+        )
+        async for partition in result.partitions(LOAD_BATCH_SIZE):
+            rows.extend(partition)
+        content = (await db_session.execute(content_query())).one()
+
+        self.rebuild(rows, tuple(content))
+        logger.info(
+            f"Question index loaded: {len(self)} questions in {len(self._pools)} "
+            f"pools, took {time.perf_counter() - started:.3f}s"
+        )
+
+    def rebuild(
+        self,
+        rows: Iterable[tuple[int, int | None, DifficultyLevel]],
+        content: ContentStamp | None = None,
+    ) -> None:
+        """Replace the index contents with `(id, category_id, difficulty)` rows."""
+        pools: dict[PoolKey, array] = {}
+        for question_id, category_id, difficulty in rows:
+            pools.setdefault((category_id, difficulty), array("q")).append(question_id)
+
+        self._pools = {key: array("q", sorted(pool)) for key, pool in pools.items()}
+        self._content = content
+        self._version = None
+        self._mark_loaded()
+
+    def _reset(self) -> None:
+        self._pools = {}
+        self._content = None
+        self._version = None
+
+    def touch(self) -> None:
+        """Record a change to the question bank made through this worker.
+
+        The content stamp is read again before the next `current_version`,
+        so the version matches what other workers load.
+        """
+        self._content = None
+        self._version = None
+
+    async def current_version(self, db_session: AsyncSession) -> str:
+        """`version`, loading the index and a stale content stamp first."""
+        await self.ensure_loaded(db_session)
+        if self._content is None:
+            self._content = tuple((await db_session.execute(content_query())).one())
+            self._version = None
+        return self.version
+
+    @property
+    def version(self) -> str:
+        if self._version is None:
+            digest = hashlib.blake2b(digest_size=8)
+            for key in sorted(self._pools, key=pool_sort_key):
+                pool = self._pools[key]
+                if pool:
+                    category_id, difficulty = key
+                    digest.update(f"{category_id}:{difficulty.value}:".encode())
+                    digest.update(pool.tobytes())
+            digest.update(repr(self._content).encode())
+            self._version = digest.hexdigest()
+        return self._version
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "questions": len(self),
+            "pools": len(self._pools),
+            "version": self.version,
+            "memory_bytes": sys.getsizeof(self._pools)
+            + sum(sys.getsizeof(pool) for pool in self._pools.values()),
+        }
+
+    def add(
+        self, question_id: int, category_id: int | None, difficulty: DifficultyLevel
+    ) -> None:
+        if not self.loaded:
+            return
+        insort(
+            self._pools.setdefault((category_id, difficulty), array("q")), question_id
+        )
+        self.touch()
+
+    def discard(self, question_id: int) -> None:
+        if not self.loaded:
+            return
+        for pool in self._pools.values():
+            position = bisect_left(pool, question_id)
+            if position < len(pool) and pool[position] == question_id:
+                del pool[position]
+                self.touch()
+                return
+
+    def _matching_pools(
+        self, category_id: int | None, difficulty: DifficultyLevel | None
+    ) -> list[array]:
+        # Pools are visited in key order, not insertion order, so a seeded
+        # `rng` picks the same questions in every worker.
+        return [
+            self._pools[key]
+            for key in sorted(self._pools, key=pool_sort_key)
+            if self._pools[key]
+            and (category_id is None or key[0] == category_id)
+            and (difficulty is None or key[1] == difficulty)
+        ]
+
+    def sample(
+        self,
+        k: int,
+        category_id: int | None = None,
+        difficulty: DifficultyLevel | None = None,
+        rng: random.Random | None = None,
+        exclude: Container[int] | None = None,
+        fill_with_excluded: bool = False,
+    ) -> list[int]:
+        """Pick up to `k` distinct question IDs uniformly from the matching pools.
+
+        IDs in `exclude` are skipped by rejection sampling, which stays O(k)
+        while most of the pool is not excluded. Once it cannot find enough
+        IDs that way the pools are scanned for the remaining ones. With
+        `fill_with_excluded`, a shortfall is topped up with excluded IDs, so
+        those only come after every other question.
+        """
+        rng = rng or random
+        pools = self._matching_pools(category_id, difficulty)
+        offsets = list(accumulate(len(pool) for pool in pools))
+        total = offsets[-1] if offsets else 0
+        if total == 0 or k <= 0:
+            return []
+
+        def at(position: int) -> int:
+            pool_number = bisect_right(offsets, position)
+            start = offsets[pool_number - 1] if pool_number else 0
+            return pools[pool_number][position - start]
+
+        if not exclude:
+            return [
+                at(position) for position in rng.sample(range(total), min(k, total))
+            ]
+
+        attempts = min(total, k * EXCLUSION_OVERSAMPLING)
+        question_ids = []
+        for position in rng.sample(range(total), attempts):
+            question_id = at(position)
+            if question_id not in exclude:
+                question_ids.append(question_id)
+                if len(question_ids) == k:
+                    return question_ids
+
+        if attempts < total:
+            unseen = [
+                question_id
+                for pool in pools
+                for question_id in pool
+                if question_id not in exclude
+            ]
+            question_ids = rng.sample(unseen, min(k, len(unseen)))
+
+        if fill_with_excluded and len(question_ids) < k:
+            excluded = [
+                question_id
+                for pool in pools
+                for question_id in pool
+                if question_id in exclude
+            ]
+            question_ids += rng.sample(
+                excluded, min(k - len(question_ids), len(excluded))
+            )
+        return question_ids
+
+
+question_index = QuestionIndex(ttl_seconds=settings.QUESTION_INDEX_TTL_SECONDS)
@@ -0,0 +1,61 @@
+"""Per-user sets of already answered questions, kept as compressed bitmaps."""
+
+from typing import Any, Iterable
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.bitmap import CompactBitmap
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user_responses import UserResponse
+
+
+class SeenQuestionStore:
+    """Bounded cache of `user_id -> CompactBitmap` of answered question IDs.
+
+    A user's bitmap is built from `user_responses` on first use and then kept
+    up to date by the writers of new responses, so checking whether a
+    question was seen is O(1) regardless of the user's history.
+    """
+
+    def __init__(self, max_users: int, ttl_seconds: int) -> None:
+        self._cache: TTLCache[int, CompactBitmap] = TTLCache(max_users, ttl_seconds)
+
+    async def get(self, db_session: AsyncSession, user_id: int) -> CompactBitmap:
+        seen = self._cache.get(user_id)
+        if seen is None:
+            result = await db_session.stream_scalars(
+                select(UserResponse.question_id)
+                .where(
+                    UserResponse.user_id == user_id,
+                    UserResponse.question_id.is_not(None),
+                )
+                .distinct()
+            )
+            seen = CompactBitmap()
+            async for question_id in result:
+                seen.add(question_id)
+            self._cache.set(user_id, seen)
+        return seen
+
+    def mark(self, user_id: int, question_ids: Iterable[int]) -> None:
+        """Record newly answered questions for a cached user."""
+        seen = self._cache.peek(user_id)
+        if seen is not None:
+            seen.update(question_ids)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "memory_bytes": sum(seen.memory_bytes() for seen in self._cache.values()),
+        }
+
+
+seen_questions = SeenQuestionStore(
+    max_users=settings.SEEN_QUESTIONS_MAX_USERS,
+    ttl_seconds=settings.SEEN_QUESTIONS_TTL_SECONDS,
+)
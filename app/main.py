@@ -1,14 +1,34 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 import uvicorn
 
 from app.api import api_router
 from app.core.config import settings
-from app.database import engine, Base
+from app.core.password_hasher import PasswordHasherBusy, password_hasher
+from app.database import (
+    AsyncSessionLocal,
+    Base,
+    WriterSessionLocal,
+    engine,
+    writer_engine,
+)
+from app.indexes.leaderboard import leaderboard
 from app.middleware.logger import SimpleLoggingMiddleware
 from app.middleware.logger import logger
+from app.repositories import RepositoryFactory
+from app.repositories.user_response_repository import (
+    response_buffer,
+    start_response_buffer,
+)
+from app.services.response_partition_service import (
+    maintain_response_partitions_periodically,
+)
+from app.services.score_bucket_service import purge_score_buckets_periodically
+from app.services.token_service import TokenService, sync_revoked_tokens_periodically
 
 
 @asynccontextmanager
@@ -20,13 +40,49 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    async with AsyncSessionLocal() as db:
+        await leaderboard.ensure_loaded(db)
+        if settings.TOKEN_REVOCATION_PERSIST:
+            await TokenService(RepositoryFactory(db)).load_revocations()
+
     # async with AsyncSessionLocal() as db:
     #     await seed_database(db)
 
+    if settings.RESPONSE_WRITE_MODE != "direct":
+        start_response_buffer(WriterSessionLocal)
+
+    background_tasks = [
+        asyncio.create_task(
+            maintain_response_partitions_periodically(
+                AsyncSessionLocal, settings.USER_RESPONSES_MAINTENANCE_INTERVAL_SECONDS
+            )
+        ),
+        asyncio.create_task(
+            purge_score_buckets_periodically(
+                AsyncSessionLocal, settings.SCORE_BUCKET_PURGE_INTERVAL_SECONDS
+            )
+        ),
+    ]
+    if settings.TOKEN_REVOCATION_PERSIST:
+        background_tasks.append(
+            asyncio.create_task(
+                sync_revoked_tokens_periodically(
+                    AsyncSessionLocal, settings.TOKEN_REVOCATION_SYNC_SECONDS
+                )
+            )
+        )
+
     yield
 
     logger.info("Shutting down...")
+    await response_buffer.stop()
+    password_hasher.shutdown()
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
     await engine.dispose()
+    await writer_engine.dispose()
 
 
 app = FastAPI(
@@ -42,12 +98,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Read by browser clients of POST /quiz/generate.
+    expose_headers=["X-Quiz-Session-Id", "ETag"],
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 app.add_middleware(SimpleLoggingMiddleware)
 
 
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "1"}
+    )
+
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to IT Quiz API", "docs": "/docs", "redoc": "/redoc"}
@@ -4,6 +4,25 @@ from app.models.questions import Question
 from app.models.answers import Answer
 from app.models.user_responses import UserResponse
 from app.models.categories import Category
+from app.models.cards import Card
+from app.models.score_buckets import ScoreBucket
+from app.models.category_scores import CategoryScore
+from app.models.question_stats import QuestionStats
+from app.models.response_rollups import ResponseRollup
+from app.models.revoked_tokens import RevokedToken
 
 
-__all__ = ["User", "Question", "Answer", "UserResponse", "Category", "DifficultyLevel"]
+__all__ = [
+    "User",
+    "Question",
+    "Answer",
+    "UserResponse",
+    "Category",
+    "Card",
+    "ScoreBucket",
+    "CategoryScore",
+    "QuestionStats",
+    "ResponseRollup",
+    "RevokedToken",
+    "DifficultyLevel",
+]
@@ -5,6 +5,9 @@ from app.database import Base
 
 class BaseModel(Base):
     __abstract__ = True
+    # Fetch server defaults with INSERT/UPDATE ... RETURNING instead of a
+    # refresh SELECT.
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,39 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+from sqlalchemy.orm import relationship
+
+from app.core.spaced_repetition import DEFAULT_EASE_FACTOR
+from app.models.base import BaseModel
+
+
+class Card(BaseModel):
+    """Spaced repetition state of one question for one user."""
+
+    __tablename__ = "cards"
+    __table_args__ = (
+        UniqueConstraint("user_id", "question_id", name="uq_cards_user_question"),
+        # Serves the "next due" queue as an index range scan.
+        Index("ix_cards_user_due_at", "user_id", "due_at"),
+    )
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    question_id = Column(
+        Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False
+    )
+    repetitions = Column(Integer, default=0, nullable=False)
+    interval_days = Column(Integer, default=0, nullable=False)
+    ease_factor = Column(Float, default=DEFAULT_EASE_FACTOR, nullable=False)
+    lapses = Column(Integer, default=0, nullable=False)
+    due_at = Column(DateTime(timezone=True), nullable=False)
+    last_reviewed_at = Column(DateTime(timezone=True), nullable=True)
+
+    question = relationship("Question")
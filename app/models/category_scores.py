@@ -0,0 +1,53 @@
+from sqlalchemy import (
+    Column,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+
+from app.models.base import BaseModel
+from app.models.quiz import DifficultyLevel
+
+
+class CategoryScore(BaseModel):
+    """A user's answers within one category and/or difficulty.
+
+    A NULL `category_id` or `difficulty` means "any": every response counts
+    towards its (category, difficulty), (category, any), (any, difficulty)
+    and (any, any) rows, so each scoped leaderboard is a single index range
+    scan and a user's stats are the handful of rows under their user ID.
+    Uncategorized questions only count towards the "any category" rows.
+    """
+
+    __tablename__ = "category_scores"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "category_id",
+            "difficulty",
+            name="uq_category_scores_user_scope",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    category_id = Column(
+        Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=True
+    )
+    difficulty = Column(Enum(DifficultyLevel), nullable=True)
+    answered = Column(Integer, default=0, nullable=False)
+    correct = Column(Integer, default=0, nullable=False)
+
+
+# Top-N of a scope, ties to the lower user ID, is a range scan of this index.
+Index(
+    "ix_category_scores_ranking",
+    CategoryScore.category_id,
+    CategoryScore.difficulty,
+    CategoryScore.correct.desc(),
+    CategoryScore.user_id,
+)
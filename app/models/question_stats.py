@@ -0,0 +1,22 @@
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer
+
+from app.models.base import BaseModel
+
+
+class QuestionStats(BaseModel):
+    """Measured difficulty of a question, written by the calibration job."""
+
+    __tablename__ = "question_stats"
+
+    question_id = Column(
+        Integer,
+        ForeignKey("questions.id", ondelete="CASCADE"),
+        unique=True,
+        nullable=False,
+    )
+    responses = Column(Integer, nullable=False)
+    correct = Column(Integer, nullable=False)
+    p_value = Column(Float, nullable=False)
+    discrimination = Column(Float, nullable=True)
+    irt_difficulty = Column(Float, nullable=True)
+    calibrated_at = Column(DateTime(timezone=True), nullable=False)
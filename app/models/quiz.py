@@ -6,3 +6,9 @@ class DifficultyLevel(str, enum.Enum):
     MEDIUM = "Medium"
     HARD = "Hard"
     VERY_HARD = "Very Hard"
+
+
+class LeaderboardPeriod(str, enum.Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
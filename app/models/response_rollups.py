@@ -0,0 +1,42 @@
+from sqlalchemy import (
+    Column,
+    Date,
+    Enum,
+    ForeignKey,
+    Integer,
+    UniqueConstraint,
+)
+
+from app.models.base import BaseModel
+from app.models.quiz import DifficultyLevel
+
+
+class ResponseRollup(BaseModel):
+    """A user's answers per category and difficulty in a retired month.
+
+    Written when a monthly `user_responses` partition is detached or
+    dropped, so rollups rebuilt from responses still count it.
+    """
+
+    __tablename__ = "response_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "month",
+            "category_id",
+            "difficulty",
+            name="uq_response_rollups_user_month_scope",
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    month = Column(Date, nullable=False)
+    category_id = Column(
+        Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=True
+    )
+    difficulty = Column(Enum(DifficultyLevel), nullable=False)
+    answered = Column(Integer, nullable=False)
+    correct = Column(Integer, nullable=False)
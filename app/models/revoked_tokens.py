@@ -0,0 +1,12 @@
+from sqlalchemy import Column, DateTime, String
+
+from app.models.base import BaseModel
+
+
+class RevokedToken(BaseModel):
+    """A logged out bearer token, denied until it expires."""
+
+    __tablename__ = "revoked_tokens"
+
+    digest = Column(String(64), unique=True, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
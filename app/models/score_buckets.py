@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    Column,
+    Date,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
+
+from app.models.base import BaseModel
+from app.models.quiz import LeaderboardPeriod
+
+
+class ScoreBucket(BaseModel):
+    """A user's score and games within one day, ISO week or month (UTC)."""
+
+    __tablename__ = "score_buckets"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id", "period", "period_start", name="uq_score_buckets_user_period"
+        ),
+    )
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    period = Column(Enum(LeaderboardPeriod), nullable=False)
+    period_start = Column(Date, nullable=False)
+    score = Column(Integer, default=0, nullable=False)
+    games_played = Column(Integer, default=0, nullable=False)
+
+
+# Top-N of a period, ties to the lower user ID, is a range scan of this index.
+Index(
+    "ix_score_buckets_ranking",
+    ScoreBucket.period,
+    ScoreBucket.period_start,
+    ScoreBucket.score.desc(),
+    ScoreBucket.user_id,
+)
@@ -1,12 +1,42 @@
-from sqlalchemy import Column, String, Integer, Boolean, ForeignKey, Text, Enum
+from sqlalchemy import (
+    DDL,
+    Column,
+    DateTime,
+    String,
+    Integer,
+    Boolean,
+    ForeignKey,
+    Text,
+    Enum,
+    Index,
+    event,
+)
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.models.base import BaseModel
 
 
 class UserResponse(BaseModel):
+    """An answer to a question.
+
+    The table is partitioned by month of `created_at`, so `created_at` is
+    part of the primary key. Monthly partitions are created and retired by
+    `ResponsePartitionService`; rows outside them land in
+    `user_responses_default`.
+    """
+
     __tablename__ = "user_responses"
+    __table_args__ = (
+        # Keyset pagination of a user's history, newest first.
+        Index("ix_user_responses_user_created_at_id", "user_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
+    created_at = Column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
     user_id = Column(Integer, ForeignKey("users.id"))
     question_id = Column(Integer, ForeignKey("questions.id"))
     answer_id = Column(Integer, ForeignKey("answers.id"))
@@ -15,3 +45,10 @@ class UserResponse(BaseModel):
     user = relationship("User", back_populates="responses")
     question = relationship("Question", back_populates="user_responses")
     answer = relationship("Answer")
+
+
+event.listen(
+    UserResponse.__table__,
+    "after_create",
+    DDL("CREATE TABLE user_responses_default PARTITION OF user_responses DEFAULT"),
+)
@@ -4,6 +4,14 @@ from app.repositories.question_repository import QuestionRepository
 from app.repositories.answer_repository import AnswerRepository
 from app.repositories.user_response_repository import UserResponseRepository
 from app.repositories.category_repository import CategoryRepository
+from app.repositories.card_repository import CardRepository
+from app.repositories.score_bucket_repository import ScoreBucketRepository
+from app.repositories.category_score_repository import CategoryScoreRepository
+from app.repositories.question_stats_repository import QuestionStatsRepository
+from app.repositories.revoked_token_repository import RevokedTokenRepository
+from app.repositories.response_partition_repository import (
+    ResponsePartitionRepository,
+)
 
 
 class RepositoryFactory:
@@ -29,3 +37,27 @@ class RepositoryFactory:
     @property
     def categories(self) -> CategoryRepository:
         return CategoryRepository(self.db_session)
+
+    @property
+    def cards(self) -> CardRepository:
+        return CardRepository(self.db_session)
+
+    @property
+    def score_buckets(self) -> ScoreBucketRepository:
+        return ScoreBucketRepository(self.db_session)
+
+    @property
+    def category_scores(self) -> CategoryScoreRepository:
+        return CategoryScoreRepository(self.db_session)
+
+    @property
+    def question_stats(self) -> QuestionStatsRepository:
+        return QuestionStatsRepository(self.db_session)
+
+    @property
+    def response_partitions(self) -> ResponsePartitionRepository:
+        return ResponsePartitionRepository(self.db_session)
+
+    @property
+    def revoked_tokens(self) -> RevokedTokenRepository:
+        return RevokedTokenRepository(self.db_session)
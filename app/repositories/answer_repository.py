@@ -1,7 +1,10 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, select
 
+from app.database import after_commit, save
+from app.indexes.answer_keys import answer_key_index
+from app.indexes.questions import question_index
 from app.models.answers import Answer
 from app.repositories.base import SQLAlchemyRepository
 from app.schemas.answers import AnswerCreate, AnswerUpdate
@@ -26,7 +29,6 @@ class AnswerRepository(SQLAlchemyRepository[Answer, AnswerCreate, AnswerUpdate])
         self,
         obj_in: AnswerCreate,
     ) -> Answer:
-
         correct_answers = (
             await self.count_true_answer_for_question(obj_in.question_id)
             + obj_in.is_correct
@@ -37,16 +39,17 @@ class AnswerRepository(SQLAlchemyRepository[Answer, AnswerCreate, AnswerUpdate])
                 message="More than 1 correct answers.", status_code=409
             )
 
+        db_obj = self.model(**obj_in.model_dump())
         try:
-            db_obj = self.model(**obj_in.model_dump())
-            self.db_session.add(db_obj)
-            await self.db_session.commit()
-            await self.db_session.refresh(db_obj)
-            return db_obj
+            # Only the savepoint is rolled back if the insert fails.
+            async with self.db_session.begin_nested():
+                self.db_session.add(db_obj)
         except IntegrityError as e:
-            await self.db_session.rollback()
             error = parse_error_message(e)
             raise error
+        await save(self.db_session)
+        self._reindex(db_obj.question_id)
+        return db_obj
 
     async def update(self, id: int, obj_in: AnswerUpdate) -> Answer:
         correct_answers = (
@@ -57,4 +60,30 @@ class AnswerRepository(SQLAlchemyRepository[Answer, AnswerCreate, AnswerUpdate])
             raise DatabaseException(
                 message="More than 1 correct answers.", status_code=409
             )
-        return await super().update(id, obj_in)
+        previous_question_id = await self.db_session.scalar(
+            select(Answer.question_id).where(Answer.id == id)
+        )
+        updated_answer = await super().update(id, obj_in)
+        if updated_answer:
+            self._reindex(previous_question_id, updated_answer.question_id)
+        return updated_answer
+
+    async def delete(self, id: int) -> bool:
+        result = await self.db_session.execute(
+            delete(Answer).where(Answer.id == id).returning(Answer.question_id)
+        )
+        question_id = result.scalar_one_or_none()
+        await save(self.db_session)
+        if question_id is None:
+            return False
+        self._reindex(question_id)
+        return True
+
+    def _reindex(self, *question_ids: int | None) -> None:
+        """Drop the questions' answer keys and cached quizzes after commit."""
+
+        def reindex() -> None:
+            answer_key_index.discard(*question_ids)
+            question_index.touch()
+
+        after_commit(self.db_session, reindex)
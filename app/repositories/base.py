@@ -6,6 +6,12 @@ from sqlalchemy import select, update, delete
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy import func
 
+from app.database import save
+
+
+# For UPDATE ... RETURNING(model): load the returned row into the object,
+# even one already in the session, instead of refreshing it afterwards.
+REFRESH_FROM_RETURNING = {"populate_existing": True, "synchronize_session": False}
 
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType")
@@ -46,8 +52,7 @@ class SQLAlchemyRepository(
     async def create(self, obj_in: CreateSchemaType) -> ModelType:
         db_obj = self.model(**obj_in.dict())
         self.db_session.add(db_obj)
-        await self.db_session.commit()
-        await self.db_session.refresh(db_obj)
+        await save(self.db_session)
         return db_obj
 
     async def get(self, id: int) -> Optional[ModelType]:
@@ -80,21 +85,18 @@ class SQLAlchemyRepository(
             .where(self.model.id == id)
             .values(**update_data)
             .returning(self.model)
+            .execution_options(**REFRESH_FROM_RETURNING)
         )
 
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
-
         updated_obj = result.scalar_one_or_none()
-        if updated_obj:
-            await self.db_session.refresh(updated_obj)
-
+        await save(self.db_session)
         return updated_obj
 
     async def delete(self, id: int) -> bool:
         stmt = delete(self.model).where(self.model.id == id)
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
+        await save(self.db_session)
         return result.rowcount > 0
 
     async def count(self, **filters) -> int:
@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import case, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.spaced_repetition import DEFAULT_EASE_FACTOR, CardState
+from app.database import save
+from app.models.cards import Card
+from app.models.user_responses import UserResponse
+
+
+class CardRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.model = Card
+
+    async def get(self, user_id: int, question_id: int) -> Optional[Card]:
+        result = await self.db_session.execute(
+            select(Card).where(Card.user_id == user_id, Card.question_id == question_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_due(self, user_id: int, now: datetime, limit: int) -> List[Card]:
+        """The `limit` cards that have been due the longest.
+
+        Reads a range of the `(user_id, due_at)` index, so the cost depends on
+        `limit` and not on how many cards the user has.
+        """
+        result = await self.db_session.execute(
+            select(Card)
+            .options(selectinload(Card.question))
+            .where(Card.user_id == user_id, Card.due_at <= now)
+            .order_by(Card.due_at)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def save_review(
+        self,
+        user_id: int,
+        question_id: int,
+        state: CardState,
+        due_at: datetime,
+        reviewed_at: datetime,
+    ) -> None:
+        """Store the schedule after a review with a single upsert."""
+        values = {
+            "repetitions": state.repetitions,
+            "interval_days": state.interval_days,
+            "ease_factor": state.ease_factor,
+            "lapses": state.lapses,
+            "due_at": due_at,
+            "last_reviewed_at": reviewed_at,
+        }
+        stmt = insert(Card).values(user_id=user_id, question_id=question_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_cards_user_question", set_=values
+        )
+        await self.db_session.execute(stmt)
+        await save(self.db_session)
+
+    async def import_responses(self, user_id: int, now: datetime) -> int:
+        """Create cards for every question the user has answered.
+
+        Questions answered wrong at least once are due now; the others are due
+        a day after they were last answered. Existing cards are kept.
+        """
+        last_answered_at = func.max(UserResponse.created_at)
+        due_at = case(
+            (
+                func.bool_and(UserResponse.is_correct),
+                last_answered_at + timedelta(days=1),
+            ),
+            else_=literal(now),
+        )
+        lapses = func.count().filter(UserResponse.is_correct == False)
+        history = (
+            select(
+                UserResponse.user_id,
+                UserResponse.question_id,
+                literal(0),
+                literal(0),
+                literal(DEFAULT_EASE_FACTOR),
+                lapses,
+                due_at,
+                last_answered_at,
+            )
+            .where(
+                UserResponse.user_id == user_id,
+                UserResponse.question_id.is_not(None),
+            )
+            .group_by(UserResponse.user_id, UserResponse.question_id)
+        )
+        stmt = (
+            insert(Card)
+            .from_select(
+                [
+                    "user_id",
+                    "question_id",
+                    "repetitions",
+                    "interval_days",
+                    "ease_factor",
+                    "lapses",
+                    "due_at",
+                    "last_reviewed_at",
+                ],
+                history,
+            )
+            .on_conflict_do_nothing(constraint="uq_cards_user_question")
+        )
+        result = await self.db_session.execute(stmt)
+        await save(self.db_session)
+        return result.rowcount
@@ -4,8 +4,11 @@ from sqlalchemy.exc import IntegrityError
 
 from app.models.categories import Category
 from app.schemas.categories import CategoryCreate, CategoryUpdate
+from app.database import after_commit, save
 from app.repositories.base import SQLAlchemyRepository
 from app.shared.exceptions.database import parse_error_message
+from app.indexes.answer_keys import answer_key_index
+from app.indexes.questions import question_index
 
 
 class CategoryRepository(
@@ -19,13 +22,32 @@ class CategoryRepository(
         return result.scalars().all()
 
     async def create(self, category: CategoryCreate) -> Category:
+        new_category = Category(category=category.category)
         try:
-            new_category = Category(category=category.category)
-            self.db_session.add(new_category)
-            await self.db_session.commit()
-            await self.db_session.refresh(new_category)
-            return new_category
+            # Only the savepoint is rolled back if the insert fails.
+            async with self.db_session.begin_nested():
+                self.db_session.add(new_category)
         except IntegrityError as e:
-            await self.db_session.rollback()
             error = parse_error_message(e)
             raise error
+        await save(self.db_session)
+        return new_category
+
+    async def update(self, id: int, obj_in: CategoryUpdate) -> Category | None:
+        updated_category = await super().update(id, obj_in)
+        if updated_category:
+            # Category names are part of generated quizzes.
+            after_commit(self.db_session, question_index.touch)
+        return updated_category
+
+    async def delete(self, id: int) -> bool:
+        deleted = await super().delete(id)
+        if deleted:
+            # Questions of the category are removed by the FK cascade.
+
+            def invalidate() -> None:
+                answer_key_index.invalidate()
+                question_index.invalidate()
+
+            after_commit(self.db_session, invalidate)
+        return deleted
@@ -0,0 +1,242 @@
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    Integer,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.categories import Category
+from app.models.category_scores import CategoryScore
+from app.models.questions import Question
+from app.models.quiz import DifficultyLevel
+from app.models.response_rollups import ResponseRollup
+from app.models.user import User
+from app.models.user_responses import UserResponse
+
+Scope = tuple[int, Optional[int], Optional[DifficultyLevel]]
+
+
+def _scope_order(scope: Scope) -> tuple[Any, ...]:
+    """Total order over scopes, placing the None ("all") parts first."""
+    user_id, category_id, difficulty = scope
+    return (
+        user_id,
+        category_id is not None,
+        category_id or 0,
+        difficulty is not None,
+        difficulty or "",
+    )
+
+
+class CategoryScoreRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.model = CategoryScore
+
+    async def add_responses(self, responses: List[Dict[str, Any]]) -> None:
+        """Count responses towards every category and difficulty scope they fall in.
+
+        Reads the submitted questions by primary key and writes one
+        multi-row upsert. The rows are not committed here; they become part
+        of the caller's transaction.
+        """
+        if not responses:
+            return
+        result = await self.db_session.execute(
+            select(Question.id, Question.category_id, Question.difficulty).where(
+                Question.id.in_({response["question_id"] for response in responses})
+            )
+        )
+        questions = {row.id: (row.category_id, row.difficulty) for row in result}
+
+        rows: Dict[Scope, Dict[str, Any]] = {}
+        for response in responses:
+            if response["question_id"] not in questions:
+                continue
+            category_id, difficulty = questions[response["question_id"]]
+            scopes = [(None, None), (None, difficulty)]
+            if category_id is not None:
+                scopes += [(category_id, difficulty), (category_id, None)]
+            for category_id, difficulty in scopes:
+                row = rows.setdefault(
+                    (response["user_id"], category_id, difficulty),
+                    {
+                        "user_id": response["user_id"],
+                        "category_id": category_id,
+                        "difficulty": difficulty,
+                        "answered": 0,
+                        "correct": 0,
+                    },
+                )
+                row["answered"] += 1
+                row["correct"] += bool(response["is_correct"])
+        if not rows:
+            return
+
+        # Concurrent upserts lock the conflicting rows in VALUES order, so
+        # every writer goes through the scopes in the same order to avoid
+        # deadlocking on the rows they share.
+        stmt = insert(CategoryScore).values(
+            [rows[scope] for scope in sorted(rows, key=_scope_order)]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_category_scores_user_scope",
+            set_={
+                "answered": CategoryScore.answered + stmt.excluded.answered,
+                "correct": CategoryScore.correct + stmt.excluded.correct,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db_session.execute(stmt)
+
+    async def get_user_stats(self, user_id: int) -> Dict[str, Any]:
+        """Totals and per category and difficulty accuracy, from one query."""
+        result = await self.db_session.execute(
+            select(
+                CategoryScore.category_id,
+                Category.category,
+                CategoryScore.difficulty,
+                CategoryScore.answered,
+                CategoryScore.correct,
+            )
+            .outerjoin(Category, Category.id == CategoryScore.category_id)
+            .where(CategoryScore.user_id == user_id)
+        )
+
+        def summary(answered: int, correct: int) -> Dict[str, Any]:
+            return {
+                "total": answered,
+                "correct": correct,
+                "accuracy": correct / answered * 100 if answered > 0 else 0,
+            }
+
+        total_answers = correct_answers = 0
+        by_category = {}
+        by_difficulty = {}
+        for row in result:
+            if row.category_id is None and row.difficulty is None:
+                total_answers, correct_answers = row.answered, row.correct
+            elif row.difficulty is None:
+                by_category[row.category] = summary(row.answered, row.correct)
+            elif row.category_id is None:
+                by_difficulty[row.difficulty.value] = summary(row.answered, row.correct)
+
+        return {
+            "total_answers": total_answers,
+            "correct_answers": correct_answers,
+            "accuracy": (
+                (correct_answers / total_answers * 100) if total_answers > 0 else 0
+            ),
+            "by_category": by_category,
+            "by_difficulty": by_difficulty,
+        }
+
+    async def rebuild(self, user_ids: Optional[List[int]] = None) -> int:
+        """Recompute the scores of `user_ids`, or everyone, from raw answers.
+
+        Counts `user_responses` plus the rollups of retired months. One
+        DELETE and one INSERT ... SELECT whose GROUPING SETS produce all four
+        scopes in a single pass, committed together. Returns the number of
+        rows written.
+        """
+        responses = (
+            select(
+                UserResponse.user_id,
+                Question.category_id,
+                Question.difficulty,
+                literal(1).label("answered"),
+                cast(UserResponse.is_correct, Integer).label("correct"),
+            )
+            .join(Question, Question.id == UserResponse.question_id)
+            .where(UserResponse.user_id.is_not(None))
+        )
+        rollups = select(
+            ResponseRollup.user_id,
+            ResponseRollup.category_id,
+            ResponseRollup.difficulty,
+            ResponseRollup.answered,
+            ResponseRollup.correct,
+        )
+        delete_stmt = delete(CategoryScore)
+        if user_ids is not None:
+            responses = responses.where(UserResponse.user_id.in_(user_ids))
+            rollups = rollups.where(ResponseRollup.user_id.in_(user_ids))
+            delete_stmt = delete_stmt.where(CategoryScore.user_id.in_(user_ids))
+
+        answers = union_all(responses, rollups).subquery()
+        user_id, category_id = answers.c.user_id, answers.c.category_id
+        difficulty = answers.c.difficulty
+        source = (
+            select(
+                user_id,
+                category_id,
+                difficulty,
+                func.sum(answers.c.answered),
+                func.sum(answers.c.correct),
+            ).group_by(
+                func.grouping_sets(
+                    tuple_(user_id, category_id, difficulty),
+                    tuple_(user_id, category_id),
+                    tuple_(user_id, difficulty),
+                    tuple_(user_id),
+                )
+            )
+            # Uncategorized questions only count towards "any category".
+            .having(or_(func.grouping(category_id) == 1, category_id.is_not(None)))
+        )
+
+        await self.db_session.execute(delete_stmt)
+        result = await self.db_session.execute(
+            insert(CategoryScore).from_select(
+                ["user_id", "category_id", "difficulty", "answered", "correct"],
+                source,
+            )
+        )
+        await self.db_session.commit()
+        return result.rowcount
+
+    async def get_leaderboard(
+        self,
+        category_id: Optional[int] = None,
+        difficulty: Optional[DifficultyLevel] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Players with the most correct answers in a category and/or difficulty.
+
+        Ties go to the lower user ID. Without `category_id` and `difficulty`
+        this ranks all correct answers; the all-time board by quiz score
+        lives on `users`.
+        """
+        result = await self.db_session.execute(
+            select(User.username, CategoryScore.answered, CategoryScore.correct)
+            .join(User, User.id == CategoryScore.user_id)
+            .where(
+                CategoryScore.category_id.is_(None)
+                if category_id is None
+                else CategoryScore.category_id == category_id,
+                CategoryScore.difficulty.is_(None)
+                if difficulty is None
+                else CategoryScore.difficulty == difficulty,
+            )
+            .order_by(CategoryScore.correct.desc(), CategoryScore.user_id)
+            .limit(limit)
+        )
+        return [
+            {
+                "rank": rank,
+                "username": row.username,
+                "correct_answers": row.correct,
+                "total_answers": row.answered,
+                "accuracy": round(row.correct / row.answered * 100, 2),
+            }
+            for rank, row in enumerate(result.all(), start=1)
+        ]
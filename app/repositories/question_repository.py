@@ -1,8 +1,8 @@
-from typing import Optional, List, Dict, Any, Tuple
+import random
+from typing import Optional, List, Dict, Any, Container, Iterable
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import Row, select, func, and_
 from sqlalchemy.orm import selectinload
-import random
 from app.models.answers import Answer
 from app.models.quiz import DifficultyLevel
 from app.models.categories import Category
@@ -13,7 +13,14 @@ from app.models.user_responses import UserResponse
 from app.models.user import User
 from app.schemas.quiz import QuizRequest
 from app.schemas.questions import QuestionCreate, QuestionUpdate
+from app.database import after_commit, save
 from app.repositories.base import SQLAlchemyRepository
+from app.indexes.answer_keys import (
+    AnswerKeyEntry,
+    answer_key_index,
+    answer_key_query,
+)
+from app.indexes.questions import question_index
 
 
 class QuestionRepository(
@@ -23,7 +30,6 @@ class QuestionRepository(
         super().__init__(Question, db_session)
 
     async def create(self, obj_in: QuestionCreate) -> Question:
-
         new_question = Question(
             question_text=obj_in.question_text,
             category_id=obj_in.category,
@@ -32,10 +38,42 @@ class QuestionRepository(
         )
 
         self.db_session.add(new_question)
-        await self.db_session.commit()
-        await self.db_session.refresh(new_question)
+        await save(self.db_session)
+        after_commit(
+            self.db_session,
+            lambda: question_index.add(
+                new_question.id, new_question.category_id, new_question.difficulty
+            ),
+        )
         return new_question
 
+    async def update(self, id: int, obj_in: QuestionUpdate) -> Optional[Question]:
+        updated_question = await super().update(id, obj_in)
+        if updated_question:
+            category_id = updated_question.category_id
+            difficulty = updated_question.difficulty
+
+            def reindex() -> None:
+                answer_key_index.discard(id)
+                question_index.discard(id)
+                question_index.add(id, category_id, difficulty)
+                # The text or explanation may have changed with the same pool.
+                question_index.touch()
+
+            after_commit(self.db_session, reindex)
+        return updated_question
+
+    async def delete(self, id: int) -> bool:
+        deleted = await super().delete(id)
+        if deleted:
+
+            def unindex() -> None:
+                answer_key_index.discard(id)
+                question_index.discard(id)
+
+            after_commit(self.db_session, unindex)
+        return deleted
+
     async def get_with_answers(self, question_id: int) -> Optional[Question]:
         result = await self.db_session.execute(
             select(Question)
@@ -57,26 +95,120 @@ class QuestionRepository(
         result = await self.db_session.execute(query)
         return result.scalars().all()
 
+    async def sample_question_ids(
+        self,
+        category_id: int | None = None,
+        difficulty: Optional[DifficultyLevel] = None,
+        limit: int = 10,
+        exclude: Optional[Container[int]] = None,
+        fill_with_excluded: bool = False,
+        rng: Optional[random.Random] = None,
+    ) -> List[int]:
+        """Sample question IDs from the in-process ID index without a query."""
+        await question_index.ensure_loaded(self.db_session)
+        return question_index.sample(
+            limit,
+            category_id=category_id or None,
+            difficulty=difficulty,
+            rng=rng,
+            exclude=exclude,
+            fill_with_excluded=fill_with_excluded,
+        )
+
+    async def get_question_bank_version(self) -> str:
+        """Version of the indexed question bank, see `QuestionIndex.version`."""
+        return await question_index.current_version(self.db_session)
+
     async def get_random_questions(
         self,
         category_id: int | None = None,
         difficulty: Optional[DifficultyLevel] = None,
         limit: int = 10,
     ) -> List[Question]:
-        query = select(Question)
+        """Sample questions from the in-process ID index.
 
-        if category_id:
-            query = query.where(Question.category_id == category_id)
-        if difficulty:
-            query = query.where(Question.difficulty == difficulty)
+        Only the sampled rows (and their answers) are loaded from the database.
+        """
+        question_ids = await self.sample_question_ids(category_id, difficulty, limit)
+        if not question_ids:
+            return []
 
-        result = await self.db_session.execute(query)
-        all_questions = result.scalars().all()
-        selected_questions = random.sample(
-            all_questions, min(limit, len(all_questions))
+        result = await self.db_session.execute(
+            select(Question).where(Question.id.in_(question_ids))
         )
+        questions = {question.id: question for question in result.scalars().all()}
+        self._discard_missing(question_ids, questions)
+
+        return [
+            questions[question_id]
+            for question_id in question_ids
+            if question_id in questions
+        ]
 
-        return selected_questions
+    async def get_quiz_rows(self, question_ids: List[int]) -> List[Row]:
+        """Fetch questions with their category and answers in a single query.
+
+        Returns one flat row per (question, answer) pair, ordered by question
+        and answer ID; questions without answers yield a row with NULL answer
+        columns.
+        """
+        if not question_ids:
+            return []
+
+        result = await self.db_session.execute(
+            select(
+                Question.id,
+                Question.question_text,
+                Question.explanation,
+                Question.difficulty,
+                Question.category_id,
+                Category.category,
+                Category.created_at.label("category_created_at"),
+                Category.updated_at.label("category_updated_at"),
+                Answer.id.label("answer_id"),
+                Answer.answer_text,
+                Answer.is_correct,
+            )
+            .outerjoin(Category, Category.id == Question.category_id)
+            .outerjoin(Answer, Answer.question_id == Question.id)
+            .where(Question.id.in_(question_ids))
+            .order_by(Question.id, Answer.id)
+        )
+        rows = result.all()
+        self._discard_missing(question_ids, {row.id for row in rows})
+        return rows
+
+    @staticmethod
+    def _discard_missing(question_ids: List[int], found: Container[int]) -> None:
+        # IDs deleted by another worker are dropped from the local index.
+        for question_id in question_ids:
+            if question_id not in found:
+                question_index.discard(question_id)
+
+    async def get_answer_keys(
+        self, question_ids: Iterable[int]
+    ) -> Dict[int, AnswerKeyEntry]:
+        """Map question IDs to `(correct_answer_id, explanation, answer_ids)`.
+
+        Entries come from the in-process answer key index; questions it does
+        not hold are resolved with a single query and added to it. Questions
+        without a correct answer map to `(None, explanation, answer_ids)`;
+        unknown question IDs are left out.
+        """
+        await answer_key_index.ensure_loaded(self.db_session)
+        answer_keys, missing = answer_key_index.lookup(set(question_ids))
+        if not missing:
+            return answer_keys
+
+        result = await self.db_session.execute(
+            answer_key_query().where(Question.id.in_(missing))
+        )
+        loaded = {
+            question_id: (answer_id, explanation, tuple(answer_ids or ()))
+            for question_id, answer_id, explanation, answer_ids in result.all()
+        }
+        answer_key_index.update(loaded)
+        return {**answer_keys, **loaded}
 
     async def get_correct_answer(self, question_id: int) -> Optional[Answer]:
         result = await self.db_session.execute(
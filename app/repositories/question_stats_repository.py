@@ -0,0 +1,92 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.question_stats import QuestionStats
+from app.models.user_responses import UserResponse
+
+ResponseChunk = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class QuestionStatsRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.model = QuestionStats
+
+    async def get(self, question_id: int) -> Optional[QuestionStats]:
+        result = await self.db_session.execute(
+            select(QuestionStats).where(QuestionStats.question_id == question_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def stream_responses(self, chunk_size: int) -> AsyncIterator[ResponseChunk]:
+        """Every response as (user IDs, question IDs, correctness) array chunks.
+
+        Rows are fetched with a server-side cursor, so only one chunk is held
+        in memory at a time.
+        """
+        result = await self.db_session.stream(
+            select(
+                UserResponse.user_id, UserResponse.question_id, UserResponse.is_correct
+            )
+            .where(
+                UserResponse.user_id.is_not(None), UserResponse.question_id.is_not(None)
+            )
+            .execution_options(yield_per=chunk_size)
+        )
+        async for partition in result.partitions(chunk_size):
+            users, questions, correct = zip(*partition)
+            yield (
+                np.array(users, dtype=np.int64),
+                np.array(questions, dtype=np.int64),
+                np.array(correct, dtype=bool),
+            )
+
+    async def save(
+        self, statistics: Dict[str, np.ndarray], calibrated_at: datetime
+    ) -> int:
+        """Upsert the statistics of every question with responses."""
+        question_ids = np.flatnonzero(statistics["responses"])
+        if not len(question_ids):
+            return 0
+
+        def value(name: str, question_id: int) -> Optional[float]:
+            if name not in statistics:
+                return None
+            number = float(statistics[name][question_id])
+            return None if np.isnan(number) else number
+
+        rows = [
+            {
+                "question_id": int(question_id),
+                "responses": int(statistics["responses"][question_id]),
+                "correct": int(statistics["correct"][question_id]),
+                "p_value": value("p_value", question_id),
+                "discrimination": value("discrimination", question_id),
+                "irt_difficulty": value("irt_difficulty", question_id),
+                "calibrated_at": calibrated_at,
+            }
+            for question_id in question_ids
+        ]
+        stmt = insert(QuestionStats)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[QuestionStats.question_id],
+            set_={
+                column: stmt.excluded[column]
+                for column in (
+                    "responses",
+                    "correct",
+                    "p_value",
+                    "discrimination",
+                    "irt_difficulty",
+                    "calibrated_at",
+                )
+            },
+        )
+        await self.db_session.execute(stmt, rows)
+        await self.db_session.commit()
+        return len(rows)
@@ -0,0 +1,166 @@
+import re
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import (
+    Boolean,
+    Date,
+    Integer,
+    column,
+    func,
+    literal,
+    select,
+    table,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.questions import Question
+from app.models.response_rollups import ResponseRollup
+
+PARENT = "user_responses"
+DEFAULT_PARTITION = "user_responses_default"
+PARTITION_NAME = re.compile(r"^user_responses_p(\d{4})(\d{2})$")
+
+
+def next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def month_start(month: date) -> datetime:
+    """Midnight UTC on the first day of `month`, whatever the session time zone."""
+    return datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month.year:04d}{month.month:02d}"
+
+
+class ResponsePartitionRepository:
+    """DDL for the monthly partitions of `user_responses`.
+
+    Partition names are derived from the month only, never from input, so
+    they are safe to format into statements.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_partition_months(self) -> List[date]:
+        """First days of the months with an attached partition, oldest first."""
+        result = await self.db_session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits "
+                "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+                "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+                "WHERE parent.relname = :parent"
+            ),
+            {"parent": PARENT},
+        )
+        months = []
+        for (name,) in result:
+            match = PARTITION_NAME.match(name)
+            if match:
+                months.append(date(int(match[1]), int(match[2]), 1))
+        return sorted(months)
+
+    async def lock_partitions(self) -> List[date]:
+        """Take the partition maintenance lock and return the attached months.
+
+        The transaction-level advisory lock serialises partition DDL across
+        workers until the caller commits or rolls back, so the months read
+        under it stay current for the rest of the transaction.
+        """
+        await self.db_session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:parent))"),
+            {"parent": PARENT},
+        )
+        return await self.get_partition_months()
+
+    async def create_partition(self, month: date) -> bool:
+        """Attach a partition for `month`, moving its rows out of the default one.
+
+        The table is filled before it is attached, since Postgres refuses to
+        attach a range that rows in the default partition still cover.
+        Returns False when another worker attached the month first.
+        """
+        if month in await self.lock_partitions():
+            await self.db_session.rollback()
+            return False
+        name = partition_name(month)
+        start, end = month_start(month), month_start(next_month(month))
+        bounds = {"start": start, "end": end}
+        # Keep new rows for this month out of the default partition meanwhile.
+        await self.db_session.execute(
+            text(f"LOCK TABLE {DEFAULT_PARTITION} IN SHARE ROW EXCLUSIVE MODE")
+        )
+        await self.db_session.execute(
+            text(f"CREATE TABLE {name} (LIKE {PARENT} INCLUDING DEFAULTS)")
+        )
+        await self.db_session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                "WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            bounds,
+        )
+        await self.db_session.execute(
+            text(
+                f"ALTER TABLE {PARENT} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        )
+        await self.db_session.commit()
+        return True
+
+    async def retire_partition(self, month: date, drop: bool) -> Optional[int]:
+        """Roll a month up into `response_rollups` and detach or drop its partition.
+
+        Both happen in one transaction. Returns the rollup rows written, or
+        None when another worker retired the month first.
+        """
+        if month not in await self.lock_partitions():
+            await self.db_session.rollback()
+            return None
+        name = partition_name(month)
+        partition = table(
+            name,
+            column("user_id", Integer),
+            column("question_id", Integer),
+            column("is_correct", Boolean),
+        )
+        source = (
+            select(
+                partition.c.user_id,
+                literal(month, Date),
+                Question.category_id,
+                Question.difficulty,
+                func.count(),
+                func.count().filter(partition.c.is_correct),
+            )
+            .select_from(partition)
+            .join(Question, Question.id == partition.c.question_id)
+            .where(partition.c.user_id.is_not(None))
+            .group_by(partition.c.user_id, Question.category_id, Question.difficulty)
+        )
+        stmt = insert(ResponseRollup).from_select(
+            ["user_id", "month", "category_id", "difficulty", "answered", "correct"],
+            source,
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_response_rollups_user_month_scope",
+            set_={
+                "answered": ResponseRollup.answered + stmt.excluded.answered,
+                "correct": ResponseRollup.correct + stmt.excluded.correct,
+            },
+        )
+        result = await self.db_session.execute(stmt)
+        await self.db_session.execute(
+            text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}")
+        )
+        if drop:
+            await self.db_session.execute(text(f"DROP TABLE {name}"))
+        await self.db_session.commit()
+        return result.rowcount
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import save
+from app.models.revoked_tokens import RevokedToken
+
+
+class RevokedTokenRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.model = RevokedToken
+
+    async def add(self, digest: str, expires_at: datetime) -> None:
+        await self.db_session.execute(
+            insert(RevokedToken)
+            .values(digest=digest, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=["digest"])
+        )
+        await save(self.db_session)
+
+    async def get_active(self) -> List[RevokedToken]:
+        result = await self.db_session.execute(
+            select(RevokedToken).where(RevokedToken.expires_at > func.now())
+        )
+        return list(result.scalars())
+
+    async def delete_expired(self) -> int:
+        result = await self.db_session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= func.now())
+        )
+        await save(self.db_session)
+        return result.rowcount
@@ -0,0 +1,106 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.quiz import LeaderboardPeriod
+from app.models.score_buckets import ScoreBucket
+from app.models.user import User
+
+
+def period_start(period: LeaderboardPeriod, day: date) -> date:
+    """First day of the day, ISO week or month that contains `day`."""
+    if period == LeaderboardPeriod.WEEK:
+        return day - timedelta(days=day.weekday())
+    if period == LeaderboardPeriod.MONTH:
+        return day.replace(day=1)
+    return day
+
+
+class ScoreBucketRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+        self.model = ScoreBucket
+
+    async def add_scores(
+        self, scores: Dict[int, int], day: Optional[date] = None
+    ) -> None:
+        """Add one game per user to the buckets of every period containing `day`.
+
+        `day` defaults to today in UTC.
+        Written with a single multi-row upsert. The rows are not committed
+        here; they become part of the caller's transaction.
+        """
+        if not scores:
+            return
+        day = day or datetime.now(timezone.utc).date()
+        rows = [
+            {
+                "user_id": user_id,
+                "period": period,
+                "period_start": period_start(period, day),
+                "score": score,
+                "games_played": 1,
+            }
+            for user_id, score in scores.items()
+            for period in LeaderboardPeriod
+        ]
+        stmt = insert(ScoreBucket).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_score_buckets_user_period",
+            set_={
+                "score": ScoreBucket.score + stmt.excluded.score,
+                "games_played": ScoreBucket.games_played + stmt.excluded.games_played,
+                "updated_at": func.now(),
+            },
+        )
+        await self.db_session.execute(stmt)
+
+    async def get_leaderboard(
+        self, period: LeaderboardPeriod, limit: int = 10, day: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """Top players of the period containing `day` (default: today in UTC).
+
+        Ties go to the lower user ID, as on the all-time leaderboard.
+        """
+        day = day or datetime.now(timezone.utc).date()
+        result = await self.db_session.execute(
+            select(User.username, ScoreBucket.score, ScoreBucket.games_played)
+            .join(User, User.id == ScoreBucket.user_id)
+            .where(
+                ScoreBucket.period == period,
+                ScoreBucket.period_start == period_start(period, day),
+            )
+            .order_by(ScoreBucket.score.desc(), ScoreBucket.user_id)
+            .limit(limit)
+        )
+        return [
+            {
+                "rank": rank,
+                "username": row.username,
+                "total_score": row.score,
+                "games_played": row.games_played,
+                "avg_score": round(row.score / row.games_played, 2),
+            }
+            for rank, row in enumerate(result.all(), start=1)
+        ]
+
+    async def delete_older_than(self, cutoffs: Dict[LeaderboardPeriod, date]) -> int:
+        """Drop buckets that start before their period's cutoff."""
+        result = await self.db_session.execute(
+            delete(ScoreBucket).where(
+                or_(
+                    *(
+                        and_(
+                            ScoreBucket.period == period,
+                            ScoreBucket.period_start < cutoff,
+                        )
+                        for period, cutoff in cutoffs.items()
+                    )
+                )
+            )
+        )
+        await self.db_session.commit()
+        return result.rowcount
@@ -1,13 +1,32 @@
 from typing import Optional, List, Dict, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, func
+from sqlalchemy import bindparam, or_, select, update, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.repositories.base import SQLAlchemyRepository
-from app.core.security import get_password_hash, verify_password
+from app.database import after_commit, save
+from app.repositories.base import REFRESH_FROM_RETURNING, SQLAlchemyRepository
+from app.core.password_hasher import password_hasher
+from app.indexes.leaderboard import leaderboard
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# Authenticated users by username, as detached copies: username -> User.
+principals: TTLCache[str, User] = TTLCache(
+    maxsize=(
+        settings.PRINCIPAL_CACHE_MAX_ENTRIES if settings.PRINCIPAL_CACHE_ENABLED else 0
+    ),
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def snapshot(user: User) -> User:
+    """A transient copy of the user's columns, safe to share across sessions."""
+    columns = User.__table__.c
+    return User(**{column.key: getattr(user, column.key) for column in columns})
 
 
 class UserRepository(SQLAlchemyRepository[User, UserCreate, UserUpdate]):
@@ -15,16 +34,14 @@ class UserRepository(SQLAlchemyRepository[User, UserCreate, UserUpdate]):
         super().__init__(User, db_session)
 
     async def create(self, user: UserCreate) -> User:
-
-        hashed_password = get_password_hash(user.password)
+        hashed_password = await password_hasher.hash(user.password)
         new_user = User(
             username=user.username,
             email=user.email,
             hashed_password=hashed_password,
         )
         self.db_session.add(new_user)
-        await self.db_session.commit()
-        await self.db_session.refresh(new_user)
+        await save(self.db_session)
         return new_user
 
     async def get_by_email(self, email: str) -> Optional[User]:
@@ -41,11 +58,58 @@ class UserRepository(SQLAlchemyRepository[User, UserCreate, UserUpdate]):
         )
         return result.scalar_one_or_none()
 
+    async def get_taken(
+        self, usernames: List[str], emails: List[str]
+    ) -> tuple[set[str], set[str]]:
+        """Which of `usernames` and `emails` are already in use, in one query."""
+        result = await self.db_session.execute(
+            select(User.username, User.email).where(
+                or_(User.username.in_(usernames), User.email.in_(emails))
+            )
+        )
+        taken_usernames, taken_emails = set(), set()
+        for row in result:
+            taken_usernames.add(row.username)
+            taken_emails.add(row.email)
+        return taken_usernames, taken_emails
+
+    async def insert_many(self, users: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Insert users with one statement.
+
+        Rows clashing with an existing username or email are skipped.
+        Returns the IDs of the inserted users by username.
+        """
+        if not users:
+            return {}
+        result = await self.db_session.execute(
+            insert(User)
+            .values(users)
+            .on_conflict_do_nothing()
+            .returning(User.id, User.username)
+        )
+        inserted = {row.username: row.id for row in result}
+        await save(self.db_session)
+        return inserted
+
+    async def get_principal(self, username: str) -> Optional[User]:
+        """The user behind a token, from `principals` when possible.
+
+        Cached copies are for authentication and authorization: `is_active`
+        and `is_admin` are current, but scores may lag until the entry is
+        dropped or expires.
+        """
+        user = principals.get(username)
+        if user is None:
+            user = await self.get_by_username(username)
+            if user is not None:
+                principals.set(username, snapshot(user))
+        return user
+
     async def authenticate(self, username: str, password: str) -> Optional[User]:
         user = await self.get_by_username(username)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
         return user
 
@@ -57,59 +121,120 @@ class UserRepository(SQLAlchemyRepository[User, UserCreate, UserUpdate]):
                 total_score=User.total_score + score, games_played=User.games_played + 1
             )
             .returning(User)
+            .execution_options(**REFRESH_FROM_RETURNING)
         )
 
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
-
         updated_user = result.scalar_one_or_none()
+        await save(self.db_session)
         if updated_user:
-            await self.db_session.refresh(updated_user)
+            self._track(updated_user)
 
         return updated_user
 
-    async def get_leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
-        query = (
-            select(
-                User.username,
-                User.total_score,
-                User.games_played,
-                func.coalesce(
-                    func.round(User.total_score * 1.0 / User.games_played, 2), 0
-                ).label("avg_score"),
+    async def update_scores(self, scores: Dict[int, int]) -> None:
+        """Add a finished game to many users with one executemany UPDATE."""
+        if not scores:
+            return
+        users = User.__table__
+        stmt = (
+            update(users)
+            .where(users.c.id == bindparam("b_user_id"))
+            .values(
+                total_score=users.c.total_score + bindparam("b_score"),
+                games_played=users.c.games_played + 1,
             )
-            .where(User.games_played > 0)
-            .order_by(User.total_score.desc())
-            .limit(limit)
         )
+        await self.db_session.execute(
+            stmt,
+            [
+                {"b_user_id": user_id, "b_score": score}
+                for user_id, score in scores.items()
+            ],
+        )
+
+        if leaderboard.loaded:
+            result = await self.db_session.execute(
+                select(
+                    User.id, User.username, User.total_score, User.games_played
+                ).where(User.id.in_(scores))
+            )
+            rows = result.all()
 
-        result = await self.db_session.execute(query)
-        rows = result.all()
+            def update_leaderboard() -> None:
+                for row in rows:
+                    leaderboard.update(*row)
 
-        return [
-            {
-                "username": row.username,
-                "total_score": row.total_score,
-                "games_played": row.games_played,
-                "avg_score": row.avg_score,
-            }
-            for row in rows
-        ]
+            after_commit(self.db_session, update_leaderboard)
+        await save(self.db_session)
+
+    async def get_leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Top players by total score, read from the in-process leaderboard."""
+        await leaderboard.ensure_loaded(self.db_session)
+        return leaderboard.top(limit)
+
+    async def get_leaderboard_position(
+        self, user_id: int, radius: int = 5
+    ) -> Dict[str, Any]:
+        """The user's leaderboard position and their neighbours, without a query."""
+        await leaderboard.ensure_loaded(self.db_session)
+        return leaderboard.around(user_id, radius)
 
     async def update(self, id: int, user: UserUpdate) -> Optional[User]:
         updated_user = user.model_dump(exclude_unset=True)
 
         if updated_user.get("password"):
-            updated_user["hashed_password"] = get_password_hash(
+            updated_user["hashed_password"] = await password_hasher.hash(
                 updated_user.pop("password")
             )
 
-        stmt = update(User).where(User.id == id).values(**updated_user).returning(User)
+        stmt = (
+            update(User)
+            .where(User.id == id)
+            .values(**updated_user)
+            .returning(User)
+            .execution_options(**REFRESH_FROM_RETURNING)
+        )
         result = await self.db_session.execute(stmt)
-        await self.db_session.commit()
-
         updated_user = result.scalar_one_or_none()
+        await save(self.db_session)
+        # Also drops the entry under a previous username.
+        self._forget_principal(id)
         if updated_user:
-            await self.db_session.refresh(updated_user)
+            self._track(updated_user)
 
         return updated_user
+
+    async def set_active(self, id: int, is_active: bool) -> Optional[User]:
+        """Activate or deactivate a user, effective at their next request."""
+        stmt = (
+            update(User)
+            .where(User.id == id)
+            .values(is_active=is_active)
+            .returning(User)
+            .execution_options(**REFRESH_FROM_RETURNING)
+        )
+        result = await self.db_session.execute(stmt)
+        updated_user = result.scalar_one_or_none()
+        await save(self.db_session)
+        self._forget_principal(id)
+        return updated_user
+
+    async def delete(self, id: int) -> bool:
+        deleted = await super().delete(id)
+        self._forget_principal(id)
+        return deleted
+
+    def _forget_principal(self, id: int) -> None:
+        after_commit(
+            self.db_session,
+            lambda: principals.discard_if(lambda principal: principal.id == id),
+        )
+
+    def _track(self, user: User) -> None:
+        after_commit(
+            self.db_session,
+            lambda: leaderboard.update(
+                user.id, user.username, user.total_score, user.games_played
+            ),
+        )
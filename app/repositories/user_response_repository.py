@@ -1,18 +1,37 @@
+from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import Integer, select, func, and_
-from sqlalchemy.orm import selectinload
-import random
-from app.models.answers import Answer
-from app.models.quiz import DifficultyLevel
-from app.models.categories import Category
-from app.models.questions import Question
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import insert, select, tuple_
 from app.models.user_responses import UserResponse
 
-from app.models.user import User
-from app.schemas.questions import QuestionCreate, QuestionUpdate
-from app.schemas.quiz import QuizRequest
-from app.repositories.base import SQLAlchemyRepository
+from app.core.bitmap import CompactBitmap
+from app.indexes.seen_questions import seen_questions
+from app.repositories.category_score_repository import CategoryScoreRepository
+from app.core.config import settings
+from app.core.write_behind import WriteBehindBuffer
+from app.database import after_commit, save, unit_of_work
+
+# Group-commit buffer for responses, running unless RESPONSE_WRITE_MODE is
+# "direct"; see `start_response_buffer`.
+response_buffer: WriteBehindBuffer[Dict[str, Any]] = WriteBehindBuffer(
+    max_batch=settings.RESPONSE_WRITE_MAX_BATCH,
+    interval_seconds=settings.RESPONSE_WRITE_INTERVAL_SECONDS,
+    max_pending=settings.RESPONSE_WRITE_MAX_PENDING,
+)
+
+
+def start_response_buffer(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Route `create_many` through the buffer, committing each batch at once.
+
+    `session_factory` should not share a pool with requests, which wait for
+    the flush while holding their connections; see `WriterSessionLocal`.
+    """
+
+    async def flush(responses: List[Dict[str, Any]]) -> None:
+        async with unit_of_work(session_factory) as session:
+            await UserResponseRepository(session).insert_many(responses)
+
+    response_buffer.start(flush)
 
 
 class UserResponseRepository:
@@ -30,84 +49,81 @@ class UserResponseRepository:
             is_correct=is_correct,
         )
         self.db_session.add(db_response)
-        await self.db_session.commit()
-        await self.db_session.refresh(db_response)
+        await CategoryScoreRepository(self.db_session).add_responses(
+            [
+                {
+                    "user_id": user_id,
+                    "question_id": question_id,
+                    "is_correct": is_correct,
+                }
+            ]
+        )
+        await save(self.db_session)
+        after_commit(
+            self.db_session, lambda: seen_questions.mark(user_id, [question_id])
+        )
         return db_response
 
-    async def get_user_stats(self, user_id: int) -> Dict[str, Any]:
-        total_query = select(func.count(UserResponse.id)).where(
-            UserResponse.user_id == user_id
-        )
-        total_result = await self.db_session.execute(total_query)
-        total_answers = total_result.scalar() or 0
+    async def create_many(self, responses: List[Dict[str, Any]]) -> None:
+        """Record many responses.
 
-        correct_query = select(func.count(UserResponse.id)).where(
-            and_(UserResponse.user_id == user_id, UserResponse.is_correct == True)
-        )
-        correct_result = await self.db_session.execute(correct_query)
-        correct_answers = correct_result.scalar() or 0
-
-        category_query = (
-            select(
-                Question.category,
-                func.count(UserResponse.id).label("total"),
-                func.sum(func.cast(UserResponse.is_correct, Integer)).label("correct"),
+        Without the response buffer this is `insert_many`, not committed, as
+        part of the caller's transaction. With it, the rows are committed in
+        the buffer's next batch, and this waits for that commit only in
+        "buffered" mode.
+        """
+        if response_buffer.running:
+            await response_buffer.put(
+                responses, wait=settings.RESPONSE_WRITE_MODE != "async"
             )
-            .join(Question, UserResponse.question_id == Question.id)
-            .where(UserResponse.user_id == user_id)
-            .group_by(Question.category)
-        )
-        category_result = await self.db_session.execute(category_query)
-
-        by_category = {}
-        for row in category_result:
-            by_category[row.category.value] = {
-                "total": row.total,
-                "correct": row.correct or 0,
-                "accuracy": (
-                    (row.correct or 0) / row.total * 100 if row.total > 0 else 0
-                ),
-            }
-
-        difficulty_query = (
-            select(
-                Question.difficulty,
-                func.count(UserResponse.id).label("total"),
-                func.sum(func.cast(UserResponse.is_correct, Integer)).label("correct"),
-            )
-            .join(Question, UserResponse.question_id == Question.id)
-            .where(UserResponse.user_id == user_id)
-            .group_by(Question.difficulty)
-        )
-        difficulty_result = await self.db_session.execute(difficulty_query)
-
-        by_difficulty = {}
-        for row in difficulty_result:
-            by_difficulty[row.difficulty.value] = {
-                "total": row.total,
-                "correct": row.correct or 0,
-                "accuracy": (
-                    (row.correct or 0) / row.total * 100 if row.total > 0 else 0
-                ),
-            }
-
-        return {
-            "total_answers": total_answers,
-            "correct_answers": correct_answers,
-            "accuracy": (
-                (correct_answers / total_answers * 100) if total_answers > 0 else 0
-            ),
-            "by_category": by_category,
-            "by_difficulty": by_difficulty,
-        }
+            return
+        await self.insert_many(responses)
+
+    async def insert_many(self, responses: List[Dict[str, Any]]) -> None:
+        """Insert many responses with a single multi-row INSERT.
+
+        Category and difficulty scores are updated alongside. The rows are
+        not committed here; they become part of the caller's transaction,
+        and are marked as seen once it commits.
+        """
+        if not responses:
+            return
+        await self.db_session.execute(insert(UserResponse), responses)
+        await CategoryScoreRepository(self.db_session).add_responses(responses)
+
+        def mark_seen() -> None:
+            for response in responses:
+                seen_questions.mark(response["user_id"], [response["question_id"]])
+
+        after_commit(self.db_session, mark_seen)
+
+    async def get_seen_question_ids(self, user_id: int) -> CompactBitmap:
+        """IDs of the questions the user has already answered."""
+        return await seen_questions.get(self.db_session, user_id)
 
     async def get_user_responses(
-        self, user_id: int, limit: int = 100
+        self,
+        user_id: int,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, int]] = None,
     ) -> List[UserResponse]:
-        result = await self.db_session.execute(
-            select(UserResponse)
-            .where(UserResponse.user_id == user_id)
-            .order_by(UserResponse.created_at.desc())
-            .limit(limit)
-        )
+        """The user's responses, newest first, optionally after a keyset position.
+
+        `before` is the `(created_at, id)` of the last row of the previous
+        page. Each page is a range read of the `(user_id, created_at, id)`
+        index, so deep pages cost the same as the first one and rows
+        inserted meanwhile do not shift later pages.
+        """
+        query = select(UserResponse).where(UserResponse.user_id == user_id)
+        if before is not None:
+            # The plain bound lets the planner prune newer monthly partitions,
+            # which it cannot do from the row comparison alone.
+            query = query.where(
+                UserResponse.created_at <= before[0],
+                tuple_(UserResponse.created_at, UserResponse.id) < tuple_(*before),
+            )
+        query = query.order_by(
+            UserResponse.created_at.desc(), UserResponse.id.desc()
+        ).limit(limit)
+        result = await self.db_session.execute(query)
         return result.scalars().all()
@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.quiz import DifficultyLevel
+
+
+class CardAnswer(BaseModel):
+    id: int
+    answer_text: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CardQuestion(BaseModel):
+    id: int
+    question_text: str
+    difficulty: DifficultyLevel
+    answers: List[CardAnswer]
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CardResponse(BaseModel):
+    question: CardQuestion
+    repetitions: int
+    interval_days: int
+    ease_factor: float
+    lapses: int
+    due_at: datetime
+    last_reviewed_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CardReview(BaseModel):
+    question_id: int
+    answer_id: int
+    # Optional self-rating on the SM-2 0-5 scale.
+    quality: Optional[int] = Field(default=None, ge=0, le=5)
+
+
+class CardReviewResult(BaseModel):
+    question_id: int
+    is_correct: bool
+    correct_answer_id: Optional[int]
+    explanation: Optional[str]
+    quality: int
+    repetitions: int
+    interval_days: int
+    ease_factor: float
+    due_at: datetime
+
+
+class CardImportResult(BaseModel):
+    imported: int
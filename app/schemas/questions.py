@@ -37,3 +37,15 @@ class QuestionsListResponse(BaseModel):
     limit: int
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class QuestionStatsResponse(BaseModel):
+    question_id: int
+    responses: int
+    correct: int
+    p_value: float
+    discrimination: Optional[float] = None
+    irt_difficulty: Optional[float] = None
+    calibrated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
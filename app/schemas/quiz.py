@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.quiz import DifficultyLevel
 
@@ -9,6 +9,11 @@ class QuizRequest(BaseModel):
     category_id: int | None = None
     difficulty: Optional[DifficultyLevel] = None
     num_questions: int = 10
+    # Only applied to authenticated players.
+    exclude_seen: bool = False
+    fill_with_seen: bool = True
+    # Same seed, filters and question bank give the same quiz.
+    seed: Optional[str] = Field(default=None, max_length=64)
 
 
 class UserAnswer(BaseModel):
@@ -18,6 +23,20 @@ class UserAnswer(BaseModel):
 
 class QuizSubmit(BaseModel):
     answers: List[UserAnswer]
+    session_id: Optional[str] = None
+
+
+class StreamAnswer(BaseModel):
+    """An answer sent over the quiz WebSocket; `question_id` is optional."""
+
+    answer_id: int
+    question_id: Optional[int] = None
+
+
+class GeneratedQuiz(BaseModel):
+    session_id: str
+    questions: List[dict]
+    etag: Optional[str] = None
 
 
 class QuizResult(BaseModel):
@@ -18,6 +18,10 @@ class UserUpdate(BaseModel):
     password: str | None = None
 
 
+class UserStatusUpdate(BaseModel):
+    is_active: bool
+
+
 class UserInDB(UserBase):
     id: int
     is_active: bool
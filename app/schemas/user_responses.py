@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ResponseHistoryItem(BaseModel):
+    id: int
+    question_id: int
+    answer_id: Optional[int] = None
+    is_correct: bool
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ResponseHistoryPage(BaseModel):
+    items: List[ResponseHistoryItem]
+    # Pass as `cursor` to get the next page; null on the last page.
+    next_cursor: Optional[str] = None
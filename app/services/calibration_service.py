@@ -0,0 +1,143 @@
+"""Batch calibration of question difficulty from recorded responses."""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from typing import AsyncIterator, Callable
+
+import numpy as np
+
+from app.core.calibration import (
+    Sums,
+    add_sums,
+    count_chunk,
+    moment_chunk,
+    question_statistics,
+    user_totals,
+)
+from app.middleware.logger import logger
+from app.models.question_stats import QuestionStats
+from app.repositories import RepositoryFactory
+from app.repositories.question_stats_repository import ResponseChunk
+
+# Per-user totals of the first pass, set in each second-pass worker process.
+_worker_user_totals: tuple[np.ndarray, np.ndarray] | None = None
+
+
+def _init_moment_worker(user_answers: np.ndarray, user_correct: np.ndarray) -> None:
+    global _worker_user_totals
+    _worker_user_totals = user_answers, user_correct
+
+
+def _moment_chunk_in_worker(
+    users: np.ndarray, questions: np.ndarray, correct: np.ndarray, irt: bool
+) -> Sums:
+    return moment_chunk(users, questions, correct, *_worker_user_totals, irt=irt)
+
+
+async def _reduce(
+    chunks: AsyncIterator[ResponseChunk],
+    reduce_chunk: Callable[..., Sums],
+    pool: Executor | None,
+    in_flight: int,
+) -> Sums | None:
+    """Sum `reduce_chunk` over the chunks, in `pool` if given.
+
+    At most `in_flight` chunks are queued for the pool, which bounds memory
+    while the next chunks are fetched from the database.
+    """
+    total = None
+    if pool is None:
+        async for chunk in chunks:
+            total = add_sums(total, reduce_chunk(*chunk))
+        return total
+
+    loop = asyncio.get_running_loop()
+    pending: set[asyncio.Future] = set()
+    async for chunk in chunks:
+        pending.add(loop.run_in_executor(pool, reduce_chunk, *chunk))
+        if len(pending) >= in_flight:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                total = add_sums(total, future.result())
+    for part in await asyncio.gather(*pending):
+        total = add_sums(total, part)
+    return total
+
+
+class CalibrationService:
+    def __init__(self, repository_factory: RepositoryFactory) -> None:
+        self.repo_factory = repository_factory
+
+    async def get_question_stats(self, question_id: int) -> QuestionStats | None:
+        return await self.repo_factory.question_stats.get(question_id)
+
+    async def calibrate(
+        self,
+        chunk_size: int,
+        min_responses: int,
+        irt: bool = False,
+        workers: int = 0,
+    ) -> int:
+        """Recompute the statistics of every answered question.
+
+        Streams `user_responses` twice in chunks of `chunk_size`; with
+        `workers`, chunks are reduced in that many processes. Returns the
+        number of questions written.
+        """
+        repository = self.repo_factory.question_stats
+        started = time.perf_counter()
+
+        pool = ProcessPoolExecutor(workers) if workers else None
+        try:
+            counts = await _reduce(
+                repository.stream_responses(chunk_size), count_chunk, pool, 2 * workers
+            )
+        finally:
+            if pool:
+                pool.shutdown()
+        if counts is None:
+            return 0
+        user_answers, user_correct = user_totals(counts)
+        logger.info(
+            f"Calibration: counted {int(counts[2].sum())} responses in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+
+        if workers:
+            pool = ProcessPoolExecutor(
+                workers,
+                initializer=_init_moment_worker,
+                initargs=(user_answers, user_correct),
+            )
+            reduce_chunk = partial(_moment_chunk_in_worker, irt=irt)
+        else:
+            pool = None
+            reduce_chunk = partial(
+                moment_chunk,
+                user_answers=user_answers,
+                user_correct=user_correct,
+                irt=irt,
+            )
+        try:
+            moments = await _reduce(
+                repository.stream_responses(chunk_size), reduce_chunk, pool, 2 * workers
+            )
+        finally:
+            if pool:
+                pool.shutdown()
+
+        if moments is None:
+            # Nobody answered more than one question: only p-values are known.
+            moments = tuple(np.zeros(0) for _ in range(7 if irt else 5))
+        statistics = question_statistics(counts, moments, min_responses)
+        saved = await repository.save(statistics, datetime.now(timezone.utc))
+        logger.info(
+            f"Calibration: wrote {saved} questions in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+        return saved
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from typing import Any, List, Optional
+
+from app.core.spaced_repetition import CardState, review_quality, schedule
+from app.models.cards import Card
+from app.repositories import RepositoryFactory
+from app.schemas.cards import CardReview
+
+
+class CardService:
+    def __init__(self, repository_factory: RepositoryFactory):
+        self.repo_factory = repository_factory
+
+    async def get_due_cards(self, user_id: int, limit: int) -> List[Card]:
+        now = datetime.now(timezone.utc)
+        return await self.repo_factory.cards.get_due(user_id, now, limit)
+
+    async def import_history(self, user_id: int) -> int:
+        """Turn the user's quiz history into cards; returns how many were added."""
+        now = datetime.now(timezone.utc)
+        return await self.repo_factory.cards.import_responses(user_id, now)
+
+    async def review(
+        self, user_id: int, card_review: CardReview
+    ) -> Optional[dict[str, Any]]:
+        """Grade an answer and reschedule the card with SM-2.
+
+        The answer is checked against the answer key index and the new
+        schedule is written with one upsert, which also creates the card on
+        its first review. Returns None for unknown questions.
+        """
+        answer_keys = await self.repo_factory.questions.get_answer_keys(
+            [card_review.question_id]
+        )
+        if card_review.question_id not in answer_keys:
+            return None
+        correct_answer_id, explanation, _ = answer_keys[card_review.question_id]
+        is_correct = card_review.answer_id == correct_answer_id
+
+        card = await self.repo_factory.cards.get(user_id, card_review.question_id)
+        state = (
+            CardState(
+                repetitions=card.repetitions,
+                interval_days=card.interval_days,
+                ease_factor=card.ease_factor,
+                lapses=card.lapses,
+            )
+            if card is not None
+            else CardState()
+        )
+        quality = review_quality(is_correct, card_review.quality)
+        now = datetime.now(timezone.utc)
+        state, due_at = schedule(state, quality, now)
+        await self.repo_factory.cards.save_review(
+            user_id, card_review.question_id, state, due_at, now
+        )
+
+        return {
+            "question_id": card_review.question_id,
+            "is_correct": is_correct,
+            "correct_answer_id": correct_answer_id,
+            "explanation": explanation,
+            "quality": quality,
+            "repetitions": state.repetitions,
+            "interval_days": state.interval_days,
+            "ease_factor": state.ease_factor,
+            "due_at": due_at,
+        }
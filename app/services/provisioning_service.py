@@ -0,0 +1,267 @@
+"""Bulk creation of user accounts from CSV or NDJSON uploads."""
+
+import asyncio
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Literal
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.password_hasher import PasswordHasherBusy, password_hasher
+from app.core.security import get_password_hash
+from app.database import unit_of_work
+from app.middleware.logger import logger
+from app.models.user import User
+from app.repositories import RepositoryFactory
+from app.schemas.user import UserCreate
+
+RowFormat = Literal["csv", "ndjson"]
+
+# A parsed upload row: its line number and either its fields or why it
+# could not be read.
+Row = tuple[int, dict[str, Any] | str]
+
+# Column lengths the database enforces on uploaded fields.
+FIELD_LENGTHS = {
+    field: User.__table__.c[field].type.length for field in ("username", "email")
+}
+
+# How long to back off while the shared password hasher is saturated.
+HASHER_BUSY_RETRY_SECONDS = 0.05
+
+
+async def read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Split a byte stream into lines, without their line endings."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+    if pending:
+        yield pending.rstrip(b"\r")
+
+
+async def parse_rows(
+    lines: AsyncIterator[bytes], row_format: RowFormat
+) -> AsyncIterator[Row]:
+    """Read user records from CSV with a header line, or from NDJSON.
+
+    Lines are decoded as UTF-8, after a byte order mark on the first one.
+    Blank lines are skipped. Quoted CSV fields may not span lines.
+    """
+    header = None
+    number = 0
+    async for raw_line in lines:
+        number += 1
+        try:
+            line = raw_line.decode("utf-8-sig" if number == 1 else "utf-8")
+        except UnicodeDecodeError:
+            yield number, "Not valid UTF-8"
+            continue
+        if not line.strip():
+            continue
+        if row_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield number, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield number, "Expected a JSON object"
+                continue
+            yield number, record
+        elif header is None:
+            header = [field.strip() for field in next(csv.reader([line]))]
+        else:
+            values = next(csv.reader([line]))
+            if len(values) != len(header):
+                yield number, f"Expected {len(header)} fields, got {len(values)}"
+                continue
+            yield number, dict(zip(header, values))
+
+
+class ProvisioningService:
+    """Creates users batch by batch, each batch in its own transaction.
+
+    Uploads can be large, so they do not run in the request's unit of
+    work: a failing batch only loses its own rows, and a committed batch
+    releases its usernames and emails at once.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.session_factory = session_factory
+
+    async def provision(
+        self, rows: AsyncIterator[Row], batch_size: int, workers: int | None = None
+    ) -> dict[str, Any]:
+        """Create a user for every valid row and report on each row.
+
+        Rows are handled in batches of `batch_size`: validated, checked
+        against the upload so far and against `users` with one query,
+        hashed and inserted and committed with one statement. Each report
+        entry has the row's `line`, `username` and either the new `id` or
+        an `error`.
+
+        Passwords are hashed through the shared `password_hasher`, or with
+        `workers` set, in a pool of that many processes (0 = one per CPU)
+        owned by this call. Only offline callers should ask for a pool:
+        it bypasses the hasher's back-pressure, and closing it blocks.
+        """
+        started = time.perf_counter()
+        seen_usernames: set[str] = set()
+        seen_emails: set[str] = set()
+        report: list[dict[str, Any]] = []
+
+        pool = (
+            ProcessPoolExecutor(workers or os.cpu_count())
+            if workers is not None
+            else None
+        )
+        try:
+            batch: list[Row] = []
+            async for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    report += await self._provision_batch(
+                        batch, pool, seen_usernames, seen_emails
+                    )
+                    batch = []
+            report += await self._provision_batch(
+                batch, pool, seen_usernames, seen_emails
+            )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        created = sum("id" in entry for entry in report)
+        logger.info(
+            f"Provisioned {created} of {len(report)} users in "
+            f"{time.perf_counter() - started:.1f}s"
+        )
+        return {"created": created, "failed": len(report) - created, "rows": report}
+
+    async def _provision_batch(
+        self,
+        batch: list[Row],
+        pool: ProcessPoolExecutor | None,
+        seen_usernames: set[str],
+        seen_emails: set[str],
+    ) -> list[dict[str, Any]]:
+        report: list[dict[str, Any]] = []
+        accepted: list[tuple[dict[str, Any], UserCreate]] = []
+        for number, record in batch:
+            entry: dict[str, Any] = {"line": number, "username": None}
+            report.append(entry)
+            if isinstance(record, str):
+                entry["error"] = record
+                continue
+            entry["username"] = record.get("username")
+            try:
+                user = UserCreate.model_validate(record)
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(part) for part in error["loc"])
+                entry["error"] = f"{field}: {error['msg']}"
+                continue
+            too_long = [
+                f"{field}: At most {length} characters"
+                for field, length in FIELD_LENGTHS.items()
+                if len(getattr(user, field)) > length
+            ]
+            if too_long:
+                entry["error"] = too_long[0]
+            elif user.username in seen_usernames:
+                entry["error"] = "Duplicate username in upload."
+            elif user.email in seen_emails:
+                entry["error"] = "Duplicate email in upload."
+            else:
+                seen_usernames.add(user.username)
+                seen_emails.add(user.email)
+                accepted.append((entry, user))
+        if not accepted:
+            return report
+
+        async with self.session_factory() as session:
+            taken_usernames, taken_emails = await RepositoryFactory(
+                session
+            ).users.get_taken(
+                [user.username for _, user in accepted],
+                [user.email for _, user in accepted],
+            )
+        new_users = []
+        for entry, user in accepted:
+            if user.username in taken_usernames:
+                entry["error"] = "Username already exists."
+            elif user.email in taken_emails:
+                entry["error"] = "Email already registered."
+            else:
+                new_users.append((entry, user))
+
+        hashed_passwords = await self._hash_passwords(
+            [user.password for _, user in new_users], pool
+        )
+        try:
+            async with unit_of_work(self.session_factory) as session:
+                ids = await RepositoryFactory(session).users.insert_many(
+                    [
+                        {
+                            "username": user.username,
+                            "email": user.email,
+                            "hashed_password": hashed_password,
+                        }
+                        for (_, user), hashed_password in zip(
+                            new_users, hashed_passwords
+                        )
+                    ]
+                )
+        except SQLAlchemyError as err:
+            # Only this batch is rolled back; earlier ones stay committed.
+            logger.error(f"Failed to insert a batch of {len(new_users)} users: {err}")
+            for entry, _ in new_users:
+                entry["error"] = "Could not be saved."
+            return report
+        for entry, user in new_users:
+            if user.username in ids:
+                entry["id"] = ids[user.username]
+            else:
+                # Registered by someone else since `get_taken`.
+                entry["error"] = "Username or email already exists."
+        return report
+
+    async def _hash_passwords(
+        self, passwords: list[str], pool: ProcessPoolExecutor | None
+    ) -> list[str]:
+        if pool is not None:
+            loop = asyncio.get_running_loop()
+            return await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, get_password_hash, password)
+                    for password in passwords
+                )
+            )
+        # At most one hash per worker in flight, so logins still find room
+        # in the hasher's queue.
+        hashed_passwords: list[str] = []
+        step = max(password_hasher.workers, 1)
+        for start in range(0, len(passwords), step):
+            hashed_passwords += await asyncio.gather(
+                *(
+                    self._hash_shared(password)
+                    for password in passwords[start : start + step]
+                )
+            )
+        return hashed_passwords
+
+    @staticmethod
+    async def _hash_shared(password: str) -> str:
+        while True:
+            try:
+                return await password_hasher.hash(password)
+            except PasswordHasherBusy:
+                await asyncio.sleep(HASHER_BUSY_RETRY_SECONDS)
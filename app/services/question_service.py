@@ -63,6 +63,7 @@ class QuestionService:
     ) -> Dict[str, Any]:
         score = 0
         results = []
+        responses = []
 
         for user_answer in quiz_submit.answers:
             correct_answer = await self.repo_factory.questions.get_correct_answer(
@@ -79,11 +80,13 @@ class QuestionService:
 
             question = await self.repo_factory.questions.get(user_answer.question_id)
 
-            await self.repo_factory.user_responses.create(
-                user_id=user_id,
-                question_id=user_answer.question_id,
-                answer_id=user_answer.answer_id,
-                is_correct=is_correct,
+            responses.append(
+                {
+                    "user_id": user_id,
+                    "question_id": user_answer.question_id,
+                    "answer_id": user_answer.answer_id,
+                    "is_correct": is_correct,
+                }
             )
 
             results.append(
@@ -96,6 +99,8 @@ class QuestionService:
                 }
             )
 
+        await self.repo_factory.user_responses.create_many(responses)
+        await self.repo_factory.score_buckets.add_scores({user_id: score})
         await self.repo_factory.users.update_score(user_id, score)
 
         total_questions = len(quiz_submit.answers)
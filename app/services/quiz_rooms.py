@@ -0,0 +1,317 @@
+"""Live multiplayer quiz rooms held in process memory."""
+
+import asyncio
+import json
+import secrets
+from bisect import bisect_left, insort
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.pubsub import Broadcaster, Subscription
+from app.database import unit_of_work
+from app.middleware.logger import logger
+from app.repositories import RepositoryFactory
+from app.schemas.quiz import GeneratedQuiz, StreamAnswer
+from app.services.quiz_service import AnswerKey, quiz_sessions
+from app.shared.exceptions.rooms import RoomFullError, RoomStateError
+
+WAITING = "waiting"
+RUNNING = "running"
+FINISHED = "finished"
+
+
+def encode(message: dict[str, Any]) -> str:
+    """Serialize a message once for every subscriber that receives it."""
+    return json.dumps(message, default=str)
+
+
+class RoomScoreboard:
+    """Scores kept sorted as `(-score, user_id)` and updated per answer."""
+
+    def __init__(self) -> None:
+        self.scores: dict[int, int] = {}
+        self._ranking: list[tuple[int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def add_player(self, user_id: int) -> None:
+        if user_id not in self.scores:
+            self.scores[user_id] = 0
+            insort(self._ranking, (0, user_id))
+
+    def add_points(self, user_id: int, points: int) -> int:
+        score = self.scores[user_id]
+        del self._ranking[bisect_left(self._ranking, (-score, user_id))]
+        score += points
+        self.scores[user_id] = score
+        insort(self._ranking, (-score, user_id))
+        return score
+
+    def top(self, n: int) -> list[tuple[int, int]]:
+        """The `n` best `(user_id, score)` pairs, ties broken by user ID."""
+        return [(user_id, -score) for score, user_id in self._ranking[:n]]
+
+
+class QuizRoom:
+    """One quiz played by many players at the same pace.
+
+    Every message is serialized once and fanned out through a `Broadcaster`;
+    players who fall `QUIZ_ROOM_QUEUE_SIZE` messages behind are dropped.
+    Answers only touch the in-memory scoreboard; responses and scores are
+    written in bulk once, when the room finishes.
+    """
+
+    def __init__(
+        self,
+        code: str,
+        host_id: int,
+        questions: list[dict[str, Any]],
+        answer_key: AnswerKey,
+        question_seconds: float = settings.QUIZ_ROOM_QUESTION_SECONDS,
+        max_players: int = settings.QUIZ_ROOM_MAX_PLAYERS,
+        queue_size: int = settings.QUIZ_ROOM_QUEUE_SIZE,
+        standings_size: int = settings.QUIZ_ROOM_STANDINGS_SIZE,
+    ) -> None:
+        self.code = code
+        self.host_id = host_id
+        self.questions = questions
+        self.answer_key = answer_key
+        self.question_seconds = question_seconds
+        self.max_players = max_players
+        self.standings_size = standings_size
+        self.state = WAITING
+        self.broadcaster: Broadcaster[str] = Broadcaster(queue_size)
+        self.scoreboard = RoomScoreboard()
+        self.usernames: dict[int, str] = {}
+        self.responses: list[dict[str, Any]] = []
+        self.task: asyncio.Task | None = None
+        self._current: int | None = None
+        self._answered: set[int] = set()
+        self._all_answered = asyncio.Event()
+
+    def join(self, user_id: int, username: str) -> Subscription[str]:
+        if self.state == FINISHED:
+            raise RoomStateError(self.code, self.state)
+        full = len(self.usernames) >= self.max_players
+        if full and user_id not in self.usernames:
+            raise RoomFullError(self.code)
+        self.usernames[user_id] = username
+        self.scoreboard.add_player(user_id)
+        subscription = self.broadcaster.subscribe()
+        subscription.push(encode({"type": "room", **self.snapshot()}))
+        self._publish({"type": "joined", "username": username})
+        return subscription
+
+    def leave(self, subscription: Subscription[str]) -> None:
+        self.broadcaster.unsubscribe(subscription)
+        self._check_all_answered()
+
+    def answer(self, user_id: int, answer_id: int) -> dict[str, Any]:
+        """Grade a player's first answer to the current question.
+
+        An `answer_id` that is not one of the question's answers is refused
+        and the player may still answer.
+        """
+        if self.state != RUNNING or self._current is None:
+            return {"type": "error", "detail": "No question is open"}
+        if user_id in self._answered:
+            return {"type": "error", "detail": "Already answered"}
+
+        question_id = self.questions[self._current]["id"]
+        correct_answer_id, _, answer_ids = self.answer_key[question_id]
+        if answer_id not in answer_ids:
+            return {"type": "error", "detail": "Unknown answer"}
+        is_correct = correct_answer_id is not None and answer_id == correct_answer_id
+        self._answered.add(user_id)
+        score = self.scoreboard.add_points(user_id, int(is_correct))
+        if correct_answer_id is not None:
+            self.responses.append(
+                {
+                    "user_id": user_id,
+                    "question_id": question_id,
+                    "answer_id": answer_id,
+                    "is_correct": is_correct,
+                }
+            )
+        self._check_all_answered()
+        return {"type": "answered", "question_id": question_id, "score": score}
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        if self.state != WAITING:
+            raise RoomStateError(self.code, self.state)
+        self.state = RUNNING
+        self.task = asyncio.create_task(self.run(session_factory))
+
+    async def run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.state = RUNNING
+        try:
+            for index, question in enumerate(self.questions):
+                self._current = index
+                self._answered.clear()
+                self._all_answered.clear()
+                self._publish(
+                    {
+                        "type": "question",
+                        "index": index,
+                        "total": len(self.questions),
+                        "seconds": self.question_seconds,
+                        "question": {
+                            key: value
+                            for key, value in question.items()
+                            if key != "explanation"
+                        },
+                    }
+                )
+                try:
+                    await asyncio.wait_for(
+                        self._all_answered.wait(), self.question_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+                self._current = None
+                correct_answer_id, explanation, _ = self.answer_key[question["id"]]
+                self._publish(
+                    {
+                        "type": "reveal",
+                        "question_id": question["id"],
+                        "correct_answer_id": correct_answer_id,
+                        "explanation": explanation,
+                        "standings": self.standings(),
+                    }
+                )
+        finally:
+            self.state = FINISHED
+            self._publish({"type": "finished", "standings": self.standings()})
+            self.broadcaster.close()
+            quiz_rooms.discard(self.code)
+            await asyncio.shield(self._flush(session_factory))
+
+    def standings(self, n: int | None = None) -> list[dict[str, Any]]:
+        return [
+            {"username": self.usernames[user_id], "score": score}
+            for user_id, score in self.scoreboard.top(n or self.standings_size)
+        ]
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "code": self.code,
+            "state": self.state,
+            "players": len(self.usernames),
+            "connected": len(self.broadcaster),
+            "total_questions": len(self.questions),
+            "standings": self.standings(),
+        }
+
+    async def _flush(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Write every response and score of the room with one commit."""
+        if not self.responses:
+            return
+        players = {response["user_id"] for response in self.responses}
+        try:
+            async with unit_of_work(session_factory) as session:
+                repo_factory = RepositoryFactory(session)
+                await repo_factory.user_responses.create_many(self.responses)
+                scores = {
+                    user_id: self.scoreboard.scores[user_id] for user_id in players
+                }
+                await repo_factory.score_buckets.add_scores(scores)
+                await repo_factory.users.update_scores(scores)
+        except Exception as err:
+            logger.error(f"Failed to save the results of room {self.code}: {err}")
+
+    def _publish(self, message: dict[str, Any]) -> None:
+        self.broadcaster.publish(encode(message))
+
+    def _check_all_answered(self) -> None:
+        if self._current is not None and len(self._answered) >= len(self.broadcaster):
+            self._all_answered.set()
+
+
+class QuizRoomRegistry:
+    """Rooms of this worker by code; rooms that never finish expire."""
+
+    def __init__(self, max_rooms: int, ttl_seconds: int) -> None:
+        self._rooms: TTLCache[str, QuizRoom] = TTLCache(max_rooms, ttl_seconds)
+
+    def create(self, host_id: int, quiz: GeneratedQuiz) -> QuizRoom:
+        """Open a room for a quiz made by `QuizService.generate_quiz`."""
+        _, answer_key = quiz_sessions.pop(quiz.session_id) or (None, {})
+        code = secrets.token_hex(4)
+        room = QuizRoom(code, host_id, quiz.questions, answer_key)
+        self._rooms.set(code, room)
+        return room
+
+    def get(self, code: str) -> QuizRoom | None:
+        return self._rooms.get(code)
+
+    def discard(self, code: str) -> None:
+        self._rooms.discard(code)
+
+    def clear(self) -> None:
+        self._rooms.clear()
+
+    def stats(self) -> dict[str, Any]:
+        rooms = self._rooms.values()
+        return {
+            **self._rooms.stats(),
+            "players": sum(len(room.broadcaster) for room in rooms),
+            "dropped": sum(room.broadcaster.dropped for room in rooms),
+        }
+
+
+quiz_rooms = QuizRoomRegistry(
+    max_rooms=settings.QUIZ_ROOM_MAX_ROOMS,
+    ttl_seconds=settings.QUIZ_ROOM_TTL_SECONDS,
+)
+
+
+async def serve_player(
+    websocket: WebSocket, room: QuizRoom, user_id: int, username: str
+) -> None:
+    """Relay room messages to an accepted WebSocket and answers back."""
+    subscription = room.join(user_id, username)
+
+    async def send() -> None:
+        async for message in subscription:
+            await websocket.send_text(message)
+
+    async def receive() -> None:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                answer = StreamAnswer.model_validate_json(message)
+            except ValidationError as err:
+                result = {"type": "error", "detail": err.errors(include_url=False)}
+            else:
+                result = room.answer(user_id, answer.answer_id)
+            subscription.push(encode(result))
+
+    sender = asyncio.create_task(send())
+    receiver = asyncio.create_task(receive())
+    try:
+        await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        sender.cancel()
+        receiver.cancel()
+        results = await asyncio.gather(sender, receiver, return_exceptions=True)
+        room.leave(subscription)
+
+    for result in results:
+        if isinstance(result, WebSocketDisconnect):
+            return
+        if isinstance(result, Exception):
+            raise result
+
+    if subscription.dropped:
+        await websocket.close(
+            code=status.WS_1008_POLICY_VIOLATION, reason="Too far behind"
+        )
+    else:
+        await websocket.close()
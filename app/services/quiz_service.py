@@ -1,83 +1,229 @@
+import hashlib
+import json
+import random
+import uuid
 from typing import Any
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.indexes.answer_keys import AnswerKeyEntry
 from app.repositories import RepositoryFactory
-from app.schemas.quiz import QuizRequest, QuizSubmit
+from app.schemas.quiz import GeneratedQuiz, QuizRequest, QuizSubmit
+
+AnswerKey = dict[int, AnswerKeyEntry]
+# The player a quiz was generated for (None if anonymous) and its answer key.
+QuizSession = tuple[int | None, AnswerKey]
+
+# Generated quizzes: session_id -> (user_id,
+# {question_id: (answer_id, explanation, answer_ids)}).
+quiz_sessions: TTLCache[str, QuizSession] = TTLCache(
+    maxsize=settings.QUIZ_SESSION_MAX_ENTRIES,
+    ttl_seconds=settings.QUIZ_SESSION_TTL_SECONDS,
+)
+
+SeededQuizKey = tuple[str, int | None, str | None, int, str]
+RenderedQuiz = tuple[list[dict[str, Any]], AnswerKey, str]
+
+# Rendered seeded quizzes, keyed on (seed, category_id, difficulty,
+# num_questions, question bank version) -> (questions, answer key, ETag).
+seeded_quizzes: TTLCache[SeededQuizKey, RenderedQuiz] = TTLCache(
+    maxsize=settings.SEEDED_QUIZ_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEEDED_QUIZ_CACHE_TTL_SECONDS,
+)
 
 
 class QuizService:
     def __init__(self, repository_factory: RepositoryFactory):
         self.repo_factory = repository_factory
 
-    async def generate_quiz(self, quiz_request: QuizRequest) -> list[dict[str, Any]]:
-        """Generate a simple quiz game."""
-
-        difficult = quiz_request.difficulty.upper() if quiz_request.difficulty else None
-        questions = await self.repo_factory.questions.get_random_questions(
+    async def generate_quiz(
+        self, quiz_request: QuizRequest, user_id: int | None = None
+    ) -> GeneratedQuiz:
+        """Generate a simple quiz game.
+
+        The answer key is kept in the quiz session store under the returned
+        `session_id`, together with `user_id`.
+
+        Quizzes with a `seed` are reproducible: the same seed, filters and
+        question bank version always give the same quiz, which is rendered
+        once and then served from `seeded_quizzes` with an ETag. They are
+        shared between players, so `exclude_seen` does not apply to them.
+        """
+        etag = None
+        if quiz_request.seed is not None:
+            questions, answer_key, etag = await self._render_seeded_quiz(quiz_request)
+        else:
+            questions, answer_key = await self.assemble_quiz(quiz_request, user_id)
+
+        session_id = uuid.uuid4().hex
+        quiz_sessions.set(session_id, (user_id, answer_key))
+
+        return GeneratedQuiz(session_id=session_id, questions=questions, etag=etag)
+
+    async def _render_seeded_quiz(self, quiz_request: QuizRequest) -> RenderedQuiz:
+        difficulty = quiz_request.difficulty.value if quiz_request.difficulty else None
+        version = await self.repo_factory.questions.get_question_bank_version()
+        key = (
+            quiz_request.seed,
+            quiz_request.category_id or None,
+            difficulty,
+            quiz_request.num_questions,
+            version,
+        )
+        rendered = seeded_quizzes.get(key)
+        if rendered is None:
+            rng = random.Random("|".join(str(part) for part in key[:4]))
+            questions, answer_key = await self.assemble_quiz(
+                quiz_request.model_copy(update={"exclude_seen": False}), rng=rng
+            )
+            payload = json.dumps(questions, sort_keys=True, default=str)
+            etag = f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+            rendered = (questions, answer_key, etag)
+            seeded_quizzes.set(key, rendered)
+        return rendered
+
+    async def assemble_quiz(
+        self,
+        quiz_request: QuizRequest,
+        user_id: int | None = None,
+        rng: random.Random | None = None,
+    ) -> tuple[list[dict[str, Any]], AnswerKey]:
+        """Pick the questions of a quiz and build its answer key.
+
+        Question IDs are sampled from the in-process index and the quiz is
+        assembled from a single projection query, so the number of queries
+        does not depend on `num_questions`.
+
+        With `exclude_seen`, questions the player has already answered are
+        skipped, or served last when `fill_with_seen` is set and the pool
+        runs out.
+        """
+        seen = None
+        if user_id is not None and quiz_request.exclude_seen:
+            seen = await self.repo_factory.user_responses.get_seen_question_ids(user_id)
+
+        question_ids = await self.repo_factory.questions.sample_question_ids(
             category_id=quiz_request.category_id,
-            difficulty=difficult,
+            difficulty=quiz_request.difficulty,
             limit=quiz_request.num_questions,
+            exclude=seen,
+            fill_with_excluded=quiz_request.fill_with_seen,
+            rng=rng,
         )
-
-        formatted_questions = []
-        for question in questions:
-            formatted_questions.append(
-                {
-                    "id": question.id,
-                    "question_text": question.question_text,
-                    "category": await self.repo_factory.categories.get(
-                        question.category_id
+        rows = await self.repo_factory.questions.get_quiz_rows(question_ids)
+
+        questions: dict[int, dict[str, Any]] = {}
+        answer_key: AnswerKey = {}
+        for row in rows:
+            question = questions.get(row.id)
+            if question is None:
+                question = questions[row.id] = {
+                    "id": row.id,
+                    "question_text": row.question_text,
+                    "category": (
+                        {
+                            "id": row.category_id,
+                            "category": row.category,
+                            "created_at": row.category_created_at,
+                            "updated_at": row.category_updated_at,
+                        }
+                        if row.category is not None
+                        else None
                     ),
-                    "explanation": question.explanation,
-                    "difficulty": question.difficulty.value,
-                    "answers": [
-                        {"id": answer.id, "answer_text": answer.answer_text}
-                        for answer in await self.repo_factory.answers.get_by_question_id(
-                            question.id
-                        )
-                    ],
+                    "explanation": row.explanation,
+                    "difficulty": row.difficulty.value,
+                    "answers": [],
                 }
-            )
-
-        return formatted_questions
+                answer_key[row.id] = (None, row.explanation, ())
+            if row.answer_id is not None:
+                question["answers"].append(
+                    {"id": row.answer_id, "answer_text": row.answer_text}
+                )
+                correct_answer_id, explanation, answer_ids = answer_key[row.id]
+                if row.is_correct:
+                    correct_answer_id = row.answer_id
+                answer_key[row.id] = (
+                    correct_answer_id,
+                    explanation,
+                    answer_ids + (row.answer_id,),
+                )
+
+        return [
+            questions[question_id]
+            for question_id in question_ids
+            if question_id in questions
+        ], answer_key
 
     async def submit_quiz(
         self, user_id: int, quiz_submit: QuizSubmit
     ) -> dict[str, Any]:
+        """Grade a submission.
+
+        Submissions for a known quiz session are graded from the cached
+        answer key, and answers to questions outside that quiz are ignored.
+        A session generated for another player is left alone and treated as
+        unknown.
+        Without a session, or once it has expired, the correct answers for
+        all submitted questions are resolved with a single query. An
+        `answer_id` that is not one of the question's answers is recorded as
+        no answer, so it cannot fail the insert.
+
+        The responses are written with one bulk insert and committed
+        together with the score update.
+        """
+        answer_key = None
+        session = (
+            quiz_sessions.peek(quiz_submit.session_id)
+            if quiz_submit.session_id
+            else None
+        )
+        if session is not None and session[0] in (None, user_id):
+            quiz_sessions.pop(quiz_submit.session_id)
+            answer_key = session[1]
+        if answer_key is None:
+            answer_key = await self.repo_factory.questions.get_answer_keys(
+                user_answer.question_id for user_answer in quiz_submit.answers
+            )
+
         score = 0
         results = []
+        responses = []
 
         for user_answer in quiz_submit.answers:
-            correct_answer = await self.repo_factory.questions.get_correct_answer(
-                user_answer.question_id
+            correct_answer_id, explanation, answer_ids = answer_key.get(
+                user_answer.question_id, (None, None, ())
             )
-
-            if not correct_answer:
+            if correct_answer_id is None:
                 continue
 
-            is_correct = user_answer.answer_id == correct_answer.id
+            answer_id = (
+                user_answer.answer_id if user_answer.answer_id in answer_ids else None
+            )
+            is_correct = answer_id == correct_answer_id
 
             if is_correct:
                 score += 1
 
-            question = await self.repo_factory.questions.get(user_answer.question_id)
-
-            await self.repo_factory.user_responses.create(
-                user_id=user_id,
-                question_id=user_answer.question_id,
-                answer_id=user_answer.answer_id,
-                is_correct=is_correct,
+            responses.append(
+                {
+                    "user_id": user_id,
+                    "question_id": user_answer.question_id,
+                    "answer_id": answer_id,
+                    "is_correct": is_correct,
+                }
             )
-
             results.append(
                 {
                     "question_id": user_answer.question_id,
                     "user_answer_id": user_answer.answer_id,
-                    "correct_answer_id": correct_answer.id,
+                    "correct_answer_id": correct_answer_id,
                     "is_correct": is_correct,
-                    "explanation": question.explanation if question else None,
+                    "explanation": explanation,
                 }
             )
 
+        await self.repo_factory.user_responses.create_many(responses)
+        await self.repo_factory.score_buckets.add_scores({user_id: score})
         await self.repo_factory.users.update_score(user_id, score)
 
         total_questions = len(quiz_submit.answers)
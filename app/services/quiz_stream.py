@@ -0,0 +1,196 @@
+"""Quizzes played over a WebSocket, one question at a time."""
+
+import asyncio
+import time
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.database import unit_of_work
+from app.middleware.logger import logger
+from app.repositories import RepositoryFactory
+from app.schemas.quiz import QuizRequest, StreamAnswer
+from app.services.quiz_service import AnswerKey, QuizService
+
+
+class ConnectionLimiter:
+    """Counts open connections of one kind and refuses them past `limit`."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.active = 0
+        self.rejected = 0
+
+    def try_acquire(self) -> bool:
+        if self.active >= self.limit:
+            self.rejected += 1
+            return False
+        self.active += 1
+        return True
+
+    def release(self) -> None:
+        self.active -= 1
+
+    def stats(self) -> dict[str, Any]:
+        return {"active": self.active, "limit": self.limit, "rejected": self.rejected}
+
+
+quiz_streams = ConnectionLimiter(settings.QUIZ_WS_MAX_CONNECTIONS)
+
+
+class QuizStream:
+    """One player's quiz on an accepted WebSocket.
+
+    The next question is only sent once the previous one is answered, so a
+    connection never has more than one message queued in either direction.
+    The answer key stays in this object and no database session is held
+    while waiting for the player: graded responses are buffered and written
+    once `flush_batch_size` of them are pending or `flush_interval` seconds
+    have passed, and the rest when the quiz ends or the client goes away.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        session_factory: async_sessionmaker[AsyncSession],
+        user_id: int,
+        quiz_request: QuizRequest,
+        answer_timeout: float = settings.QUIZ_WS_ANSWER_TIMEOUT_SECONDS,
+        flush_batch_size: int = settings.QUIZ_WS_FLUSH_BATCH_SIZE,
+        flush_interval: float = settings.QUIZ_WS_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self.websocket = websocket
+        self.session_factory = session_factory
+        self.user_id = user_id
+        self.quiz_request = quiz_request
+        self.answer_timeout = answer_timeout
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval = flush_interval
+        self.answer_key: AnswerKey = {}
+        self.score = 0
+        self.answered = 0
+        self._pending: list[dict[str, Any]] = []
+        self._flushed_at = time.monotonic()
+
+    async def run(self) -> None:
+        async with self.session_factory() as session:
+            questions, self.answer_key = await QuizService(
+                RepositoryFactory(session)
+            ).assemble_quiz(self.quiz_request, self.user_id)
+
+        try:
+            for index, question in enumerate(questions):
+                await self.websocket.send_json(
+                    {
+                        "type": "question",
+                        "index": index,
+                        "total": len(questions),
+                        "question": question,
+                    }
+                )
+                result = await self._receive_answer(question["id"])
+                await self.websocket.send_json({"type": "result", **result})
+                if self._should_flush():
+                    await self._flush()
+
+            await self.websocket.send_json(
+                {
+                    "type": "summary",
+                    "score": self.score,
+                    "total_questions": len(questions),
+                    "percentage": (
+                        self.score / len(questions) * 100 if questions else 0
+                    ),
+                }
+            )
+            await self.websocket.close()
+        except WebSocketDisconnect:
+            logger.info(f"Quiz stream of user {self.user_id} disconnected.")
+        except asyncio.TimeoutError:
+            await self.websocket.send_json(
+                {"type": "error", "detail": "No answer received in time"}
+            )
+            await self.websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        finally:
+            # Keep what was answered even if the handler is being cancelled.
+            await asyncio.shield(self._finish())
+
+    async def _receive_answer(self, question_id: int) -> dict[str, Any]:
+        while True:
+            message = await asyncio.wait_for(
+                self.websocket.receive_text(), self.answer_timeout
+            )
+            try:
+                answer = StreamAnswer.model_validate_json(message)
+            except ValidationError as err:
+                await self.websocket.send_json(
+                    {"type": "error", "detail": err.errors(include_url=False)}
+                )
+                continue
+            if answer.question_id not in (None, question_id):
+                await self.websocket.send_json(
+                    {
+                        "type": "error",
+                        "detail": f"Expected an answer to question {question_id}",
+                    }
+                )
+                continue
+            answer_ids = self.answer_key[question_id][2]
+            if answer_ids and answer.answer_id not in answer_ids:
+                await self.websocket.send_json(
+                    {
+                        "type": "error",
+                        "detail": f"Answer {answer.answer_id} is not an answer "
+                        f"to question {question_id}",
+                    }
+                )
+                continue
+            return self._grade(question_id, answer.answer_id)
+
+    def _grade(self, question_id: int, answer_id: int) -> dict[str, Any]:
+        correct_answer_id, explanation, _ = self.answer_key[question_id]
+        is_correct = correct_answer_id is not None and answer_id == correct_answer_id
+        if correct_answer_id is not None:
+            self.answered += 1
+            self.score += is_correct
+            self._pending.append(
+                {
+                    "user_id": self.user_id,
+                    "question_id": question_id,
+                    "answer_id": answer_id,
+                    "is_correct": is_correct,
+                }
+            )
+        return {
+            "question_id": question_id,
+            "user_answer_id": answer_id,
+            "correct_answer_id": correct_answer_id,
+            "is_correct": is_correct,
+            "explanation": explanation,
+        }
+
+    def _should_flush(self) -> bool:
+        return len(self._pending) >= self.flush_batch_size or (
+            bool(self._pending)
+            and time.monotonic() - self._flushed_at >= self.flush_interval
+        )
+
+    async def _flush(self) -> None:
+        responses, self._pending = self._pending, []
+        self._flushed_at = time.monotonic()
+        async with unit_of_work(self.session_factory) as session:
+            await RepositoryFactory(session).user_responses.create_many(responses)
+
+    async def _finish(self) -> None:
+        """Write the remaining responses and count the game, in one commit."""
+        if not self.answered:
+            return
+        responses, self._pending = self._pending, []
+        async with unit_of_work(self.session_factory) as session:
+            repo_factory = RepositoryFactory(session)
+            await repo_factory.user_responses.create_many(responses)
+            await repo_factory.score_buckets.add_scores({self.user_id: self.score})
+            await repo_factory.users.update_score(self.user_id, self.score)
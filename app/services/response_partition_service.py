@@ -0,0 +1,71 @@
+"""Creation and retirement of the monthly user_responses partitions."""
+
+import asyncio
+from datetime import date, datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.middleware.logger import logger
+from app.repositories import RepositoryFactory
+from app.repositories.response_partition_repository import next_month
+
+
+def month_offset(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class ResponsePartitionService:
+    def __init__(self, repository_factory: RepositoryFactory) -> None:
+        self.repo_factory = repository_factory
+
+    async def maintain(self, today: date | None = None) -> dict[str, list[date]]:
+        """Create upcoming monthly partitions and retire expired ones.
+
+        Partitions exist from the current month to
+        `USER_RESPONSES_PARTITIONS_AHEAD` months ahead. Those older than
+        `USER_RESPONSES_RETENTION_MONTHS` are rolled up, then detached or
+        dropped. Workers starting together may all run this; each change is
+        made under a lock by whichever gets there first.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        current = today.replace(day=1)
+        repository = self.repo_factory.response_partitions
+        existing = await repository.get_partition_months()
+
+        created = []
+        month = current
+        while month <= month_offset(current, settings.USER_RESPONSES_PARTITIONS_AHEAD):
+            if month not in existing and await repository.create_partition(month):
+                created.append(month)
+            month = next_month(month)
+
+        retired = []
+        if settings.USER_RESPONSES_RETENTION_MONTHS:
+            oldest = month_offset(current, -settings.USER_RESPONSES_RETENTION_MONTHS)
+            for month in existing:
+                if month < oldest:
+                    rows = await repository.retire_partition(
+                        month, drop=settings.USER_RESPONSES_RETENTION_ACTION == "drop"
+                    )
+                    if rows is not None:
+                        retired.append(month)
+        return {"created": created, "retired": retired}
+
+
+async def maintain_response_partitions_periodically(
+    session_factory: async_sessionmaker[AsyncSession], interval_seconds: int
+) -> None:
+    """Run `maintain` every `interval_seconds` until cancelled."""
+    while True:
+        try:
+            async with session_factory() as session:
+                changes = await ResponsePartitionService(
+                    RepositoryFactory(session)
+                ).maintain()
+            if changes["created"] or changes["retired"]:
+                logger.info(f"Response partitions changed: {changes}")
+        except Exception as err:
+            logger.error(f"Failed to maintain response partitions: {err}")
+        await asyncio.sleep(interval_seconds)
@@ -0,0 +1,57 @@
+"""Retention of the daily, weekly and monthly leaderboard buckets."""
+
+import asyncio
+from datetime import date, datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.middleware.logger import logger
+from app.models.quiz import LeaderboardPeriod
+from app.repositories import RepositoryFactory
+from app.repositories.score_bucket_repository import period_start
+
+
+def retention_cutoffs(today: date) -> dict[LeaderboardPeriod, date]:
+    """Earliest bucket start kept for each period, counting the current one."""
+    week = period_start(LeaderboardPeriod.WEEK, today)
+    month = period_start(LeaderboardPeriod.MONTH, today)
+    months = month.year * 12 + month.month - 1 - settings.SCORE_BUCKET_RETENTION_MONTHS
+    return {
+        LeaderboardPeriod.DAY: date.fromordinal(
+            today.toordinal() - settings.SCORE_BUCKET_RETENTION_DAYS
+        ),
+        LeaderboardPeriod.WEEK: date.fromordinal(
+            week.toordinal() - 7 * settings.SCORE_BUCKET_RETENTION_WEEKS
+        ),
+        LeaderboardPeriod.MONTH: date(months // 12, months % 12 + 1, 1),
+    }
+
+
+class ScoreBucketService:
+    def __init__(self, repository_factory: RepositoryFactory) -> None:
+        self.repo_factory = repository_factory
+
+    async def purge_expired(self, today: date | None = None) -> int:
+        """Drop the buckets that fell out of the retention window."""
+        today = today or datetime.now(timezone.utc).date()
+        return await self.repo_factory.score_buckets.delete_older_than(
+            retention_cutoffs(today)
+        )
+
+
+async def purge_score_buckets_periodically(
+    session_factory: async_sessionmaker[AsyncSession], interval_seconds: int
+) -> None:
+    """Run `purge_expired` every `interval_seconds` until cancelled."""
+    while True:
+        try:
+            async with session_factory() as session:
+                deleted = await ScoreBucketService(
+                    RepositoryFactory(session)
+                ).purge_expired()
+            if deleted:
+                logger.info(f"Purged {deleted} expired score buckets")
+        except Exception as err:
+            logger.error(f"Failed to purge score buckets: {err}")
+        await asyncio.sleep(interval_seconds)
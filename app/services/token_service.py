@@ -0,0 +1,70 @@
+"""Logout: revocation of bearer tokens before they expire."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.security import (
+    decode_access_token,
+    revoked_tokens,
+    token_digest,
+    verified_tokens,
+)
+from app.middleware.logger import logger
+from app.repositories import RepositoryFactory
+
+
+class TokenService:
+    def __init__(self, repository_factory: RepositoryFactory) -> None:
+        self.repo_factory = repository_factory
+
+    async def revoke(self, token: str) -> None:
+        """Deny `token` from now on; raises `JWTError` if it is not valid."""
+        claims = decode_access_token(token)
+        expires_at = claims.get(
+            "exp", time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        )
+        digest = token_digest(token)
+        revoked_tokens.add(digest, expires_at)
+        verified_tokens.discard(digest)
+        if settings.TOKEN_REVOCATION_PERSIST:
+            await self.repo_factory.revoked_tokens.add(
+                digest, datetime.fromtimestamp(expires_at, timezone.utc)
+            )
+
+    async def load_revocations(self) -> int:
+        """Add the stored, unexpired revocations to the in-memory denylist."""
+        tokens = await self.repo_factory.revoked_tokens.get_active()
+        for token in tokens:
+            revoked_tokens.add(token.digest, token.expires_at.timestamp())
+            verified_tokens.discard(token.digest)
+        return len(tokens)
+
+    async def sync(self) -> int:
+        """Pick up revocations made by other workers and delete expired ones.
+
+        Returns the number of deleted revocations.
+        """
+        await self.load_revocations()
+        return await self.repo_factory.revoked_tokens.delete_expired()
+
+
+async def sync_revoked_tokens_periodically(
+    session_factory: async_sessionmaker[AsyncSession], interval_seconds: int
+) -> None:
+    """Run `sync` every `interval_seconds` until cancelled.
+
+    The first run is one interval in; load the denylist at startup.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with session_factory() as session:
+                deleted = await TokenService(RepositoryFactory(session)).sync()
+            if deleted:
+                logger.info(f"Deleted {deleted} expired token revocations")
+        except Exception as err:
+            logger.error(f"Failed to sync token revocations: {err}")
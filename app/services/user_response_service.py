@@ -1,5 +1,6 @@
-from typing import List
+from typing import Any, List
 
+from app.core.pagination import decode_cursor, encode_cursor
 from app.repositories import RepositoryFactory
 
 
@@ -10,5 +11,21 @@ class UserResponseService:
     async def foo(
         self,
     ) -> List[str]:
-
         return ["Foo", "Bar"]
+
+    async def get_history(
+        self, user_id: int, limit: int, cursor: str | None = None
+    ) -> dict[str, Any]:
+        """A page of the user's responses, newest first.
+
+        Raises `InvalidCursorError` for a cursor this service did not issue.
+        """
+        before = decode_cursor(cursor) if cursor else None
+        responses = await self.repo_factory.user_responses.get_user_responses(
+            user_id, limit + 1, before
+        )
+        next_cursor = None
+        if len(responses) > limit:
+            responses = responses[:limit]
+            next_cursor = encode_cursor((responses[-1].created_at, responses[-1].id))
+        return {"items": responses, "next_cursor": next_cursor}
@@ -2,6 +2,7 @@ from typing import Any
 
 from app.repositories import RepositoryFactory
 from app.schemas.user import UserCreate, UserUpdate
+from app.models.quiz import DifficultyLevel, LeaderboardPeriod
 from app.models.user import User
 
 
@@ -27,24 +28,51 @@ class UserService:
     async def get_user_by_username(self, username: str) -> User | None:
         return await self.repo_factory.users.get_by_username(username)
 
+    async def get_principal(self, username: str) -> User | None:
+        return await self.repo_factory.users.get_principal(username)
+
     async def get_user_by_email(self, email: str) -> User | None:
         return await self.repo_factory.users.get_by_email(email)
 
     async def update_user(self, user_id: int, user_in: UserUpdate) -> User | None:
         return await self.repo_factory.users.update(user_id, user_in)
 
+    async def set_user_active(self, user_id: int, is_active: bool) -> User | None:
+        return await self.repo_factory.users.set_active(user_id, is_active)
+
     async def update_user_score(self, user_id: int, score: int) -> User | None:
         return await self.repo_factory.users.update_score(user_id, score)
 
-    async def get_leaderboard(self, limit: int = 10) -> list[dict[str, Any]]:
+    async def get_leaderboard(
+        self,
+        limit: int = 10,
+        period: LeaderboardPeriod | None = None,
+        category_id: int | None = None,
+        difficulty: DifficultyLevel | None = None,
+    ) -> list[dict[str, Any]]:
+        if category_id is not None or difficulty is not None:
+            if period is not None:
+                raise ValueError(
+                    "Period leaderboards cannot be scoped by category or difficulty."
+                )
+            return await self.repo_factory.category_scores.get_leaderboard(
+                category_id, difficulty, limit
+            )
+        if period is not None:
+            return await self.repo_factory.score_buckets.get_leaderboard(period, limit)
         return await self.repo_factory.users.get_leaderboard(limit)
 
+    async def get_leaderboard_position(
+        self, user_id: int, radius: int = 5
+    ) -> dict[str, Any]:
+        return await self.repo_factory.users.get_leaderboard_position(user_id, radius)
+
     async def get_user_stats(self, user_id: int) -> dict[str, Any]:
         user = await self.get_user_by_id(user_id)
         if not user:
             raise ValueError("User not found")
 
-        stats = await self.repo_factory.user_responses.get_user_stats(user_id)
+        stats = await self.repo_factory.category_scores.get_user_stats(user_id)
 
         return {
             "user": {
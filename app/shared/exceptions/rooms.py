@@ -0,0 +1,34 @@
+from fastapi import HTTPException
+from fastapi import status
+
+
+class RoomNotFoundError(HTTPException):
+    def __init__(self, code: str):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Room {code} not found",
+        )
+
+
+class RoomNotHostError(HTTPException):
+    def __init__(self, code: str):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Only the host can start room {code}",
+        )
+
+
+class RoomStateError(HTTPException):
+    def __init__(self, code: str, state: str):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Room {code} is {state}",
+        )
+
+
+class RoomFullError(HTTPException):
+    def __init__(self, code: str):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Room {code} is full",
+        )
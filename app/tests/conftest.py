@@ -2,11 +2,25 @@ from typing import AsyncGenerator
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.core.config import settings
+from app.core.rate_limit import login_throttle
+from app.core.security import revoked_tokens, verified_tokens
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_session_factory, unit_of_work
+from app.indexes.answer_keys import answer_key_index
+from app.indexes.leaderboard import leaderboard
+from app.indexes.questions import question_index
+from app.indexes.seen_questions import seen_questions
+from app.models.answers import Answer
+from app.models.categories import Category
+from app.models.questions import Question
+from app.models.quiz import DifficultyLevel
+from app.repositories.user_repository import principals
+from app.services.quiz_rooms import quiz_rooms
+from app.services.quiz_service import quiz_sessions, seeded_quizzes
 
 if not settings.TEST_DATABASE_URL:
     raise Exception("Please provide an URL for the test database in the `.env` file.")
@@ -29,6 +43,23 @@ async def setup_test_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture(scope="function", autouse=True)
+def reset_in_process_state():
+    """Drop in-process indexes and caches that outlive the test tables."""
+    yield
+    question_index.invalidate()
+    answer_key_index.invalidate()
+    leaderboard.invalidate()
+    seen_questions.clear()
+    principals.clear()
+    verified_tokens.clear()
+    revoked_tokens.clear()
+    login_throttle.clear()
+    quiz_sessions.clear()
+    seeded_quizzes.clear()
+    quiz_rooms.clear()
+
+
 @pytest.fixture(scope="module")
 async def db() -> AsyncGenerator[AsyncSession, None]:
     """Get a fresh database session."""
@@ -41,12 +72,61 @@ async def async_client(db: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     """Create async test client with overridden dependency."""
 
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        async with TestingSessionLocal() as session:
+        async with unit_of_work(TestingSessionLocal) as session:
             yield session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
     async with AsyncClient(app=app, base_url="http://test") as client:
         yield client
 
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def question_bank():
+    """Ten questions with four answers each in a single category."""
+    async with TestingSessionLocal() as session:
+        category = Category(category="Python")
+        session.add(category)
+        await session.flush()
+        for number in range(10):
+            question = Question(
+                question_text=f"Question {number}",
+                difficulty=DifficultyLevel.EASY,
+                explanation=f"Explanation {number}",
+                category_id=category.id,
+            )
+            question.answers = [
+                Answer(answer_text=f"Answer {option}", is_correct=option == 0)
+                for option in range(4)
+            ]
+            session.add(question)
+        await session.commit()
+
+
+@pytest.fixture
+def query_counter():
+    """Count the SQL statements sent to the test database."""
+    statements = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+
+@pytest.fixture
+async def auth_headers(async_client):
+    """Register a player and return its bearer token headers."""
+    await async_client.post(
+        "/api/v1/users/register",
+        json={"username": "player", "email": "player@example.com", "password": "pw"},
+    )
+    response = await async_client.post(
+        "/api/v1/users/login", data={"username": "player", "password": "pw"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
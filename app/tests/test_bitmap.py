@@ -0,0 +1,24 @@
+from app.core.bitmap import ARRAY_LIMIT, CompactBitmap
+
+
+def test_compact_bitmap_membership():
+    """Values across containers are found; others are not."""
+    values = [0, 7, 65_535, 65_536, 1_000_000]
+    bitmap = CompactBitmap(values + [7])
+
+    assert len(bitmap) == len(values)
+    assert all(value in bitmap for value in values)
+    assert 8 not in bitmap
+    assert -1 not in bitmap
+    assert list(bitmap) == values
+
+
+def test_compact_bitmap_switches_dense_containers_to_bitmaps():
+    """A dense container keeps its values after turning into a bitmap."""
+    values = range(0, (ARRAY_LIMIT + 10) * 2, 2)
+    bitmap = CompactBitmap(values)
+
+    assert len(bitmap) == len(values)
+    assert list(bitmap) == list(values)
+    assert 1 not in bitmap
+    assert bitmap.memory_bytes() < (ARRAY_LIMIT + 10) * 8
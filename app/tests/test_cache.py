@@ -0,0 +1,33 @@
+import time
+
+from app.core.cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Once full, the least recently used entry is evicted."""
+    cache = TTLCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Entries are not returned once their TTL has passed."""
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    cache = TTLCache(maxsize=10, ttl_seconds=5)
+    cache.set("a", 1)
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 6)
+
+    assert cache.get("a") is None
+    assert cache.pop("a") is None
+    assert len(cache) == 0
+    assert cache.stats()["misses"] == 2
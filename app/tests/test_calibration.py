@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from app.core.calibration import (
+    add_sums,
+    count_chunk,
+    moment_chunk,
+    question_statistics,
+    user_totals,
+)
+from app.repositories import RepositoryFactory
+from app.services.calibration_service import CalibrationService
+from app.tests.conftest import TestingSessionLocal
+
+
+def simulated_responses(seed: int = 7, users: int = 2_000, questions: int = 20):
+    """Rasch-model answers of every user to every question."""
+    rng = np.random.default_rng(seed)
+    ability = rng.normal(size=users)
+    difficulty = np.linspace(-2, 2, questions)
+    user_ids = np.repeat(np.arange(1, users + 1), questions)
+    question_ids = np.tile(np.arange(1, questions + 1), users)
+    chance = 1 / (1 + np.exp(difficulty[question_ids - 1] - ability[user_ids - 1]))
+    return user_ids, question_ids, rng.random(len(user_ids)) < chance
+
+
+def calibrate(chunks, irt: bool = False, min_responses: int = 1):
+    counts = None
+    for chunk in chunks:
+        counts = add_sums(counts, count_chunk(*chunk))
+    user_answers, user_correct = user_totals(counts)
+    moments = None
+    for chunk in chunks:
+        moments = add_sums(
+            moments, moment_chunk(*chunk, user_answers, user_correct, irt=irt)
+        )
+    return question_statistics(counts, moments, min_responses)
+
+
+def test_statistics_match_a_direct_computation():
+    """Chunked sums give the p-value and the correlation with rest scores."""
+    users, questions, correct = simulated_responses()
+    parts = [slice(start, start + 3_001) for start in range(0, len(users), 3_001)]
+    chunks = [(users[part], questions[part], correct[part]) for part in parts]
+    statistics = calibrate(chunks)
+
+    per_user = correct.reshape(-1, 20)
+    for question_id in (1, 10, 20):
+        item = per_user[:, question_id - 1]
+        rest = (per_user.sum(axis=1) - item) / 19
+        assert statistics["responses"][question_id] == 2_000
+        assert statistics["p_value"][question_id] == pytest.approx(item.mean())
+        assert statistics["discrimination"][question_id] == pytest.approx(
+            np.corrcoef(item, rest)[0, 1]
+        )
+    assert np.isnan(statistics["discrimination"][0])
+
+
+def test_irt_difficulty_orders_questions():
+    """Rasch estimates rise with the simulated difficulty."""
+    statistics = calibrate([simulated_responses()], irt=True)
+
+    difficulty = statistics["irt_difficulty"][1:]
+    assert np.all(np.diff(difficulty) > 0)
+    assert difficulty[0] < -1 and difficulty[-1] > 1
+
+
+def test_small_samples_get_no_discrimination():
+    """Questions under `min_responses` usable answers keep only their p-value."""
+    users = np.array([1, 1, 2, 2, 3])
+    questions = np.array([1, 2, 1, 2, 2])
+    correct = np.array([True, False, False, True, True])
+
+    statistics = calibrate([(users, questions, correct)], min_responses=3)
+
+    assert statistics["p_value"][1] == 0.5
+    assert np.isnan(statistics["discrimination"][1])
+    assert statistics["responses"][2] == 3
+
+
+@pytest.mark.anyio
+async def test_calibration_job_saves_question_stats(
+    async_client, question_bank, auth_headers
+):
+    """The job streams the stored responses and upserts one row per question."""
+    for _ in range(2):
+        response = await async_client.post(
+            "/api/v1/quiz/generate", json={"num_questions": 10}
+        )
+        await async_client.post(
+            "/api/v1/quiz/submit",
+            json={
+                "session_id": response.headers["X-Quiz-Session-Id"],
+                "answers": [
+                    {
+                        "question_id": question["id"],
+                        "answer_id": question["answers"][0]["id"],
+                    }
+                    for question in response.json()
+                ],
+            },
+            headers=auth_headers,
+        )
+
+    async with TestingSessionLocal() as session:
+        service = CalibrationService(RepositoryFactory(session))
+        assert await service.calibrate(chunk_size=7, min_responses=1, irt=True) == 10
+        stats = await service.get_question_stats(1)
+
+    assert stats.responses == 2
+    assert stats.p_value == 1.0
+    assert stats.discrimination is None
@@ -0,0 +1,80 @@
+import pytest
+
+
+@pytest.mark.anyio
+async def test_review_schedules_card_and_due_queue(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """Reviews reschedule cards with one write; wrong answers stay due."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 2}
+    )
+    first, second = response.json()
+
+    query_counter.clear()
+    response = await async_client.post(
+        "/api/v1/cards/review",
+        json={"question_id": first["id"], "answer_id": first["answers"][0]["id"]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    assert response.json()["is_correct"]
+    assert response.json()["interval_days"] == 1
+    writes = [
+        statement
+        for statement in query_counter
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE"))
+    ]
+    assert len(writes) == 1
+
+    await async_client.post(
+        "/api/v1/cards/review",
+        json={"question_id": second["id"], "answer_id": second["answers"][1]["id"]},
+        headers=auth_headers,
+    )
+
+    response = await async_client.get("/api/v1/cards/due", headers=auth_headers)
+    assert [card["question"]["id"] for card in response.json()] == []
+
+    response = await async_client.post(
+        "/api/v1/cards/review",
+        json={"question_id": 999, "answer_id": 1},
+        headers=auth_headers,
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_import_turns_quiz_history_into_due_cards(
+    async_client, question_bank, auth_headers
+):
+    """Questions answered wrong in quizzes are due right away."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 3}
+    )
+    questions = response.json()
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][number % 2]["id"],
+                }
+                for number, question in enumerate(questions)
+            ],
+        },
+        headers=auth_headers,
+    )
+
+    response = await async_client.post("/api/v1/cards/import", headers=auth_headers)
+    assert response.json() == {"imported": 3}
+    response = await async_client.post("/api/v1/cards/import", headers=auth_headers)
+    assert response.json() == {"imported": 0}
+
+    response = await async_client.get("/api/v1/cards/due", headers=auth_headers)
+    due = response.json()
+    assert [card["question"]["id"] for card in due] == [questions[1]["id"]]
+    assert due[0]["lapses"] == 1
+    assert set(due[0]["question"]["answers"][0]) == {"id", "answer_text"}
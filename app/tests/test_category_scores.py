@@ -0,0 +1,123 @@
+import pytest
+
+from app.models.quiz import DifficultyLevel
+from app.repositories import RepositoryFactory
+from app.repositories.category_score_repository import _scope_order
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.mark.anyio
+async def test_category_and_difficulty_leaderboards(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """A submit counts towards its category, its difficulty and both together."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 3}
+    )
+    questions = response.json()
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][number > 0]["id"],
+                }
+                for number, question in enumerate(questions)
+            ],
+        },
+        headers=auth_headers,
+    )
+
+    for params in (
+        {"category_id": 1},
+        {"difficulty": "Easy"},
+        {"category_id": 1, "difficulty": "Easy"},
+    ):
+        query_counter.clear()
+        response = await async_client.get("/api/v1/users/leaderboard", params=params)
+        assert response.json() == [
+            {
+                "rank": 1,
+                "username": "player",
+                "correct_answers": 1,
+                "total_answers": 3,
+                "accuracy": 33.33,
+            }
+        ]
+        assert not any("user_responses" in statement for statement in query_counter)
+
+    response = await async_client.get(
+        "/api/v1/users/leaderboard", params={"category_id": 2}
+    )
+    assert response.json() == []
+
+    response = await async_client.get(
+        "/api/v1/users/leaderboard", params={"category_id": 1, "period": "week"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_user_stats_are_one_read_and_match_a_rebuild(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """Stats come from the rollup, and rebuilding it from responses agrees."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 4}
+    )
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][number % 2]["id"],
+                }
+                for number, question in enumerate(response.json())
+            ],
+        },
+        headers=auth_headers,
+    )
+
+    query_counter.clear()
+    response = await async_client.get("/api/v1/users/stats", headers=auth_headers)
+    stats = response.json()
+    assert stats["total_answers"] == 4
+    assert stats["correct_answers"] == 2
+    assert stats["by_category"] == {
+        "Python": {"total": 4, "correct": 2, "accuracy": 50.0}
+    }
+    assert stats["by_difficulty"] == {
+        "Easy": {"total": 4, "correct": 2, "accuracy": 50.0}
+    }
+    assert not any("user_responses" in statement for statement in query_counter)
+
+    async with TestingSessionLocal() as session:
+        assert await RepositoryFactory(session).category_scores.rebuild() == 4
+
+    response = await async_client.get("/api/v1/users/stats", headers=auth_headers)
+    assert response.json() == stats
+
+
+def test_upsert_rows_follow_one_order_across_writers():
+    """Scopes sort the same however they were collected, "all" parts first."""
+    scopes = [
+        (2, 1, DifficultyLevel.HARD),
+        (1, None, DifficultyLevel.EASY),
+        (1, 3, None),
+        (1, None, None),
+        (1, 3, DifficultyLevel.EASY),
+    ]
+    assert sorted(scopes, key=_scope_order) == sorted(
+        reversed(scopes), key=_scope_order
+    )
+    assert sorted(scopes, key=_scope_order) == [
+        (1, None, None),
+        (1, None, DifficultyLevel.EASY),
+        (1, 3, None),
+        (1, 3, DifficultyLevel.EASY),
+        (2, 1, DifficultyLevel.HARD),
+    ]
@@ -0,0 +1,110 @@
+import pytest
+
+from app.indexes.leaderboard import Leaderboard, leaderboard
+
+
+def make_leaderboard() -> Leaderboard:
+    board = Leaderboard()
+    board.rebuild(
+        [
+            (1, "ada", 10, 2),
+            (2, "bob", 30, 3),
+            (3, "cyd", 10, 1),
+            (4, "dee", 0, 0),
+        ]
+    )
+    return board
+
+
+def test_leaderboard_orders_by_score_then_user_id():
+    """Higher scores rank first; ties go to the lower user ID."""
+    board = make_leaderboard()
+
+    assert [entry["username"] for entry in board.top(10)] == ["bob", "ada", "cyd"]
+    assert board.top(1) == [
+        {
+            "rank": 1,
+            "username": "bob",
+            "total_score": 30,
+            "games_played": 3,
+            "avg_score": 10.0,
+        }
+    ]
+    assert [board.rank(user_id) for user_id in (1, 2, 3, 4)] == [2, 1, 3, None]
+
+
+def test_leaderboard_updates_in_place():
+    """Score updates move players; first games add them."""
+    board = make_leaderboard()
+
+    board.update(3, "cyd", 40, 2)
+    board.update(4, "dee", 5, 1)
+
+    assert [entry["username"] for entry in board.top(10)] == [
+        "cyd",
+        "bob",
+        "ada",
+        "dee",
+    ]
+    assert board.rank(4) == 4
+    assert len(board) == 4
+
+
+@pytest.mark.anyio
+async def test_leaderboard_endpoint_reads_without_queries(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """Submitted scores show up in the leaderboard without a database read."""
+    await async_client.get("/api/v1/users/leaderboard")
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 2}
+    )
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][0]["id"],
+                }
+                for question in response.json()
+            ],
+        },
+        headers=auth_headers,
+    )
+
+    query_counter.clear()
+    response = await async_client.get("/api/v1/users/leaderboard")
+
+    assert response.json()[0]["username"] == "player"
+    assert response.json()[0]["total_score"] == 2
+    assert query_counter == []
+    assert leaderboard.rank(1) == 1
+
+    response = await async_client.get(
+        "/api/v1/users/leaderboard/me", headers=auth_headers
+    )
+    assert response.json()["rank"] == 1
+    assert response.json()["me"]["username"] == "player"
+
+
+def test_leaderboard_window_around_a_player():
+    """Neighbours are clipped at the top and the percentile counts players below."""
+    board = Leaderboard()
+    board.rebuild(
+        (user_id, f"user{user_id}", 100 - user_id, 1) for user_id in range(1, 21)
+    )
+
+    position = board.around(10, radius=5)
+    assert position["rank"] == 10
+    assert position["percentile"] == 52.5
+    assert [entry["rank"] for entry in position["above"]] == [5, 6, 7, 8, 9]
+    assert position["me"]["username"] == "user10"
+    assert [entry["rank"] for entry in position["below"]] == [11, 12, 13, 14, 15]
+
+    position = board.around(2, radius=5)
+    assert [entry["rank"] for entry in position["above"]] == [1]
+    assert len(position["below"]) == 5
+
+    assert board.around(99, radius=5)["rank"] is None
@@ -0,0 +1,40 @@
+import pytest
+
+from app.core.rate_limit import TokenBucketLimiter, login_throttle
+
+
+def test_token_bucket_refills_at_its_rate():
+    limiter = TokenBucketLimiter(rate=1, burst=2, max_keys=10)
+
+    assert [limiter.acquire("ada", now=0) for _ in range(3)] == [0, 0, 1]
+    assert limiter.acquire("bob", now=0) == 0
+    assert limiter.acquire("ada", now=1.5) == 0
+    assert limiter.acquire("ada", now=1.5) == 0.5
+
+
+def test_idle_and_excess_keys_are_forgotten():
+    limiter = TokenBucketLimiter(rate=1, burst=2, max_keys=2)
+    for key in ("ada", "bob", "cyd"):
+        limiter.acquire(key, now=0)
+
+    assert len(limiter) == 2
+    assert limiter.stats()["evictions"] == 1
+    assert limiter.sweep(now=10) == 2
+    assert len(limiter) == 0
+
+
+@pytest.mark.anyio
+async def test_login_is_throttled_before_the_password_check(
+    async_client, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(login_throttle.by_username, "burst", 2)
+
+    statuses = []
+    for password in ("wrong", "wrong", "pw"):
+        response = await async_client.post(
+            "/api/v1/users/login", data={"username": "player", "password": password}
+        )
+        statuses.append(response.status_code)
+
+    assert statuses == [401, 401, 429]
+    assert int(response.headers["Retry-After"]) >= 1
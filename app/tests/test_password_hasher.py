@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from app.core.password_hasher import (
+    PasswordHasher,
+    PasswordHasherBusy,
+    password_hasher,
+)
+
+
+@pytest.mark.anyio
+async def test_hashes_and_verifies_in_worker_processes():
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    try:
+        hashed = await hasher.hash("secret")
+        assert await hasher.verify("secret", hashed)
+        assert not await hasher.verify("wrong", hashed)
+    finally:
+        hasher.shutdown()
+
+    stats = hasher.stats()
+    assert stats["hashes"] == 1
+    assert stats["verifications"] == 2
+    assert stats["pending"] == 0
+
+
+@pytest.mark.anyio
+async def test_saturated_pool_rejects_at_once():
+    """Checks past max_pending fail immediately instead of queueing."""
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    try:
+        results = await asyncio.gather(
+            hasher.hash("first"), hasher.hash("second"), return_exceptions=True
+        )
+    finally:
+        hasher.shutdown()
+
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], PasswordHasherBusy)
+    assert hasher.stats()["rejected"] == 1
+
+
+@pytest.mark.anyio
+async def test_login_is_refused_with_503_when_saturated(
+    async_client, auth_headers, monkeypatch
+):
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+
+    response = await async_client.post(
+        "/api/v1/users/login", data={"username": "player", "password": "pw"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
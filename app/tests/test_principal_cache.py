@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import update
+
+from app.models.user import User
+from app.tests.conftest import TestingSessionLocal
+
+
+async def register(async_client, username: str) -> dict[str, str]:
+    await async_client.post(
+        "/api/v1/users/register",
+        json={
+            "username": username,
+            "email": f"{username}@example.com",
+            "password": "pw",
+        },
+    )
+    response = await async_client.post(
+        "/api/v1/users/login", data={"username": username, "password": "pw"}
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def reads_users(statements: list[str]) -> bool:
+    return any(
+        statement.lstrip().startswith("SELECT") and "FROM users" in statement
+        for statement in statements
+    )
+
+
+@pytest.mark.anyio
+async def test_repeated_requests_resolve_the_user_without_a_query(
+    async_client, auth_headers, query_counter
+):
+    """Only the first request with a token loads its user."""
+    await async_client.get("/api/v1/users/responses", headers=auth_headers)
+
+    query_counter.clear()
+    response = await async_client.get("/api/v1/users/responses", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert not reads_users(query_counter)
+
+
+@pytest.mark.anyio
+async def test_user_changes_take_effect_at_the_next_request(async_client, auth_headers):
+    """Renames and deactivations drop the cached principal at once."""
+    admin_headers = await register(async_client, "admin")
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            update(User).where(User.username == "admin").values(is_admin=True)
+        )
+        await session.commit()
+
+    response = await async_client.put(
+        "/api/v1/users/1/status", json={"is_active": False}, headers=admin_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["is_active"] is False
+
+    response = await async_client.get("/api/v1/users/responses", headers=auth_headers)
+    assert response.status_code == 400
+
+    await async_client.put(
+        "/api/v1/users/1/status", json={"is_active": True}, headers=admin_headers
+    )
+    response = await async_client.put(
+        "/api/v1/users/me", json={"username": "renamed"}, headers=auth_headers
+    )
+    assert response.json()["username"] == "renamed"
+
+    # The token names the old username, which no longer resolves.
+    response = await async_client.get("/api/v1/users/responses", headers=auth_headers)
+    assert response.status_code == 401
@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+
+from app.models.user import User
+from app.repositories.user_repository import UserRepository
+from app.services.provisioning_service import (
+    ProvisioningService,
+    parse_rows,
+    read_lines,
+)
+from app.tests.conftest import TestingSessionLocal
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.anyio
+async def test_rows_are_parsed_from_split_csv_and_ndjson_streams():
+    lines = read_lines(chunks(b"username,email,password\r\nada,ada@", b"x.io,pw\n\n"))
+    assert [row async for row in parse_rows(lines, "csv")] == [
+        (2, {"username": "ada", "email": "ada@x.io", "password": "pw"})
+    ]
+
+    lines = read_lines(
+        chunks(b'\xef\xbb\xbf{"username": "ada"}\n[1]\n{broken', b'\n"al\xe9x"')
+    )
+    rows = [row async for row in parse_rows(lines, "ndjson")]
+    assert rows[0] == (1, {"username": "ada"})
+    assert rows[1] == (2, "Expected a JSON object")
+    assert rows[2][1].startswith("Invalid JSON")
+    assert rows[3] == (4, "Not valid UTF-8")
+
+
+@pytest.mark.anyio
+async def test_bulk_upload_reports_every_row(async_client, auth_headers):
+    async with TestingSessionLocal() as session:
+        await session.execute(
+            update(User).where(User.username == "player").values(is_admin=True)
+        )
+        await session.commit()
+
+    body = "\n".join(
+        [
+            "username,email,password",
+            "ada,ada@example.com,pw1",
+            "bob,bob@example.com,pw2",
+            "ada,other@example.com,pw3",
+            "player,new@example.com,pw4",
+            "cyd,not-an-email,pw5",
+            "dee,dee@example.com",
+        ]
+    )
+    response = await async_client.post(
+        "/api/v1/users/bulk",
+        content=body,
+        headers={**auth_headers, "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["created"], result["failed"]) == (2, 4)
+    errors = {entry["line"]: entry.get("error") for entry in result["rows"]}
+    assert errors[2] is None and errors[3] is None
+    assert errors[4] == "Duplicate username in upload."
+    assert errors[5] == "Username already exists."
+    assert errors[6].startswith("email:")
+    assert errors[7] == "Expected 3 fields, got 2"
+
+    response = await async_client.post(
+        "/api/v1/users/login", data={"username": "bob", "password": "pw2"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_batches_are_committed_one_at_a_time():
+    """A failure mid-upload keeps the users of the batches before it."""
+
+    async def rows():
+        yield 1, {"username": "ada", "email": "ada@example.com", "password": "pw"}
+        raise OSError("upload interrupted")
+
+    with pytest.raises(OSError):
+        await ProvisioningService(TestingSessionLocal).provision(rows(), batch_size=1)
+
+    async with TestingSessionLocal() as session:
+        usernames = await session.scalars(select(User.username))
+        assert list(usernames) == ["ada"]
+
+
+@pytest.mark.anyio
+async def test_a_failed_batch_is_reported_row_by_row(monkeypatch):
+    """Over-long fields are refused up front; a failing insert fails its batch."""
+    insert_many = UserRepository.insert_many
+
+    async def failing_insert_many(self, users):
+        if users[0]["username"] == "bob":
+            raise OperationalError("INSERT", {}, Exception("connection lost"))
+        return await insert_many(self, users)
+
+    monkeypatch.setattr(UserRepository, "insert_many", failing_insert_many)
+
+    async def rows():
+        yield 1, {"username": "ada", "email": "ada@example.com", "password": "pw"}
+        yield 2, {"username": "x" * 51, "email": "x@example.com", "password": "pw"}
+        yield 3, {"username": "bob", "email": "bob@example.com", "password": "pw"}
+
+    result = await ProvisioningService(TestingSessionLocal).provision(
+        rows(), batch_size=2
+    )
+
+    assert (result["created"], result["failed"]) == (1, 2)
+    errors = [entry.get("error") for entry in result["rows"]]
+    assert errors[0] is None
+    assert errors[1] == "username: At most 50 characters"
+    assert errors[2] == "Could not be saved."
@@ -0,0 +1,29 @@
+import pytest
+
+from app.core.pubsub import Broadcaster
+
+
+async def drain(subscription):
+    return [message async for message in subscription]
+
+
+@pytest.mark.anyio
+async def test_broadcaster_drops_subscribers_that_fall_behind():
+    """A full queue drops only that subscriber; the others keep receiving."""
+    broadcaster = Broadcaster(queue_size=2)
+    fast = broadcaster.subscribe()
+    slow = broadcaster.subscribe()
+
+    assert broadcaster.publish("a") == 2
+    assert await fast.__anext__() == "a"
+    assert broadcaster.publish("b") == 2
+    assert broadcaster.publish("c") == 1
+
+    assert slow.dropped
+    assert await drain(slow) == []
+    assert len(broadcaster) == 1
+    assert broadcaster.dropped == 1
+
+    broadcaster.close()
+    assert await drain(fast) == ["b", "c"]
+    assert not fast.dropped
@@ -0,0 +1,116 @@
+import random
+
+from app.indexes.questions import QuestionIndex
+from app.models.quiz import DifficultyLevel
+
+
+def make_index() -> QuestionIndex:
+    index = QuestionIndex()
+    index.rebuild(
+        [
+            (1, 1, DifficultyLevel.EASY),
+            (2, 1, DifficultyLevel.HARD),
+            (3, 2, DifficultyLevel.EASY),
+            (4, 2, DifficultyLevel.EASY),
+            (5, 1, DifficultyLevel.EASY),
+        ]
+    )
+    return index
+
+
+def test_sample_returns_distinct_ids_from_matching_pools():
+    """Sampled IDs are unique and respect category and difficulty filters."""
+    index = make_index()
+
+    assert sorted(index.sample(10)) == [1, 2, 3, 4, 5]
+    assert sorted(index.sample(10, category_id=1)) == [1, 2, 5]
+    assert sorted(index.sample(10, category_id=2, difficulty=DifficultyLevel.EASY)) == [
+        3,
+        4,
+    ]
+    assert index.sample(10, category_id=3) == []
+
+    sample = index.sample(2, difficulty=DifficultyLevel.EASY)
+    assert len(sample) == len(set(sample)) == 2
+    assert set(sample) <= {1, 3, 4, 5}
+
+
+def test_sample_with_seeded_rng_is_reproducible():
+    """The same RNG state always picks the same questions."""
+    index = make_index()
+
+    assert index.sample(3, rng=random.Random(42)) == index.sample(
+        3, rng=random.Random(42)
+    )
+
+
+def test_add_and_discard_keep_pools_in_sync():
+    """Write-through updates are visible to the next sample."""
+    index = make_index()
+
+    index.add(6, 3, DifficultyLevel.MEDIUM)
+    assert index.sample(10, category_id=3) == [6]
+
+    index.discard(6)
+    index.discard(1)
+    assert index.sample(10, category_id=3) == []
+    assert sorted(index.sample(10, category_id=1)) == [2, 5]
+    assert len(index) == 4
+
+
+def test_sample_skips_excluded_ids_and_fills_with_them_last():
+    """Excluded IDs are only used once every other question is taken."""
+    index = make_index()
+
+    assert sorted(index.sample(10, exclude={1, 3})) == [2, 4, 5]
+    assert sorted(index.sample(2, category_id=1, exclude={1, 2, 5})) == []
+
+    filled = index.sample(3, category_id=1, exclude={1, 2}, fill_with_excluded=True)
+    assert filled[0] == 5
+    assert sorted(filled) == [1, 2, 5]
+
+
+def test_seeded_sample_ignores_load_order_and_version_tracks_changes():
+    """Indexes with the same questions agree on a seeded sample."""
+    index = make_index()
+    reordered = QuestionIndex()
+    reordered.rebuild(
+        [
+            (5, 1, DifficultyLevel.EASY),
+            (4, 2, DifficultyLevel.EASY),
+            (2, 1, DifficultyLevel.HARD),
+            (3, 2, DifficultyLevel.EASY),
+            (1, 1, DifficultyLevel.EASY),
+        ]
+    )
+
+    assert index.sample(3, rng=random.Random("daily")) == reordered.sample(
+        3, rng=random.Random("daily")
+    )
+
+    assert index.version == reordered.version
+    version = index.version
+    index.add(6, 1, DifficultyLevel.EASY)
+    assert index.version != version
+
+
+def test_reloading_the_same_bank_keeps_the_version():
+    """A reload only changes the version when the questions or content did."""
+    rows = [
+        (1, 1, DifficultyLevel.EASY),
+        (2, 1, DifficultyLevel.HARD),
+        (3, 2, DifficultyLevel.EASY),
+    ]
+    index = QuestionIndex()
+    index.rebuild(rows, content=("2026-10-01", None, None, 12))
+    version = index.version
+
+    index.rebuild(rows, content=("2026-10-01", None, None, 12))
+    assert index.version == version
+
+    # A text edit only moves the persisted stamp.
+    index.rebuild(rows, content=("2026-10-02", None, None, 12))
+    assert index.version != version
+
+    index.rebuild(rows[:2], content=("2026-10-01", None, None, 12))
+    assert index.version != version
@@ -0,0 +1,95 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app.models.user import User
+from app.models.user_responses import UserResponse
+from app.services.quiz_rooms import RUNNING, QuizRoom, RoomScoreboard, quiz_rooms
+from app.tests.conftest import TestingSessionLocal
+
+
+def test_room_scoreboard_keeps_players_ranked():
+    """Standings follow score, then user ID, after every update."""
+    scoreboard = RoomScoreboard()
+    for user_id in (3, 1, 2):
+        scoreboard.add_player(user_id)
+
+    scoreboard.add_points(2, 1)
+    scoreboard.add_points(3, 1)
+    scoreboard.add_points(3, 1)
+
+    assert scoreboard.top(3) == [(3, 2), (2, 1), (1, 0)]
+    assert scoreboard.top(1) == [(3, 2)]
+
+
+def test_room_refuses_answers_from_other_questions():
+    """A foreign answer ID is neither graded nor saved, and can be corrected."""
+    room = QuizRoom("code", 1, [{"id": 10}], {10: (101, None, (100, 101))})
+    room.state = RUNNING
+    room._current = 0
+
+    assert room.answer(1, 201) == {"type": "error", "detail": "Unknown answer"}
+    assert room.responses == []
+
+    assert room.answer(1, 101)["score"] == 1
+    assert [response["answer_id"] for response in room.responses] == [101]
+
+
+async def play(room, user_id, username, pick):
+    """Answer every question with the option `pick` chooses."""
+    subscription = room.join(user_id, username)
+    async for raw in subscription:
+        message = json.loads(raw)
+        if message["type"] == "question":
+            question = message["question"]
+            room.answer(user_id, question["answers"][pick(question)]["id"])
+
+
+@pytest.mark.anyio
+async def test_room_plays_one_quiz_for_all_players_and_saves_once(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """Players share the questions; results are written in one bulk flush."""
+    response = await async_client.post(
+        "/api/v1/quiz/rooms/", json={"num_questions": 3}, headers=auth_headers
+    )
+    assert response.status_code == 201
+    room = quiz_rooms.get(response.json()["code"])
+    room.question_seconds = 1
+
+    async with TestingSessionLocal() as session:
+        host = await session.scalar(select(User).where(User.username == "player"))
+        guest = User(username="guest", email="guest@example.com", hashed_password="x")
+        session.add(guest)
+        await session.commit()
+
+    players = [
+        asyncio.create_task(play(room, host.id, "player", lambda question: 0)),
+        asyncio.create_task(play(room, guest.id, "guest", lambda question: 1)),
+    ]
+    await asyncio.sleep(0)
+    query_counter.clear()
+    await room.run(TestingSessionLocal)
+    await asyncio.gather(*players)
+
+    assert room.standings() == [
+        {"username": "player", "score": 3},
+        {"username": "guest", "score": 0},
+    ]
+    assert quiz_rooms.get(room.code) is None
+    writes = [
+        " ".join(statement.split()[:3]).upper()
+        for statement in query_counter
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE"))
+    ]
+    assert writes == ["INSERT INTO USER_RESPONSES", "UPDATE USERS SET"]
+
+    async with TestingSessionLocal() as session:
+        responses = select(func.count()).select_from(UserResponse)
+        assert await session.scalar(responses) == 6
+        scores = dict(
+            (await session.execute(select(User.username, User.total_score))).all()
+        )
+    assert scores == {"player": 3, "guest": 0}
@@ -0,0 +1,303 @@
+import pytest
+from sqlalchemy import select
+
+from app.indexes.answer_keys import answer_key_index
+from app.models.user_responses import UserResponse
+from app.services.quiz_service import quiz_sessions
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.mark.anyio
+async def test_generate_quiz_contract(async_client, question_bank):
+    """A generated quiz lists the questions with their category and answers."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 3}
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 3
+    assert len({question["id"] for question in data}) == 3
+    for question in data:
+        assert question["category"]["category"] == "Python"
+        assert question["difficulty"] == "Easy"
+        assert question["explanation"].startswith("Explanation")
+        assert len(question["answers"]) == 4
+        assert set(question["answers"][0]) == {"id", "answer_text"}
+
+
+@pytest.mark.anyio
+async def test_generate_quiz_query_count_is_constant(
+    async_client, question_bank, query_counter
+):
+    """Assembling a quiz costs the same number of queries for any quiz size."""
+    await async_client.post("/api/v1/quiz/generate", json={"num_questions": 1})
+
+    counts = []
+    for num_questions in (1, 5, 10):
+        query_counter.clear()
+        response = await async_client.post(
+            "/api/v1/quiz/generate", json={"num_questions": num_questions}
+        )
+        assert len(response.json()) == num_questions
+        counts.append(len(query_counter))
+
+    assert counts == [1, 1, 1]
+
+
+@pytest.mark.anyio
+async def test_submit_quiz_grades_from_session(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """A submission with a session ID is graded without reading answers."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 2}
+    )
+    session_id = response.headers["X-Quiz-Session-Id"]
+    questions = response.json()
+
+    answers = [
+        {
+            "question_id": questions[0]["id"],
+            "answer_id": questions[0]["answers"][0]["id"],
+        },
+        {
+            "question_id": questions[1]["id"],
+            "answer_id": questions[1]["answers"][1]["id"],
+        },
+        {"question_id": 999, "answer_id": 1},
+    ]
+    query_counter.clear()
+    response = await async_client.post(
+        "/api/v1/quiz/submit",
+        json={"session_id": session_id, "answers": answers},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["score"] == 1
+    assert [result["is_correct"] for result in data["results"]] == [True, False]
+    assert data["results"][0]["explanation"].startswith("Explanation")
+    assert not any(
+        "FROM answers" in statement or "FROM questions" in statement
+        for statement in query_counter
+    )
+
+
+@pytest.mark.anyio
+async def test_submit_quiz_without_session_falls_back_to_database(
+    async_client, question_bank, auth_headers, query_counter
+):
+    """Unknown sessions are graded with at most one lookup and one bulk insert."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 5}
+    )
+    answers = [
+        {"question_id": question["id"], "answer_id": question["answers"][0]["id"]}
+        for question in response.json()
+    ]
+
+    query_counter.clear()
+    response = await async_client.post(
+        "/api/v1/quiz/submit",
+        json={"session_id": "expired", "answers": answers},
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["score"] == 5
+    assert sum("JOIN answers" in statement for statement in query_counter) <= 1
+    assert (
+        sum("INSERT INTO user_responses" in statement for statement in query_counter)
+        == 1
+    )
+
+
+@pytest.mark.anyio
+async def test_submit_quiz_records_foreign_answer_ids_as_unanswered(
+    async_client, question_bank, auth_headers
+):
+    """An answer ID from another question is graded wrong, not inserted."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 2}
+    )
+    first, second = response.json()
+    answers = [
+        {"question_id": first["id"], "answer_id": second["answers"][0]["id"]},
+        {"question_id": second["id"], "answer_id": 10**9},
+    ]
+
+    response = await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": answers,
+        },
+        headers=auth_headers,
+    )
+
+    assert response.status_code == 200
+    assert response.json()["score"] == 0
+    async with TestingSessionLocal() as session:
+        answer_ids = await session.scalars(select(UserResponse.answer_id))
+        assert list(answer_ids) == [None, None]
+
+
+@pytest.mark.anyio
+async def test_quiz_session_is_only_used_by_its_player(
+    async_client, question_bank, auth_headers
+):
+    """Another player's submit neither uses nor consumes the session."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 1}, headers=auth_headers
+    )
+    session_id = response.headers["X-Quiz-Session-Id"]
+    question = response.json()[0]
+    submission = {
+        "session_id": session_id,
+        "answers": [
+            {"question_id": question["id"], "answer_id": question["answers"][0]["id"]}
+        ],
+    }
+    await async_client.post(
+        "/api/v1/users/register",
+        json={"username": "other", "email": "other@example.com", "password": "pw"},
+    )
+    response = await async_client.post(
+        "/api/v1/users/login", data={"username": "other", "password": "pw"}
+    )
+    other_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = await async_client.post(
+        "/api/v1/quiz/submit", json=submission, headers=other_headers
+    )
+    assert response.status_code == 200
+    assert quiz_sessions.peek(session_id) is not None
+
+    await async_client.post(
+        "/api/v1/quiz/submit", json=submission, headers=auth_headers
+    )
+    assert quiz_sessions.peek(session_id) is None
+
+
+@pytest.mark.anyio
+async def test_answer_updates_invalidate_answer_key_index(
+    async_client, question_bank, auth_headers
+):
+    """Changing the correct answer is picked up by the next submission."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 1}
+    )
+    question = response.json()[0]
+    first, second = question["answers"][:2]
+
+    async def submit(answer_id: int) -> int:
+        response = await async_client.post(
+            "/api/v1/quiz/submit",
+            json={"answers": [{"question_id": question["id"], "answer_id": answer_id}]},
+            headers=auth_headers,
+        )
+        return response.json()["score"]
+
+    assert await submit(first["id"]) == 1
+    assert answer_key_index.lookup([question["id"]])[1] == []
+
+    for answer, is_correct in ((first, False), (second, True)):
+        response = await async_client.put(
+            f"/api/v1/answers/{answer['id']}",
+            json={"question_id": question["id"], "is_correct": is_correct},
+        )
+        assert response.status_code == 200
+
+    assert await submit(first["id"]) == 0
+    assert await submit(second["id"]) == 1
+
+
+@pytest.mark.anyio
+async def test_generate_quiz_excludes_seen_questions(
+    async_client, question_bank, auth_headers
+):
+    """Answered questions are not served again while unseen ones remain."""
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 8}, headers=auth_headers
+    )
+    answered = {question["id"] for question in response.json()}
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][0]["id"],
+                }
+                for question in response.json()
+            ],
+        },
+        headers=auth_headers,
+    )
+
+    response = await async_client.post(
+        "/api/v1/quiz/generate",
+        json={"num_questions": 5, "exclude_seen": True, "fill_with_seen": False},
+        headers=auth_headers,
+    )
+    assert len(response.json()) == 2
+    assert not answered & {question["id"] for question in response.json()}
+
+    response = await async_client.post(
+        "/api/v1/quiz/generate",
+        json={"num_questions": 5, "exclude_seen": True},
+        headers=auth_headers,
+    )
+    questions = [question["id"] for question in response.json()]
+    assert len(questions) == 5
+    assert not answered & set(questions[:2])
+
+
+@pytest.mark.anyio
+async def test_seeded_quiz_is_reproducible_and_cached(
+    async_client, question_bank, query_counter
+):
+    """A seed gives the same quiz, rendered once and revalidated by ETag."""
+    request = {"num_questions": 4, "seed": "quiz-of-the-day"}
+    first = await async_client.post("/api/v1/quiz/generate", json=request)
+    etag = first.headers["ETag"]
+
+    query_counter.clear()
+    second = await async_client.post("/api/v1/quiz/generate", json=request)
+    assert second.json() == first.json()
+    assert second.headers["ETag"] == etag
+    assert second.headers["X-Quiz-Session-Id"] != first.headers["X-Quiz-Session-Id"]
+    assert query_counter == []
+
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json=request, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert "X-Quiz-Session-Id" in response.headers
+
+    other = await async_client.post(
+        "/api/v1/quiz/generate", json={**request, "seed": "another day"}
+    )
+    assert other.headers["ETag"] != etag
+
+
+@pytest.mark.anyio
+async def test_seeded_quiz_is_rendered_again_after_a_text_edit(
+    async_client, question_bank
+):
+    """Edits that keep a question in its pool still change the bank version."""
+    request = {"num_questions": 2, "seed": "quiz-of-the-day"}
+    first = await async_client.post("/api/v1/quiz/generate", json=request)
+    question_id = first.json()[0]["id"]
+
+    response = await async_client.put(
+        f"/api/v1/questions/{question_id}", json={"question_text": "Edited?"}
+    )
+    assert response.status_code == 200
+
+    second = await async_client.post("/api/v1/quiz/generate", json=request)
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert second.json()[0]["question_text"] == "Edited?"
@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import WebSocketDisconnect
+from sqlalchemy import func, select
+
+from app.models.user import User
+from app.models.user_responses import UserResponse
+from app.schemas.quiz import QuizRequest
+from app.services.quiz_stream import QuizStream
+from app.tests.conftest import TestingSessionLocal
+
+
+class ScriptedWebSocket:
+    """An accepted WebSocket whose client answers each question it receives.
+
+    `pick` chooses the answer index for a question; after `disconnect_after`
+    answers the client goes away.
+    """
+
+    def __init__(self, pick=lambda question: 0, disconnect_after=None):
+        self.pick = pick
+        self.disconnect_after = disconnect_after
+        self.incoming = asyncio.Queue()
+        self.sent = []
+        self.close_code = None
+
+    async def send_json(self, data):
+        self.sent.append(data)
+        if data["type"] != "question":
+            return
+        answered = sum(message["type"] == "result" for message in self.sent)
+        if answered == self.disconnect_after:
+            self.incoming.put_nowait(None)
+            return
+        question = data["question"]
+        answer = question["answers"][self.pick(question)]
+        self.incoming.put_nowait(json.dumps({"answer_id": answer["id"]}))
+
+    async def receive_text(self):
+        message = await self.incoming.get()
+        if message is None:
+            raise WebSocketDisconnect()
+        return message
+
+    async def close(self, code=1000):
+        self.close_code = code
+
+
+@pytest.fixture
+async def player_id():
+    async with TestingSessionLocal() as session:
+        user = User(
+            username="streamer", email="streamer@example.com", hashed_password="x"
+        )
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+async def stored_progress(user_id):
+    async with TestingSessionLocal() as session:
+        responses = await session.scalar(
+            select(func.count()).where(UserResponse.user_id == user_id)
+        )
+        user = await session.get(User, user_id)
+        return responses, user.total_score, user.games_played
+
+
+@pytest.mark.anyio
+async def test_stream_grades_each_answer_and_writes_in_batches(
+    question_bank, player_id, query_counter
+):
+    """Every answer gets a result; responses are inserted a batch at a time."""
+    websocket = ScriptedWebSocket(pick=lambda question: question["id"] % 2)
+    stream = QuizStream(
+        websocket,
+        TestingSessionLocal,
+        player_id,
+        QuizRequest(num_questions=5),
+        flush_batch_size=2,
+    )
+
+    query_counter.clear()
+    await stream.run()
+
+    types = [message["type"] for message in websocket.sent]
+    assert types == ["question", "result"] * 5 + ["summary"]
+    results = [message for message in websocket.sent if message["type"] == "result"]
+    score = sum(result["is_correct"] for result in results)
+    assert websocket.sent[-1]["score"] == score
+    assert websocket.close_code == 1000
+
+    inserts = [
+        statement
+        for statement in query_counter
+        if statement.lstrip().upper().startswith("INSERT INTO USER_RESPONSES")
+    ]
+    assert len(inserts) == 3
+    assert await stored_progress(player_id) == (5, score, 1)
+
+
+@pytest.mark.anyio
+async def test_stream_keeps_answers_when_client_disconnects(question_bank, player_id):
+    """Answers given before a disconnect are stored and the game is counted."""
+    websocket = ScriptedWebSocket(disconnect_after=2)
+    stream = QuizStream(
+        websocket, TestingSessionLocal, player_id, QuizRequest(num_questions=5)
+    )
+
+    await stream.run()
+
+    assert [message["type"] for message in websocket.sent][-1] == "question"
+    assert await stored_progress(player_id) == (2, 2, 1)
+
+
+@pytest.mark.anyio
+async def test_stream_rejects_malformed_answers(question_bank, player_id):
+    """Bad messages and foreign answer IDs get an error; the question stays open."""
+    websocket = ScriptedWebSocket(disconnect_after=0)
+    stream = QuizStream(
+        websocket, TestingSessionLocal, player_id, QuizRequest(num_questions=1)
+    )
+    websocket.incoming.put_nowait("not json")
+    websocket.incoming.put_nowait(json.dumps({"answer_id": 1, "question_id": -1}))
+    websocket.incoming.put_nowait(json.dumps({"answer_id": 10**9}))
+
+    await stream.run()
+
+    assert [message["type"] for message in websocket.sent] == [
+        "question",
+        "error",
+        "error",
+        "error",
+    ]
+    assert await stored_progress(player_id) == (0, 0, 0)
@@ -0,0 +1,63 @@
+import pytest
+
+
+async def play_quiz(async_client, auth_headers, num_questions: int) -> None:
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": num_questions}
+    )
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][0]["id"],
+                }
+                for question in response.json()
+            ],
+        },
+        headers=auth_headers,
+    )
+
+
+@pytest.mark.anyio
+async def test_history_pages_are_stable_under_inserts(
+    async_client, question_bank, auth_headers
+):
+    """Rows added between pages neither repeat nor skip older rows."""
+    await play_quiz(async_client, auth_headers, 10)
+    response = await async_client.get(
+        "/api/v1/users/responses", params={"limit": 100}, headers=auth_headers
+    )
+    expected = [item["id"] for item in response.json()["items"]]
+    assert len(expected) == 10
+    assert expected == sorted(expected, reverse=True)
+
+    pages = []
+    cursor = None
+    while True:
+        params = {"limit": 4} | ({"cursor": cursor} if cursor else {})
+        response = await async_client.get(
+            "/api/v1/users/responses", params=params, headers=auth_headers
+        )
+        page = response.json()
+        pages.append([item["id"] for item in page["items"]])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+        # Newer answers arrive while the client is paging.
+        await play_quiz(async_client, auth_headers, 3)
+
+    assert [len(page) for page in pages] == [4, 4, 2]
+    assert [item for page in pages for item in page] == expected
+
+
+@pytest.mark.anyio
+async def test_history_rejects_foreign_cursors(async_client, auth_headers):
+    response = await async_client.get(
+        "/api/v1/users/responses",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
@@ -0,0 +1,98 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.response_rollups import ResponseRollup
+from app.models.user_responses import UserResponse
+from app.repositories import RepositoryFactory
+from app.services.response_partition_service import (
+    ResponsePartitionService,
+    month_offset,
+)
+from app.tests.conftest import TestingSessionLocal
+
+
+@pytest.mark.anyio
+async def test_old_months_are_rolled_up_and_retired(
+    async_client, question_bank, auth_headers, monkeypatch
+):
+    """Retired months leave the table but still count in rebuilt stats."""
+    monkeypatch.setattr(settings, "USER_RESPONSES_RETENTION_ACTION", "drop")
+    async with TestingSessionLocal() as session:
+        session.add_all(
+            UserResponse(
+                user_id=1,
+                question_id=question_id,
+                is_correct=question_id == 1,
+                created_at=datetime(2020, 1, 15, tzinfo=timezone.utc),
+            )
+            for question_id in (1, 2)
+        )
+        await session.commit()
+
+    response = await async_client.post(
+        "/api/v1/quiz/generate", json={"num_questions": 2}
+    )
+    await async_client.post(
+        "/api/v1/quiz/submit",
+        json={
+            "session_id": response.headers["X-Quiz-Session-Id"],
+            "answers": [
+                {
+                    "question_id": question["id"],
+                    "answer_id": question["answers"][0]["id"],
+                }
+                for question in response.json()
+            ],
+        },
+        headers=auth_headers,
+    )
+
+    today = datetime.now(timezone.utc).date()
+    async with TestingSessionLocal() as session:
+        repo_factory = RepositoryFactory(session)
+        await repo_factory.response_partitions.create_partition(date(2020, 1, 1))
+        changes = await ResponsePartitionService(repo_factory).maintain(today)
+
+        current = today.replace(day=1)
+        assert changes["retired"] == [date(2020, 1, 1)]
+        assert await repo_factory.response_partitions.get_partition_months() == [
+            month_offset(current, months) for months in range(4)
+        ]
+        rollup = (await session.execute(select(ResponseRollup))).scalar_one()
+        assert (rollup.month, rollup.answered, rollup.correct) == (
+            date(2020, 1, 1),
+            2,
+            1,
+        )
+        # Today's answers moved out of the default partition.
+        result = await session.execute(
+            select(UserResponse.id).where(UserResponse.created_at >= current)
+        )
+        assert len(result.all()) == 2
+
+        await repo_factory.category_scores.rebuild()
+
+    response = await async_client.get("/api/v1/users/stats", headers=auth_headers)
+    assert response.json()["total_answers"] == 4
+    assert response.json()["correct_answers"] == 3
+
+    response = await async_client.get("/api/v1/users/responses", headers=auth_headers)
+    assert len(response.json()["items"]) == 2
+
+
+@pytest.mark.anyio
+async def test_a_partition_created_by_another_worker_is_skipped():
+    """A second worker finds the month attached and leaves it alone."""
+    async with TestingSessionLocal() as first, TestingSessionLocal() as second:
+        month = date(2020, 2, 1)
+        assert await RepositoryFactory(first).response_partitions.create_partition(
+            month
+        )
+        repository = RepositoryFactory(second).response_partitions
+        assert not await repository.create_partition(month)
+        assert month in await repository.get_partition_months()
+        assert await repository.retire_partition(month, drop=True) == 0
+        assert await repository.retire_partition(month, drop=True) is None
@@ -0,0 +1,81 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import select
+
+from app.models.quiz import LeaderboardPeriod
+from app.models.score_buckets import ScoreBucket
+from app.repositories import RepositoryFactory
+from app.repositories.score_bucket_repository import period_start
+from app.services.score_bucket_service import ScoreBucketService, retention_cutoffs
+from app.tests.conftest import TestingSessionLocal
+
+
+def test_period_start_and_retention_cutoffs():
+    """Weeks start on Monday; cutoffs count back whole periods."""
+    day = date(2026, 1, 15)
+
+    assert period_start(LeaderboardPeriod.DAY, day) == day
+    assert period_start(LeaderboardPeriod.WEEK, day) == date(2026, 1, 12)
+    assert period_start(LeaderboardPeriod.MONTH, day) == date(2026, 1, 1)
+
+    cutoffs = retention_cutoffs(day)
+    assert cutoffs[LeaderboardPeriod.DAY] == date(2025, 12, 15)
+    assert cutoffs[LeaderboardPeriod.WEEK] == date(2025, 10, 20)
+    assert cutoffs[LeaderboardPeriod.MONTH] == date(2024, 1, 1)
+
+
+@pytest.mark.anyio
+async def test_submitted_scores_reach_every_period(
+    async_client, question_bank, auth_headers
+):
+    """A submit adds the game to today's, this week's and this month's board."""
+    for _ in range(2):
+        response = await async_client.post(
+            "/api/v1/quiz/generate", json={"num_questions": 2}
+        )
+        await async_client.post(
+            "/api/v1/quiz/submit",
+            json={
+                "session_id": response.headers["X-Quiz-Session-Id"],
+                "answers": [
+                    {
+                        "question_id": question["id"],
+                        "answer_id": question["answers"][0]["id"],
+                    }
+                    for question in response.json()
+                ],
+            },
+            headers=auth_headers,
+        )
+
+    for period in LeaderboardPeriod:
+        response = await async_client.get(
+            "/api/v1/users/leaderboard", params={"period": period.value}
+        )
+        assert response.json() == [
+            {
+                "rank": 1,
+                "username": "player",
+                "total_score": 4,
+                "games_played": 2,
+                "avg_score": 2.0,
+            }
+        ]
+
+
+@pytest.mark.anyio
+async def test_purge_drops_buckets_past_retention(async_client, auth_headers):
+    """Only buckets older than their period's retention are deleted."""
+    today = datetime.now(timezone.utc).date()
+    async with TestingSessionLocal() as session:
+        repo_factory = RepositoryFactory(session)
+        await repo_factory.score_buckets.add_scores({1: 3}, day=date(2000, 1, 1))
+        await repo_factory.score_buckets.add_scores({1: 5}, day=today)
+        await session.commit()
+
+        deleted = await ScoreBucketService(repo_factory).purge_expired(today)
+
+        result = await session.execute(select(ScoreBucket.score))
+        assert deleted == 3
+        assert result.scalars().all() == [5, 5, 5]
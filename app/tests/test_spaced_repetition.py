@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from app.core.spaced_repetition import (
+    MIN_EASE_FACTOR,
+    CardState,
+    review_quality,
+    schedule,
+)
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def test_schedule_grows_intervals_on_correct_reviews():
+    """Intervals go 1, 6, then grow by the ease factor."""
+    state = CardState()
+    intervals = []
+    for _ in range(4):
+        state, due_at = schedule(state, 4, NOW)
+        intervals.append(state.interval_days)
+
+    assert intervals == [1, 6, 15, 38]
+    assert state.repetitions == 4
+    assert due_at == NOW + timedelta(days=38)
+
+
+def test_schedule_resets_on_lapse_and_keeps_ease_floor():
+    """A failed review restarts the card without dropping below the ease floor."""
+    state = CardState(repetitions=5, interval_days=40, ease_factor=1.35)
+
+    state, due_at = schedule(state, 1, NOW)
+
+    assert (state.repetitions, state.interval_days, state.lapses) == (0, 1, 1)
+    assert state.ease_factor == MIN_EASE_FACTOR
+    assert due_at == NOW + timedelta(days=1)
+
+
+def test_review_quality_is_capped_by_correctness():
+    """Self-ratings cannot pass a wrong answer or fail a right one."""
+    assert review_quality(True) == 4
+    assert review_quality(False) == 1
+    assert review_quality(False, 5) == 2
+    assert review_quality(True, 0) == 3
+    assert review_quality(True, 5) == 5
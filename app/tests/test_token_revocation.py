@@ -0,0 +1,59 @@
+import time
+
+import pytest
+
+from app.core.revocation import RevocationList
+from app.core.security import revoked_tokens, verified_tokens
+from app.repositories import RepositoryFactory
+from app.services.token_service import TokenService
+from app.tests.conftest import TestingSessionLocal
+
+
+def test_revocations_age_out_when_their_tokens_expire():
+    now = time.time()
+    revocations = RevocationList(resolution_seconds=1)
+    revocations.add("short", now + 1.5, now=now)
+    revocations.add("long", now + 60, now=now)
+    revocations.add("expired", now - 1, now=now)
+
+    assert revocations.contains("short", now=now + 1)
+    assert not revocations.contains("expired", now=now + 1)
+
+    assert not revocations.contains("short", now=now + 3)
+    assert revocations.contains("long", now=now + 3)
+    assert len(revocations) == 1
+
+    assert not revocations.contains("long", now=now + 3600)
+    assert revocations.stats()["expirations"] == 2
+
+
+@pytest.mark.anyio
+async def test_tokens_are_verified_once(async_client, auth_headers):
+    for _ in range(3):
+        response = await async_client.get(
+            "/api/v1/users/responses", headers=auth_headers
+        )
+        assert response.status_code == 200
+
+    assert verified_tokens.stats()["entries"] == 1
+    assert verified_tokens.stats()["hits"] >= 2
+
+
+@pytest.mark.anyio
+async def test_logged_out_tokens_stay_revoked_after_a_restart(
+    async_client, auth_headers
+):
+    response = await async_client.post("/api/v1/users/logout", headers=auth_headers)
+    assert response.status_code == 204
+
+    response = await async_client.get("/api/v1/users/responses", headers=auth_headers)
+    assert response.status_code == 401
+
+    # A fresh worker only knows what was stored.
+    revoked_tokens.clear()
+    verified_tokens.clear()
+    async with TestingSessionLocal() as session:
+        assert await TokenService(RepositoryFactory(session)).load_revocations() == 1
+
+    response = await async_client.get("/api/v1/users/responses", headers=auth_headers)
+    assert response.status_code == 401
@@ -0,0 +1,91 @@
+import pytest
+from sqlalchemy import event, func, select
+
+from app.database import after_commit, unit_of_work
+from app.indexes.seen_questions import seen_questions
+from app.models.categories import Category
+from app.models.user import User
+from app.repositories import RepositoryFactory
+from app.schemas.categories import CategoryCreate
+from app.shared.exceptions.database import DatabaseException
+from app.tests.conftest import TestingSessionLocal, engine
+
+
+async def count_categories() -> int:
+    async with TestingSessionLocal() as session:
+        return await session.scalar(select(func.count()).select_from(Category))
+
+
+@pytest.mark.anyio
+async def test_a_request_commits_once(async_client, question_bank, auth_headers):
+    commits = []
+
+    def listener(conn):
+        commits.append(conn)
+
+    event.listen(engine.sync_engine, "commit", listener)
+    try:
+        response = await async_client.post(
+            "/api/v1/quiz/submit",
+            json={"answers": [{"question_id": 1, "answer_id": 1}]},
+            headers=auth_headers,
+        )
+    finally:
+        event.remove(engine.sync_engine, "commit", listener)
+
+    assert response.status_code == 200
+    assert len(commits) == 1
+
+
+@pytest.mark.anyio
+async def test_a_failed_unit_of_work_writes_nothing():
+    callbacks = []
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(TestingSessionLocal) as session:
+            categories = RepositoryFactory(session).categories
+            await categories.create(CategoryCreate(category="Python"))
+            after_commit(session, lambda: callbacks.append("committed"))
+            raise RuntimeError("request failed")
+
+    assert await count_categories() == 0
+    assert callbacks == []
+
+
+@pytest.mark.anyio
+async def test_a_failed_insert_only_rolls_back_its_savepoint():
+    callbacks = []
+    async with unit_of_work(TestingSessionLocal) as session:
+        categories = RepositoryFactory(session).categories
+        await categories.create(CategoryCreate(category="Python"))
+        with pytest.raises(DatabaseException):
+            await categories.create(CategoryCreate(category="Python"))
+        await categories.create(CategoryCreate(category="Go"))
+        after_commit(session, lambda: callbacks.append("committed"))
+        assert callbacks == []
+
+    assert await count_categories() == 2
+    assert callbacks == ["committed"]
+
+
+@pytest.mark.anyio
+async def test_responses_are_marked_seen_once_committed(question_bank, auth_headers):
+    async with TestingSessionLocal() as session:
+        user_id = await session.scalar(select(User.id).where(User.username == "player"))
+        seen = await seen_questions.get(session, user_id)
+    response = {
+        "user_id": user_id,
+        "question_id": 1,
+        "answer_id": None,
+        "is_correct": False,
+    }
+
+    with pytest.raises(RuntimeError):
+        async with unit_of_work(TestingSessionLocal) as session:
+            await RepositoryFactory(session).user_responses.insert_many([response])
+            raise RuntimeError("request failed")
+    assert 1 not in seen
+
+    async with unit_of_work(TestingSessionLocal) as session:
+        await RepositoryFactory(session).user_responses.insert_many([response])
+        assert 1 not in seen
+    assert 1 in seen
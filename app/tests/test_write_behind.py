@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.write_behind import WriteBehindBuffer
+from app.models.user_responses import UserResponse
+from app.repositories.user_response_repository import (
+    response_buffer,
+    start_response_buffer,
+)
+from app.tests.conftest import TestingSessionLocal
+
+
+class RecordingFlush:
+    def __init__(self, fail: bool = False, bad_row=None) -> None:
+        self.batches = []
+        self.fail = fail
+        self.bad_row = bad_row
+
+    async def __call__(self, rows):
+        await asyncio.sleep(0)
+        if self.fail or self.bad_row in rows:
+            raise RuntimeError("database down")
+        self.batches.append(rows)
+
+
+@pytest.mark.anyio
+async def test_concurrent_puts_share_one_flush():
+    """Rows queued within the interval are written together, up to max_batch."""
+    flush = RecordingFlush()
+    buffer = WriteBehindBuffer(max_batch=5, interval_seconds=0.05, max_pending=100)
+    buffer.start(flush)
+
+    await asyncio.gather(*(buffer.put([n, n]) for n in range(4)))
+    await buffer.stop()
+
+    assert [len(batch) for batch in flush.batches] == [6, 2]
+    assert sorted(row for batch in flush.batches for row in batch) == [
+        0,
+        0,
+        1,
+        1,
+        2,
+        2,
+        3,
+        3,
+    ]
+    stats = buffer.stats()
+    assert stats["flushes"] == 2
+    assert stats["max_batch_rows"] == 6
+    assert stats["avg_batch_rows"] == 4.0
+
+
+@pytest.mark.anyio
+async def test_fire_and_forget_rows_are_drained_on_stop():
+    """Without `wait`, put returns at once and stop still writes the rows."""
+    flush = RecordingFlush()
+    buffer = WriteBehindBuffer(max_batch=100, interval_seconds=10, max_pending=100)
+    buffer.start(flush)
+
+    await buffer.put([1, 2], wait=False)
+    assert flush.batches == []
+
+    await buffer.stop()
+    assert flush.batches == [[1, 2]]
+    assert not buffer.running
+
+
+@pytest.mark.anyio
+async def test_failed_flush_reaches_waiting_callers():
+    buffer = WriteBehindBuffer(max_batch=1, interval_seconds=0, max_pending=10)
+    buffer.start(RecordingFlush(fail=True))
+
+    with pytest.raises(RuntimeError):
+        await buffer.put([1])
+    await buffer.stop()
+
+    assert buffer.stats()["failed_rows"] == 1
+
+
+@pytest.mark.anyio
+async def test_bad_row_fails_only_its_own_submission():
+    """A failed batch is retried per submission; the other callers' rows land."""
+    flush = RecordingFlush(bad_row=3)
+    buffer = WriteBehindBuffer(max_batch=100, interval_seconds=0.05, max_pending=10)
+    buffer.start(flush)
+
+    results = await asyncio.gather(
+        buffer.put([1, 2]), buffer.put([3, 4]), return_exceptions=True
+    )
+    await buffer.stop()
+
+    assert results[0] is None
+    assert isinstance(results[1], RuntimeError)
+    assert flush.batches == [[1, 2]]
+    assert buffer.stats()["failed_rows"] == 2
+    assert buffer.stats()["rows"] == 2
+
+
+@pytest.mark.anyio
+async def test_buffered_submissions_are_committed(
+    async_client, question_bank, auth_headers
+):
+    """With the buffer running, submits write responses through its batches."""
+    start_response_buffer(TestingSessionLocal)
+    try:
+        for _ in range(3):
+            response = await async_client.post(
+                "/api/v1/quiz/generate", json={"num_questions": 2}
+            )
+            await async_client.post(
+                "/api/v1/quiz/submit",
+                json={
+                    "session_id": response.headers["X-Quiz-Session-Id"],
+                    "answers": [
+                        {
+                            "question_id": question["id"],
+                            "answer_id": question["answers"][0]["id"],
+                        }
+                        for question in response.json()
+                    ],
+                },
+                headers=auth_headers,
+            )
+    finally:
+        await response_buffer.stop()
+
+    async with TestingSessionLocal() as session:
+        count = await session.scalar(select(func.count(UserResponse.id)))
+    assert count == 6
+    assert response_buffer.stats()["rows"] >= 6
@@ -0,0 +1,58 @@
+"""Compare authenticated request throughput with and without the principal cache.
+
+Run from the project root against the test database:
+
+    python -m benchmarks.auth_requests
+"""
+
+import asyncio
+
+from httpx import AsyncClient
+
+from app.core.security import create_access_token
+from app.database import get_db, get_session_factory
+from app.main import app
+from app.repositories.user_repository import principals
+from benchmarks.common import (
+    SessionLocal,
+    create_user,
+    fresh_database,
+    request_session,
+    throughput,
+)
+
+ITERATIONS = 2_000
+
+
+async def main() -> None:
+    async def override_get_db():
+        async with request_session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: SessionLocal
+
+    async with fresh_database():
+        await create_user("benchmark")
+        headers = {
+            "Authorization": f"Bearer {create_access_token({'sub': 'benchmark'})}"
+        }
+
+        async with AsyncClient(app=app, base_url="http://test") as client:
+
+            async def request() -> None:
+                await client.get("/api/v1/users/leaderboard/me", headers=headers)
+
+            enabled_maxsize = principals.maxsize
+            for label, maxsize in [("uncached", 0), ("cached", enabled_maxsize)]:
+                principals.clear()
+                principals.maxsize = maxsize
+                rate = await throughput(request, ITERATIONS)
+                print(f"{label:>10}: {rate:8.1f} requests/s")
+            principals.maxsize = enabled_maxsize
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""Benchmark the calibration engine on synthetic responses.
+
+Run from the project root (RESPONSES defaults to 100 million):
+
+    python -m benchmarks.calibration [RESPONSES]
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from app.core.calibration import (
+    add_sums,
+    count_chunk,
+    moment_chunk,
+    question_statistics,
+    user_totals,
+)
+
+USERS = 1_000_000
+QUESTIONS = 20_000
+CHUNK_SIZE = 1_000_000
+
+
+def chunks(responses: int, seed: int = 42):
+    """The same pseudo-random responses on every call, one chunk at a time."""
+    rng = np.random.default_rng(seed)
+    for start in range(0, responses, CHUNK_SIZE):
+        size = min(CHUNK_SIZE, responses - start)
+        yield (
+            rng.integers(1, USERS + 1, size),
+            rng.integers(1, QUESTIONS + 1, size),
+            rng.random(size) < 0.6,
+        )
+
+
+def main() -> None:
+    responses = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000
+
+    started = time.perf_counter()
+    counts = None
+    for chunk in chunks(responses):
+        counts = add_sums(counts, count_chunk(*chunk))
+    print(f"pass 1: {time.perf_counter() - started:.1f}s")
+
+    user_answers, user_correct = user_totals(counts)
+    started = time.perf_counter()
+    moments = None
+    for chunk in chunks(responses):
+        moments = add_sums(
+            moments, moment_chunk(*chunk, user_answers, user_correct, irt=True)
+        )
+    print(f"pass 2: {time.perf_counter() - started:.1f}s")
+
+    statistics = question_statistics(counts, moments, min_responses=30)
+    print(
+        f"{responses} responses, {QUESTIONS} questions, "
+        f"mean p-value {np.nanmean(statistics['p_value'][1:]):.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Shared helpers for the database-backed benchmarks.
+
+They run against `TEST_DATABASE_URL`; tables are created before and dropped
+after each run, exactly like in the test suite.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.database import Base, unit_of_work
+from app.models.answers import Answer
+from app.models.categories import Category
+from app.models.questions import Question
+from app.models.quiz import DifficultyLevel
+from app.models.user import User
+
+if not settings.TEST_DATABASE_URL:
+    raise SystemExit("Please provide TEST_DATABASE_URL for the benchmarks.")
+
+engine = create_async_engine(settings.TEST_DATABASE_URL, echo=False, future=True)
+
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@asynccontextmanager
+async def fresh_database() -> AsyncIterator[None]:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def request_session() -> AsyncContextManager[AsyncSession]:
+    """A session that commits once at the end, like `app.database.get_db`."""
+    return unit_of_work(SessionLocal)
+
+
+async def seed_question_bank(
+    num_questions: int, answers_per_question: int = 4
+) -> list[tuple[int, int]]:
+    """Create questions and return `(question_id, correct_answer_id)` pairs."""
+    async with SessionLocal() as session:
+        category = Category(category="Benchmark")
+        session.add(category)
+        await session.flush()
+
+        difficulties = list(DifficultyLevel)
+        questions = []
+        for number in range(num_questions):
+            question = Question(
+                question_text=f"Question {number}",
+                difficulty=difficulties[number % len(difficulties)],
+                explanation=f"Explanation {number}",
+                category_id=category.id,
+            )
+            question.answers = [
+                Answer(answer_text=f"Answer {option}", is_correct=option == 0)
+                for option in range(answers_per_question)
+            ]
+            questions.append(question)
+        session.add_all(questions)
+        await session.commit()
+
+        return [(question.id, question.answers[0].id) for question in questions]
+
+
+async def create_user(username: str) -> int:
+    async with SessionLocal() as session:
+        user = User(
+            username=username,
+            email=f"{username}@example.com",
+            hashed_password="not-a-real-hash",
+            total_score=0,
+            games_played=0,
+        )
+        session.add(user)
+        await session.commit()
+        return user.id
+
+
+async def throughput(
+    operation: Callable[[], Awaitable[object]], iterations: int
+) -> float:
+    """Run `operation` sequentially and return operations per second."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await operation()
+    return iterations / (time.perf_counter() - started)
@@ -0,0 +1,57 @@
+"""Benchmark leaderboard reads and updates with a million players.
+
+Run from the project root:
+
+    python -m benchmarks.leaderboard
+"""
+
+import random
+import time
+
+from app.indexes.leaderboard import Leaderboard
+
+PLAYERS = 1_000_000
+ROUNDS = 100_000
+
+
+def per_call_us(operation, rounds: int = ROUNDS) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        operation()
+    return (time.perf_counter() - started) / rounds * 1_000_000
+
+
+def main() -> None:
+    rng = random.Random(42)
+    board = Leaderboard()
+
+    started = time.perf_counter()
+    board.rebuild(
+        (user_id, f"player{user_id}", rng.randrange(100_000), rng.randrange(1, 500))
+        for user_id in range(1, PLAYERS + 1)
+    )
+    print(
+        f"rebuild: {time.perf_counter() - started:.2f}s for {len(board)} players, "
+        f"~{board.memory_bytes() / 1024 / 1024:.0f} MiB"
+    )
+
+    user_ids = [rng.randrange(1, PLAYERS + 1) for _ in range(ROUNDS)]
+    positions = iter(user_ids * 2)
+
+    print(f"top(10):        {per_call_us(lambda: board.top(10)):8.2f} us")
+    print(f"rank(user):     {per_call_us(lambda: board.rank(next(positions))):8.2f} us")
+    print(
+        "window(11):     "
+        f"{per_call_us(lambda: board.window(500_000, 500_011)):8.2f} us"
+    )
+
+    def update() -> None:
+        user_id = next(positions)
+        username, total_score, games_played = board._users[user_id]
+        board.update(user_id, username, total_score + 7, games_played + 1)
+
+    print(f"update(user):   {per_call_us(update):8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Measure non-auth request latency during a burst of logins.
+
+Runs the storm twice: with bcrypt inline on the event loop, as before, and
+in the password hashing pool. Run from the project root against the test
+database:
+
+    python -m benchmarks.login_storm
+"""
+
+import asyncio
+import statistics
+import time
+
+from httpx import AsyncClient
+
+from app.core.password_hasher import password_hasher
+from app.database import get_db, get_session_factory
+from app.main import app
+from benchmarks.common import SessionLocal, fresh_database, request_session
+
+LOGINS = 200
+CONCURRENT_LOGINS = 16
+PROBES = 200
+
+
+async def probe_latencies(client: AsyncClient, storm: asyncio.Task) -> list[float]:
+    """Leaderboard request latencies in ms while `storm` runs."""
+    latencies = []
+    while not storm.done() and len(latencies) < PROBES:
+        started = time.perf_counter()
+        await client.get("/api/v1/users/leaderboard")
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def login_storm(client: AsyncClient) -> int:
+    """Send LOGINS logins, CONCURRENT_LOGINS at a time; return the 503s."""
+    semaphore = asyncio.Semaphore(CONCURRENT_LOGINS)
+
+    async def login() -> int:
+        async with semaphore:
+            response = await client.post(
+                "/api/v1/users/login", data={"username": "storm", "password": "pw"}
+            )
+            return response.status_code
+
+    statuses = await asyncio.gather(*(login() for _ in range(LOGINS)))
+    return statuses.count(503)
+
+
+async def main() -> None:
+    async def override_get_db():
+        async with request_session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: SessionLocal
+
+    async with fresh_database():
+        async with AsyncClient(app=app, base_url="http://test") as client:
+            await client.post(
+                "/api/v1/users/register",
+                json={
+                    "username": "storm",
+                    "email": "storm@example.com",
+                    "password": "pw",
+                },
+            )
+            await client.get("/api/v1/users/leaderboard")
+
+            pool_workers = password_hasher.workers
+            for label, workers in [("inline", 0), ("pool", pool_workers)]:
+                password_hasher.workers = workers
+                started = time.perf_counter()
+                storm = asyncio.create_task(login_storm(client))
+                latencies = await probe_latencies(client, storm)
+                rejected = await storm
+                elapsed = time.perf_counter() - started
+                p99 = statistics.quantiles(latencies, n=100)[98]
+                print(
+                    f"{label:>7}: {LOGINS / elapsed:6.1f} logins/s, "
+                    f"{rejected} rejected, leaderboard p50 "
+                    f"{statistics.median(latencies):7.2f} ms, p99 {p99:7.2f} ms "
+                    f"({len(latencies)} probes)"
+                )
+            password_hasher.workers = pool_workers
+            password_hasher.shutdown()
+
+    app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+"""Compare one-by-one registration with bulk provisioning.
+
+Run from the project root against the test database:
+
+    python -m benchmarks.provision_users
+"""
+
+import asyncio
+import os
+import time
+
+from sqlalchemy import delete
+
+from app.models.user import User
+from app.repositories import RepositoryFactory
+from app.schemas.user import UserCreate
+from app.services.provisioning_service import ProvisioningService
+from app.services.user_service import UserService
+from benchmarks.common import SessionLocal, fresh_database, request_session
+
+REGISTERED = 100
+PROVISIONED = 5_000
+BATCH_SIZE = 1_000
+
+
+async def generated_rows(count: int):
+    for number in range(count):
+        yield number + 1, {
+            "username": f"bulk{number}",
+            "email": f"bulk{number}@example.com",
+            "password": f"password{number}",
+        }
+
+
+async def main() -> None:
+    async with fresh_database():
+        started = time.perf_counter()
+        for number in range(REGISTERED):
+            async with request_session() as session:
+                await UserService(RepositoryFactory(session)).register_user(
+                    UserCreate(
+                        username=f"user{number}",
+                        email=f"user{number}@example.com",
+                        password=f"password{number}",
+                    )
+                )
+        rate = REGISTERED / (time.perf_counter() - started)
+        print(f"register_user: {rate:8.1f} users/s")
+
+        for workers in sorted({1, os.cpu_count()}):
+            started = time.perf_counter()
+            result = await ProvisioningService(SessionLocal).provision(
+                generated_rows(PROVISIONED), batch_size=BATCH_SIZE, workers=workers
+            )
+            elapsed = time.perf_counter() - started
+            rate = result["created"] / elapsed
+            print(
+                f"bulk, {workers:>2} workers: {rate:8.1f} users/s, "
+                f"~{100_000 / rate / 60:.0f} min per 100k"
+            )
+            async with request_session() as session:
+                await session.execute(delete(User).where(User.username.like("bulk%")))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
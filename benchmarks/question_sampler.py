@@ -0,0 +1,63 @@
+"""Benchmark `QuestionIndex.sample` against question banks of growing size.
+
+Run from the project root:
+
+    python -m benchmarks.question_sampler
+"""
+
+import random
+import statistics
+import time
+
+from app.indexes.questions import QuestionIndex
+from app.models.quiz import DifficultyLevel
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+CATEGORIES = 20
+ROUNDS = 2_000
+QUIZ_SIZE = 10
+
+
+def build_index(size: int) -> QuestionIndex:
+    difficulties = list(DifficultyLevel)
+    index = QuestionIndex()
+    index.rebuild(
+        (
+            question_id,
+            question_id % CATEGORIES + 1,
+            difficulties[question_id % len(difficulties)],
+        )
+        for question_id in range(1, size + 1)
+    )
+    return index
+
+
+def measure(index: QuestionIndex, **filters) -> tuple[float, float]:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        index.sample(QUIZ_SIZE, **filters)
+        timings.append((time.perf_counter() - started) * 1_000_000)
+    timings.sort()
+    return statistics.mean(timings), timings[int(len(timings) * 0.99)]
+
+
+def main() -> None:
+    random.seed(0)
+    print(f"{'questions':>10} {'filter':>20} {'mean, us':>10} {'p99, us':>10}")
+    for size in SIZES:
+        index = build_index(size)
+        for label, filters in [
+            ("none", {}),
+            ("category", {"category_id": 3}),
+            (
+                "category+difficulty",
+                {"category_id": 3, "difficulty": DifficultyLevel.HARD},
+            ),
+        ]:
+            mean, p99 = measure(index, **filters)
+            print(f"{size:>10} {label:>20} {mean:>10.1f} {p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
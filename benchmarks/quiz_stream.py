@@ -0,0 +1,107 @@
+"""Load test `/quiz/ws` with many concurrent local clients.
+
+Starts the app in-process on a local port against the test database and
+plays a quiz on every connection at once. Run from the project root:
+
+    python -m benchmarks.quiz_stream [connections]
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+
+import uvicorn
+from websockets.asyncio.client import connect
+
+from app.core.security import create_access_token
+from app.database import get_db, get_session_factory
+from app.main import app
+from app.models.user import User
+from benchmarks.common import SessionLocal, fresh_database, seed_question_bank
+
+HOST = "127.0.0.1"
+PORT = 8765
+CONNECTIONS = 1_000
+QUESTIONS = 1_000
+QUIZ_SIZE = 10
+
+
+async def create_players(count: int) -> list[str]:
+    """Create `count` users and return a bearer token for each."""
+    async with SessionLocal() as session:
+        session.add_all(
+            User(
+                username=f"player{number}",
+                email=f"player{number}@example.com",
+                hashed_password="not-a-real-hash",
+                total_score=0,
+                games_played=0,
+            )
+            for number in range(count)
+        )
+        await session.commit()
+    return [create_access_token({"sub": f"player{number}"}) for number in range(count)]
+
+
+async def play(token: str, latencies: list[float]) -> int:
+    """Answer every question with the first option and return the score."""
+    url = f"ws://{HOST}:{PORT}/api/v1/quiz/ws?token={token}&num_questions={QUIZ_SIZE}"
+    async with connect(url, max_queue=1) as websocket:
+        async for raw in websocket:
+            message = json.loads(raw)
+            if message["type"] == "question":
+                sent_at = time.perf_counter()
+                answer_id = message["question"]["answers"][0]["id"]
+                await websocket.send(json.dumps({"answer_id": answer_id}))
+            elif message["type"] == "result":
+                latencies.append(time.perf_counter() - sent_at)
+            elif message["type"] == "summary":
+                return message["score"]
+    return 0
+
+
+async def main(connections: int) -> None:
+    async def override_get_db():
+        async with SessionLocal() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: SessionLocal
+
+    async with fresh_database():
+        await seed_question_bank(QUESTIONS)
+        tokens = await create_players(connections)
+
+        server = uvicorn.Server(
+            uvicorn.Config(app, host=HOST, port=PORT, log_level="warning")
+        )
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.05)
+
+        latencies: list[float] = []
+        started = time.perf_counter()
+        scores = await asyncio.gather(
+            *(play(token, latencies) for token in tokens), return_exceptions=True
+        )
+        elapsed = time.perf_counter() - started
+
+        server.should_exit = True
+        await serving
+
+    failures = [score for score in scores if isinstance(score, BaseException)]
+    latencies.sort()
+    print(f"{connections} concurrent quizzes of {QUIZ_SIZE} questions")
+    print(f"  completed: {connections - len(failures)}, failed: {len(failures)}")
+    print(f"  wall time: {elapsed:.2f}s, {len(latencies) / elapsed:.0f} answers/s")
+    if latencies:
+        print(
+            f"  answer latency: p50 {statistics.median(latencies) * 1000:.1f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else CONNECTIONS))
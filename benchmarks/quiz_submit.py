@@ -0,0 +1,82 @@
+"""Compare quiz submit throughput of the per-answer and batched pipelines.
+
+Run from the project root against the test database:
+
+    python -m benchmarks.quiz_submit
+"""
+
+import asyncio
+import random
+
+from app.repositories import RepositoryFactory
+from app.schemas.quiz import QuizSubmit, UserAnswer
+from app.services.quiz_service import QuizService
+from benchmarks.common import (
+    create_user,
+    fresh_database,
+    request_session,
+    seed_question_bank,
+    throughput,
+)
+
+QUESTIONS = 1_000
+QUIZ_SIZE = 10
+ITERATIONS = 200
+
+
+async def per_answer_submit(
+    repo_factory: RepositoryFactory, user_id: int, quiz_submit: QuizSubmit
+) -> None:
+    """The previous pipeline: three round trips and a commit per answer."""
+    score = 0
+    for user_answer in quiz_submit.answers:
+        correct_answer = await repo_factory.questions.get_correct_answer(
+            user_answer.question_id
+        )
+        if not correct_answer:
+            continue
+        is_correct = user_answer.answer_id == correct_answer.id
+        score += is_correct
+        await repo_factory.questions.get(user_answer.question_id)
+        await repo_factory.user_responses.create(
+            user_id=user_id,
+            question_id=user_answer.question_id,
+            answer_id=user_answer.answer_id,
+            is_correct=is_correct,
+        )
+    await repo_factory.users.update_score(user_id, score)
+
+
+def random_submission(answer_key: list[tuple[int, int]]) -> QuizSubmit:
+    return QuizSubmit(
+        answers=[
+            UserAnswer(question_id=question_id, answer_id=answer_id)
+            for question_id, answer_id in random.sample(answer_key, QUIZ_SIZE)
+        ]
+    )
+
+
+async def main() -> None:
+    async with fresh_database():
+        answer_key = await seed_question_bank(QUESTIONS)
+        user_id = await create_user("benchmark")
+
+        async def before() -> None:
+            async with request_session() as session:
+                await per_answer_submit(
+                    RepositoryFactory(session), user_id, random_submission(answer_key)
+                )
+
+        async def after() -> None:
+            async with request_session() as session:
+                await QuizService(RepositoryFactory(session)).submit_quiz(
+                    user_id, random_submission(answer_key)
+                )
+
+        for label, operation in [("per-answer", before), ("batched", after)]:
+            rate = await throughput(operation, ITERATIONS)
+            print(f"{label:>12}: {rate:8.1f} submits/s ({QUIZ_SIZE} answers each)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
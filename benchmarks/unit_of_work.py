@@ -0,0 +1,100 @@
+"""Compare committing in every repository call with one commit per request.
+
+Runs the question create flow (a question and four answers) and the
+per-answer submit flow, each in sessions where repositories commit and in
+units of work. Run from the project root against the test database:
+
+    python -m benchmarks.unit_of_work
+"""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import UNIT_OF_WORK
+from app.models.quiz import DifficultyLevel
+from app.repositories import RepositoryFactory
+from app.schemas.answers import AnswerCreate
+from app.schemas.questions import QuestionCreate
+from app.schemas.quiz import QuizSubmit, UserAnswer
+from benchmarks.common import (
+    create_user,
+    fresh_database,
+    request_session,
+    seed_question_bank,
+    throughput,
+)
+from benchmarks.quiz_submit import per_answer_submit
+
+QUESTIONS = 1_000
+QUIZ_SIZE = 10
+ITERATIONS = 200
+
+
+@asynccontextmanager
+async def session(unit_of_work: bool) -> AsyncIterator[AsyncSession]:
+    async with request_session() as db_session:
+        db_session.info[UNIT_OF_WORK] = unit_of_work
+        yield db_session
+
+
+async def create_question(repo_factory: RepositoryFactory, category_id: int) -> None:
+    question = await repo_factory.questions.create(
+        QuestionCreate(
+            question_text="Which one?",
+            difficulty=DifficultyLevel.EASY,
+            explanation="Because.",
+            category=category_id,
+        )
+    )
+    for option in range(4):
+        await repo_factory.answers.create(
+            AnswerCreate(
+                answer_text=f"Answer {option}",
+                is_correct=option == 0,
+                question_id=question.id,
+            )
+        )
+
+
+async def main() -> None:
+    async with fresh_database():
+        answer_key = await seed_question_bank(QUESTIONS)
+        user_id = await create_user("benchmark")
+        async with request_session() as db_session:
+            category_id = (await RepositoryFactory(db_session).categories.get(1)).id
+
+        for unit_of_work in (False, True):
+            label = "unit of work" if unit_of_work else "commit per call"
+
+            async def create() -> None:
+                async with session(unit_of_work) as db_session:
+                    await create_question(RepositoryFactory(db_session), category_id)
+
+            async def submit() -> None:
+                quiz_submit = QuizSubmit(
+                    answers=[
+                        UserAnswer(question_id=question_id, answer_id=answer_id)
+                        for question_id, answer_id in random.sample(
+                            answer_key, QUIZ_SIZE
+                        )
+                    ]
+                )
+                async with session(unit_of_work) as db_session:
+                    await per_answer_submit(
+                        RepositoryFactory(db_session), user_id, quiz_submit
+                    )
+
+            create_rate = await throughput(create, ITERATIONS)
+            submit_rate = await throughput(submit, ITERATIONS)
+            print(
+                f"{label:>15}: {create_rate:7.1f} question creates/s, "
+                f"{submit_rate:7.1f} submits/s ({QUIZ_SIZE} answers each)"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())